@@ -69,10 +69,9 @@ def get_resolved_model_id(model_name: str) -> str:
 def supports_prompt_caching(model_name: str) -> bool:
     try:
         from core.ai_models.registry import registry
-        from core.ai_models.models import ModelCapability
         
         model = registry.get(model_name)
-        if model and ModelCapability.PROMPT_CACHING in model.capabilities:
+        if model and model.supports_caching:
             logger.debug(f"Model '{model_name}' supports prompt caching")
             return True
         
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Iterable, Sequence, Union, TYPE_CHECKING
 from enum import Enum
 
 if TYPE_CHECKING:
@@ -27,8 +27,22 @@ class ModelCapability(Enum):
     VISION = "vision"
     THINKING = "thinking"
     PROMPT_CACHING = "prompt_caching"
+    
+    @property
+    def bit(self) -> int:
+        return _CAPABILITY_BITS[self]
 
-@dataclass
+_CAPABILITY_BITS: Dict[ModelCapability, int] = {
+    cap: 1 << i for i, cap in enumerate(ModelCapability)
+}
+
+def capability_mask(capabilities: Iterable[ModelCapability]) -> int:
+    mask = 0
+    for cap in capabilities:
+        mask |= _CAPABILITY_BITS[cap]
+    return mask
+
+@dataclass(slots=True, frozen=True)
 class ModelPricing:
     input_cost_per_million_tokens: float
     output_cost_per_million_tokens: float
@@ -67,7 +81,7 @@ class ReasoningSettings:
     enabled: bool = False
     split_output: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     api_base: Optional[str] = None
     api_version: Optional[str] = None
@@ -82,7 +96,7 @@ class ModelConfig:
     extra_body: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     id: str
     name: str
@@ -90,36 +104,43 @@ class Model:
     litellm_model_id: Optional[str] = None
     aliases: List[str] = field(default_factory=list)
     context_window: int = 128_000
-    capabilities: List[ModelCapability] = field(default_factory=list)
+    capabilities: Sequence[ModelCapability] = ()
     pricing: Optional[ModelPricing] = None
     enabled: bool = True
-    tier_availability: List[str] = field(default_factory=lambda: ["paid"])
+    tier_availability: Sequence[str] = ("paid",)
     priority: int = 0
     recommended: bool = False
     config: Optional[ModelConfig] = None
+    # Bitmask of `capabilities`, precomputed so capability filters are a single AND
+    capability_mask: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.litellm_model_id is None:
             self.litellm_model_id = self.id
         
         if ModelCapability.CHAT not in self.capabilities:
-            self.capabilities.insert(0, ModelCapability.CHAT)
+            self.capabilities = (ModelCapability.CHAT, *self.capabilities)
+        
+        self.capability_mask = capability_mask(self.capabilities)
+    
+    def has_capabilities(self, mask: int) -> bool:
+        return self.capability_mask & mask == mask
     
     @property
     def supports_thinking(self) -> bool:
-        return ModelCapability.THINKING in self.capabilities
+        return bool(self.capability_mask & ModelCapability.THINKING.bit)
     
     @property
     def supports_functions(self) -> bool:
-        return ModelCapability.FUNCTION_CALLING in self.capabilities
+        return bool(self.capability_mask & ModelCapability.FUNCTION_CALLING.bit)
     
     @property
     def supports_vision(self) -> bool:
-        return ModelCapability.VISION in self.capabilities
+        return bool(self.capability_mask & ModelCapability.VISION.bit)
     
     @property
     def supports_caching(self) -> bool:
-        return ModelCapability.PROMPT_CACHING in self.capabilities
+        return bool(self.capability_mask & ModelCapability.PROMPT_CACHING.bit)
     
     @property
     def is_free_tier(self) -> bool:
@@ -1,3 +1,5 @@
+import importlib
+
 from .base import ProviderConfig, ProviderCapability
 from .anthropic import AnthropicProvider
 from .minimax import MiniMaxProvider
@@ -10,4 +12,22 @@ __all__ = [
     'MiniMaxProvider',
     'provider_registry',
     'get_provider_for_model',
+    'DashScopeConfig',
+    'OllamaConfig',
+    'ZhipuAIConfig',
 ]
+
+# China-friendly provider configs are only imported when first accessed
+_LAZY = {
+    'DashScopeConfig': '.dashscope',
+    'OllamaConfig': '.ollama',
+    'ZhipuAIConfig': '.zhipu',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __package__), name)
+    globals()[name] = value
+    return value
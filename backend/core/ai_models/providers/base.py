@@ -1,8 +1,23 @@
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
+from ..models import Model
+
+
+@lru_cache(maxsize=None)
+def getenv_cached(key: str, default: Optional[str] = None) -> Optional[str]:
+    """os.getenv() memoized per key; call clear_env_cache() after changing the environment."""
+    return os.getenv(key, default)
+
+
+def clear_env_cache() -> None:
+    getenv_cached.cache_clear()
+
+
 class ProviderCapability(Enum):
     PROMPT_CACHING = "prompt_caching"
     REASONING_MODE = "reasoning_mode"
@@ -68,3 +83,41 @@ class ProviderConfig(ABC):
     
     def process_response_chunk(self, chunk: Any) -> Dict[str, Any]:
         return {"chunk": chunk, "reasoning_content": None}
+
+
+class StaticModelCatalog(ABC):
+    """
+    Mixin for providers whose model list is static configuration.
+    
+    Subclasses implement _build_models(); the result is built once per class
+    and indexed by id and alias for O(1) lookups.
+    """
+    
+    _cached_models: Optional[List[Model]] = None
+    _models_by_id: Optional[Dict[str, Model]] = None
+    _models_by_alias: Optional[Dict[str, Model]] = None
+    
+    @classmethod
+    @abstractmethod
+    def _build_models(cls) -> List[Model]:
+        pass
+    
+    @classmethod
+    def _ensure_models(cls) -> List[Model]:
+        if cls._cached_models is None:
+            models = cls._build_models()
+            cls._models_by_id = {m.id: m for m in models}
+            cls._models_by_alias = {alias: m for m in models for alias in m.aliases}
+            cls._cached_models = models
+        return cls._cached_models
+    
+    @classmethod
+    def get_models(cls) -> List[Model]:
+        """Return the (cached) model catalog for this provider."""
+        return list(cls._ensure_models())
+    
+    @classmethod
+    def get_model(cls, model_id: str) -> Optional[Model]:
+        """Look up a model by id or alias."""
+        cls._ensure_models()
+        return cls._models_by_id.get(model_id) or cls._models_by_alias.get(model_id)
@@ -7,12 +7,101 @@ No VPN required, fast response times in China.
 Official docs: https://help.aliyun.com/zh/dashscope/
 """
 
+from __future__ import annotations
+
+import sys
 from typing import List, Optional
 from ..models import Model, ModelProvider, ModelCapability, ModelPricing, ModelConfig
-from .base import ProviderConfig
+from .base import ProviderConfig, StaticModelCatalog, getenv_cached
+
+
+# Tier names shared by the model rows
+_FREE = sys.intern("free")
+_PAID = sys.intern("paid")
+
+# Capability and tier tuples are immutable, so rows share them by reference
+_CHAT = (ModelCapability.CHAT,)
+_CHAT_FC = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING)
+_CHAT_FC_VISION = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.VISION)
+_PAID_ONLY = (_PAID,)
+_FREE_AND_PAID = (_FREE, _PAID)
 
+# Static catalog of Qwen models served by DashScope. Rows are plain literals;
+# DashScopeConfig._build_models() turns them into Model instances.
+_MODEL_TABLE = (
+    # Qwen-Max - Flagship model
+    {
+        "id": "qwen-max",
+        "name": "Qwen Max",
+        "litellm_model_id": "dashscope/qwen-max",
+        "context_window": 30_000,
+        "capabilities": _CHAT_FC_VISION,
+        "pricing": (20.0, 60.0),  # ¥20 / ¥60 per 1M tokens
+        "tier_availability": _PAID_ONLY,
+        "recommended": True,
+        "priority": 100,
+    },
+    # Qwen-Plus - Recommended for most use cases
+    {
+        "id": "qwen-plus",
+        "name": "Qwen Plus",
+        "litellm_model_id": "dashscope/qwen-plus",
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC_VISION,
+        "pricing": (4.0, 12.0),  # ¥4 / ¥12 per 1M tokens
+        "tier_availability": _FREE_AND_PAID,
+        "recommended": True,
+        "priority": 90,
+    },
+    # Qwen-Turbo - Fast and economical
+    {
+        "id": "qwen-turbo",
+        "name": "Qwen Turbo",
+        "litellm_model_id": "dashscope/qwen-turbo",
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC,
+        "pricing": (2.0, 6.0),  # ¥2 / ¥6 per 1M tokens
+        "tier_availability": _FREE_AND_PAID,
+        "recommended": True,
+        "priority": 80,
+    },
+    # Qwen-Long - Ultra-long context
+    {
+        "id": "qwen-long",
+        "name": "Qwen Long (1M context)",
+        "litellm_model_id": "dashscope/qwen-long",
+        "context_window": 1_000_000,
+        "capabilities": _CHAT,
+        "pricing": (0.5, 2.0),  # ¥0.5 / ¥2 per 1M tokens
+        "tier_availability": _PAID_ONLY,
+        "priority": 70,
+    },
+    # Qwen2.5-72B - Open source deployment option
+    {
+        "id": "qwen2.5-72b-instruct",
+        "name": "Qwen 2.5 72B",
+        "litellm_model_id": "dashscope/qwen2.5-72b-instruct",
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC,
+        "pricing": (3.0, 9.0),
+        "tier_availability": _PAID_ONLY,
+        "priority": 60,
+    },
+    # Qwen2.5-Coder - Specialized for coding
+    {
+        "id": "qwen2.5-coder-32b-instruct",
+        "name": "Qwen 2.5 Coder 32B",
+        "litellm_model_id": "dashscope/qwen2.5-coder-32b-instruct",
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC,
+        "pricing": (2.0, 6.0),
+        "tier_availability": _PAID_ONLY,
+        "priority": 85,
+    },
+)
 
-class DashScopeConfig(ProviderConfig):
+
+class DashScopeConfig(StaticModelCatalog, ProviderConfig):
     """Configuration for Aliyun DashScope (百炼) provider."""
     
     name = "DashScope"
@@ -45,7 +134,7 @@ class DashScopeConfig(ProviderConfig):
         return {}
     
     @classmethod
-    def get_models(cls) -> List[Model]:
+    def _build_models(cls) -> List[Model]:
         """
         Available Qwen models via DashScope.
         
@@ -56,148 +145,28 @@ class DashScopeConfig(ProviderConfig):
         - qwen-long: Ultra-long context (1M tokens)
         """
         return [
-            # Qwen-Max - Flagship model
-            Model(
-                id="qwen-max",
-                name="Qwen Max",
-                provider=ModelProvider.DASHSCOPE,
-                litellm_model_id="dashscope/qwen-max",
-                context_window=30_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                    ModelCapability.VISION,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=20.0,  # ¥20/1M tokens
-                    output_cost_per_million_tokens=60.0,  # ¥60/1M tokens
-                ),
-                tier_availability=["paid"],
-                recommended=True,
-                priority=100,
-                config=ModelConfig(
-                    api_base=cls.api_base,
-                ),
-            ),
-            
-            # Qwen-Plus - Recommended for most use cases
-            Model(
-                id="qwen-plus",
-                name="Qwen Plus",
-                provider=ModelProvider.DASHSCOPE,
-                litellm_model_id="dashscope/qwen-plus",
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                    ModelCapability.VISION,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=4.0,  # ¥4/1M tokens
-                    output_cost_per_million_tokens=12.0,  # ¥12/1M tokens
-                ),
-                tier_availability=["free", "paid"],
-                recommended=True,
-                priority=90,
-                config=ModelConfig(
-                    api_base=cls.api_base,
-                ),
-            ),
-            
-            # Qwen-Turbo - Fast and economical
-            Model(
-                id="qwen-turbo",
-                name="Qwen Turbo",
-                provider=ModelProvider.DASHSCOPE,
-                litellm_model_id="dashscope/qwen-turbo",
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=2.0,  # ¥2/1M tokens
-                    output_cost_per_million_tokens=6.0,  # ¥6/1M tokens
-                ),
-                tier_availability=["free", "paid"],
-                recommended=True,
-                priority=80,
-                config=ModelConfig(
-                    api_base=cls.api_base,
-                ),
-            ),
-            
-            # Qwen-Long - Ultra-long context
-            Model(
-                id="qwen-long",
-                name="Qwen Long (1M context)",
-                provider=ModelProvider.DASHSCOPE,
-                litellm_model_id="dashscope/qwen-long",
-                context_window=1_000_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=0.5,  # ¥0.5/1M tokens
-                    output_cost_per_million_tokens=2.0,  # ¥2/1M tokens
-                ),
-                tier_availability=["paid"],
-                priority=70,
-                config=ModelConfig(
-                    api_base=cls.api_base,
-                ),
-            ),
-            
-            # Qwen2.5-72B - Open source deployment option
-            Model(
-                id="qwen2.5-72b-instruct",
-                name="Qwen 2.5 72B",
-                provider=ModelProvider.DASHSCOPE,
-                litellm_model_id="dashscope/qwen2.5-72b-instruct",
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=3.0,
-                    output_cost_per_million_tokens=9.0,
-                ),
-                tier_availability=["paid"],
-                priority=60,
-                config=ModelConfig(
-                    api_base=cls.api_base,
-                ),
-            ),
-            
-            # Qwen2.5-Coder - Specialized for coding
-            Model(
-                id="qwen2.5-coder-32b-instruct",
-                name="Qwen 2.5 Coder 32B",
-                provider=ModelProvider.DASHSCOPE,
-                litellm_model_id="dashscope/qwen2.5-coder-32b-instruct",
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=2.0,
-                    output_cost_per_million_tokens=6.0,
-                ),
-                tier_availability=["paid"],
-                priority=85,
-                config=ModelConfig(
-                    api_base=cls.api_base,
-                ),
-            ),
+            Model(**{
+                **row,
+                "id": sys.intern(row["id"]),
+                "litellm_model_id": sys.intern(row["litellm_model_id"]),
+                "provider": ModelProvider.DASHSCOPE,
+                "pricing": ModelPricing(*row["pricing"]),
+                # One ModelConfig per model: it is mutable, so a shared
+                # instance would let a change to one model leak into all
+                "config": ModelConfig(api_base=cls.api_base),
+            })
+            for row in _MODEL_TABLE
         ]
     
     @classmethod
     def is_configured(cls) -> bool:
         """Check if DashScope API key is configured."""
-        import os
-        return bool(os.getenv(cls.api_key_env))
+        return bool(getenv_cached(cls.api_key_env))
+    
+    @classmethod
+    async def is_configured_async(cls) -> bool:
+        """Async counterpart of is_configured() so providers can be probed together."""
+        return cls.is_configured()
     
     @classmethod
     def get_setup_instructions(cls) -> str:
@@ -7,12 +7,136 @@ Perfect for privacy, offline usage, and development.
 Official docs: https://ollama.ai/
 """
 
-from typing import List, Optional
-from ..models import Model, ModelProvider, ModelCapability, ModelPricing, ModelConfig
-from .base import ProviderConfig
+from __future__ import annotations
 
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from ..models import Model, ModelProvider, ModelCapability, ModelPricing
+from .base import ProviderConfig, StaticModelCatalog, getenv_cached
 
-class OllamaConfig(ProviderConfig):
+if TYPE_CHECKING:
+    import requests
+
+# Availability probes hit the network, so the result is reused for a short window.
+_CONFIGURED_TTL_SECONDS = 30.0
+_configured_cache: Tuple[bool, float] = (False, 0.0)
+_configured_lock = threading.Lock()
+
+
+def _get_cached_configured() -> Optional[bool]:
+    """Return the cached probe result, or None if it has expired."""
+    configured, checked_at = _configured_cache
+    if checked_at and time.monotonic() - checked_at < _CONFIGURED_TTL_SECONDS:
+        return configured
+    return None
+
+
+# Keep-alive session for the sync probe; `requests` is imported on first use
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+    return _session
+
+
+# Tier name shared by every model row
+_FREE = sys.intern("free")
+
+# Capability and tier tuples are immutable, so rows share them by reference
+_CHAT = (ModelCapability.CHAT,)
+_CHAT_FC = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING)
+_FREE_ONLY = (_FREE,)
+
+# Local models cost nothing; every row shares one immutable pricing object
+_FREE_PRICING = ModelPricing(0.0, 0.0)
+
+# Static catalog of popular Ollama models. Rows are plain literals;
+# OllamaConfig._build_models() turns them into Model instances.
+_MODEL_TABLE = (
+    # Qwen 2.5 - Alibaba's open source models
+    {
+        "id": "qwen2.5:7b",
+        "name": "Qwen 2.5 (7B)",
+        "litellm_model_id": "ollama/qwen2.5:7b",
+        "aliases": ("qwen2.5",),
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC,
+        "tier_availability": _FREE_ONLY,
+        "recommended": True,
+        "priority": 100,
+    },
+    {
+        "id": "qwen2.5:14b",
+        "name": "Qwen 2.5 (14B)",
+        "litellm_model_id": "ollama/qwen2.5:14b",
+        "aliases": (),
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC,
+        "tier_availability": _FREE_ONLY,
+        "recommended": True,
+        "priority": 95,
+    },
+    # Llama 3.1 - Meta's latest
+    {
+        "id": "llama3.1:8b",
+        "name": "Llama 3.1 (8B)",
+        "litellm_model_id": "ollama/llama3.1:8b",
+        "aliases": ("llama3.1",),
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC,
+        "tier_availability": _FREE_ONLY,
+        "recommended": True,
+        "priority": 90,
+    },
+    # DeepSeek Coder - Best for coding
+    {
+        "id": "deepseek-coder:6.7b",
+        "name": "DeepSeek Coder (6.7B)",
+        "litellm_model_id": "ollama/deepseek-coder:6.7b",
+        "aliases": ("deepseek-coder",),
+        "context_window": 16_000,
+        "capabilities": _CHAT,
+        "tier_availability": _FREE_ONLY,
+        "priority": 85,
+    },
+    # Mistral
+    {
+        "id": "mistral:7b",
+        "name": "Mistral (7B)",
+        "litellm_model_id": "ollama/mistral:7b",
+        "aliases": ("mistral",),
+        "context_window": 32_000,
+        "capabilities": _CHAT,
+        "tier_availability": _FREE_ONLY,
+        "priority": 80,
+    },
+    # Phi-3 - Microsoft's small model
+    {
+        "id": "phi3:mini",
+        "name": "Phi-3 Mini (3.8B)",
+        "litellm_model_id": "ollama/phi3:mini",
+        "aliases": ("phi3",),
+        "context_window": 128_000,
+        "capabilities": _CHAT,
+        "tier_availability": _FREE_ONLY,
+        "priority": 75,
+    },
+)
+
+
+class OllamaConfig(StaticModelCatalog, ProviderConfig):
     """Configuration for Ollama local LLM provider."""
     
     name = "Ollama"
@@ -46,147 +170,91 @@ class OllamaConfig(ProviderConfig):
         return {}
     
     @classmethod
-    def get_models(cls) -> List[Model]:
+    def _build_models(cls) -> List[Model]:
         """
         Popular Ollama models.
         
         Users can run any model from https://ollama.ai/library
         """
         return [
-            # Qwen 2.5 - Alibaba's open source models
-            Model(
-                id="qwen2.5:7b",
-                name="Qwen 2.5 (7B)",
-                provider=ModelProvider.OLLAMA,
-                litellm_model_id="ollama/qwen2.5:7b",
-                aliases=["qwen2.5"],
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=0.0,  # Free local
-                    output_cost_per_million_tokens=0.0,
-                ),
-                tier_availability=["free"],
-                recommended=True,
-                priority=100,
-            ),
-            
-            Model(
-                id="qwen2.5:14b",
-                name="Qwen 2.5 (14B)",
-                provider=ModelProvider.OLLAMA,
-                litellm_model_id="ollama/qwen2.5:14b",
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=0.0,
-                    output_cost_per_million_tokens=0.0,
-                ),
-                tier_availability=["free"],
-                recommended=True,
-                priority=95,
-            ),
-            
-            # Llama 3.1 - Meta's latest
-            Model(
-                id="llama3.1:8b",
-                name="Llama 3.1 (8B)",
-                provider=ModelProvider.OLLAMA,
-                litellm_model_id="ollama/llama3.1:8b",
-                aliases=["llama3.1"],
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=0.0,
-                    output_cost_per_million_tokens=0.0,
-                ),
-                tier_availability=["free"],
-                recommended=True,
-                priority=90,
-            ),
-            
-            # DeepSeek Coder - Best for coding
-            Model(
-                id="deepseek-coder:6.7b",
-                name="DeepSeek Coder (6.7B)",
-                provider=ModelProvider.OLLAMA,
-                litellm_model_id="ollama/deepseek-coder:6.7b",
-                aliases=["deepseek-coder"],
-                context_window=16_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=0.0,
-                    output_cost_per_million_tokens=0.0,
-                ),
-                tier_availability=["free"],
-                priority=85,
-            ),
-            
-            # Mistral
-            Model(
-                id="mistral:7b",
-                name="Mistral (7B)",
-                provider=ModelProvider.OLLAMA,
-                litellm_model_id="ollama/mistral:7b",
-                aliases=["mistral"],
-                context_window=32_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=0.0,
-                    output_cost_per_million_tokens=0.0,
-                ),
-                tier_availability=["free"],
-                priority=80,
-            ),
-            
-            # Phi-3 - Microsoft's small model
-            Model(
-                id="phi3:mini",
-                name="Phi-3 Mini (3.8B)",
-                provider=ModelProvider.OLLAMA,
-                litellm_model_id="ollama/phi3:mini",
-                aliases=["phi3"],
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=0.0,
-                    output_cost_per_million_tokens=0.0,
-                ),
-                tier_availability=["free"],
-                priority=75,
-            ),
+            Model(**{
+                **row,
+                "id": sys.intern(row["id"]),
+                "litellm_model_id": sys.intern(row["litellm_model_id"]),
+                "provider": ModelProvider.OLLAMA,
+                "aliases": list(row["aliases"]),
+                "pricing": _FREE_PRICING,
+            })
+            for row in _MODEL_TABLE
         ]
     
+    @classmethod
+    def get_base_url(cls) -> str:
+        """Resolved Ollama base URL (env lookup is memoized, see clear_env_cache())."""
+        return getenv_cached(cls.api_base_env, cls.default_api_base)
+    
     @classmethod
     def is_configured(cls) -> bool:
-        """Check if Ollama is available."""
-        import os
-        import requests
+        """Check if Ollama is available (cached for a few seconds)."""
+        global _configured_cache
+        
+        cached = _get_cached_configured()
+        if cached is not None:
+            return cached
         
-        base_url = os.getenv(cls.api_base_env, cls.default_api_base)
+        with _configured_lock:
+            # Another thread may have refreshed the cache while we waited
+            cached = _get_cached_configured()
+            if cached is not None:
+                return cached
+            
+            configured = cls._probe()
+            _configured_cache = (configured, time.monotonic())
+            return configured
+    
+    @classmethod
+    async def is_configured_async(cls) -> bool:
+        """Non-blocking variant of is_configured() for use inside the event loop."""
+        global _configured_cache
+        
+        cached = _get_cached_configured()
+        if cached is not None:
+            return cached
+        
+        configured = await cls._probe_async()
+        _configured_cache = (configured, time.monotonic())
+        return configured
+    
+    @classmethod
+    def _probe(cls) -> bool:
+        """Hit the Ollama API once to see whether it is reachable."""
+        base_url = cls.get_base_url()
         
         try:
             # Try to connect to Ollama
-            response = requests.get(f"{base_url}/api/tags", timeout=2)
+            response = _get_session().get(f"{base_url}/api/tags", timeout=2)
             return response.status_code == 200
         except:
             return False
     
+    @classmethod
+    async def _probe_async(cls) -> bool:
+        """Async probe through the shared HTTP client."""
+        import httpx
+        from core.services.http_client import get_http_client
+        
+        base_url = cls.get_base_url()
+        
+        try:
+            async with get_http_client() as client:
+                response = await client.get(
+                    f"{base_url}/api/tags",
+                    timeout=httpx.Timeout(2.0, connect=0.5),
+                )
+            return response.status_code == 200
+        except Exception:
+            return False
+    
     @classmethod
     def get_setup_instructions(cls) -> str:
         """Return setup instructions for Ollama."""
@@ -1,4 +1,5 @@
-from typing import Dict, Optional, Type
+import importlib
+from typing import Dict, Optional, Tuple, Type
 from .base import ProviderConfig, ProviderCapability
 from .anthropic import AnthropicProvider, BedrockProvider
 from .minimax import MiniMaxProvider, OpenRouterProvider
@@ -9,6 +10,7 @@ class ProviderRegistry:
     def __init__(self):
         self._providers: Dict[str, ProviderConfig] = {}
         self._model_provider_map: Dict[str, str] = {}
+        self._lazy_providers: Dict[str, Tuple[str, str]] = {}
         self._initialize_default_providers()
     
     def _initialize_default_providers(self):
@@ -18,35 +20,38 @@ class ProviderRegistry:
         self.register("openrouter", OpenRouterProvider())
         self.register("minimax_openrouter", MiniMaxProvider(use_openrouter=True))
         
-        # China-friendly providers
-        try:
-            from .dashscope import DashScopeConfig
-            self.register("dashscope", DashScopeConfig())
-        except ImportError:
-            pass
-        
-        try:
-            from .ollama import OllamaConfig
-            self.register("ollama", OllamaConfig())
-        except ImportError:
-            pass
-        
-        try:
-            from .zhipu import ZhipuAIConfig
-            self.register("zhipu", ZhipuAIConfig())
-        except ImportError:
-            pass
+        # China-friendly providers, imported on first lookup
+        self.register_lazy("dashscope", ".dashscope", "DashScopeConfig")
+        self.register_lazy("ollama", ".ollama", "OllamaConfig")
+        self.register_lazy("zhipu", ".zhipu", "ZhipuAIConfig")
     
     def register(self, name: str, provider: ProviderConfig):
+        self._lazy_providers.pop(name, None)
+        self._providers[name] = provider
+    
+    def register_lazy(self, name: str, module_name: str, class_name: str):
+        self._lazy_providers[name] = (module_name, class_name)
+    
+    def _load_lazy(self, name: str) -> Optional[ProviderConfig]:
+        module_name, class_name = self._lazy_providers.pop(name)
+        try:
+            module = importlib.import_module(module_name, __package__)
+        except ImportError:
+            return None
+        provider = getattr(module, class_name)()
         self._providers[name] = provider
+        return provider
     
     def get(self, name: str) -> Optional[ProviderConfig]:
-        return self._providers.get(name)
+        provider = self._providers.get(name)
+        if provider is None and name in self._lazy_providers:
+            provider = self._load_lazy(name)
+        return provider
     
     def get_for_model(self, model_id: str) -> Optional[ProviderConfig]:
         if model_id in self._model_provider_map:
             provider_name = self._model_provider_map[model_id]
-            return self._providers.get(provider_name)
+            return self.get(provider_name)
         
         provider = self._detect_provider_from_model_id(model_id)
         if provider:
@@ -58,28 +63,28 @@ class ProviderRegistry:
         model_lower = model_id.lower()
         
         if "bedrock" in model_lower or "arn:aws:bedrock" in model_lower:
-            return self._providers.get("bedrock")
+            return self.get("bedrock")
         
         if model_lower.startswith("openrouter/"):
             if "minimax" in model_lower:
-                return self._providers.get("minimax_openrouter")
-            return self._providers.get("openrouter")
+                return self.get("minimax_openrouter")
+            return self.get("openrouter")
         
         if model_lower.startswith("anthropic/") or "claude" in model_lower:
-            return self._providers.get("anthropic")
+            return self.get("anthropic")
         
         if model_lower.startswith("minimax/"):
-            return self._providers.get("minimax")
+            return self.get("minimax")
         
         # China-friendly providers
         if model_lower.startswith("dashscope/") or "qwen" in model_lower:
-            return self._providers.get("dashscope")
+            return self.get("dashscope")
         
         if model_lower.startswith("ollama/"):
-            return self._providers.get("ollama")
+            return self.get("ollama")
         
         if model_lower.startswith("zhipu/") or "glm" in model_lower:
-            return self._providers.get("zhipu")
+            return self.get("zhipu")
         
         return None
     
@@ -87,6 +92,8 @@ class ProviderRegistry:
         self._model_provider_map[model_id] = provider_name
     
     def get_all(self) -> Dict[str, ProviderConfig]:
+        for name in list(self._lazy_providers):
+            self._load_lazy(name)
         return self._providers.copy()
     
     def supports_capability(self, provider_name: str, capability: ProviderCapability) -> bool:
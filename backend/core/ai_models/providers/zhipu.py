@@ -6,12 +6,67 @@ Zhipu AI's GLM models are popular Chinese LLMs.
 Official docs: https://open.bigmodel.cn/
 """
 
+from __future__ import annotations
+
+import sys
 from typing import List
-from ..models import Model, ModelProvider, ModelCapability, ModelPricing, ModelConfig
-from .base import ProviderConfig
+from ..models import Model, ModelProvider, ModelCapability, ModelPricing
+from .base import ProviderConfig, StaticModelCatalog, getenv_cached
+
+
+# Tier names shared by the model rows
+_FREE = sys.intern("free")
+_PAID = sys.intern("paid")
+
+# Capability and tier tuples are immutable, so rows share them by reference
+_CHAT_FC = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING)
+_CHAT_VISION = (ModelCapability.CHAT, ModelCapability.VISION)
+_CHAT_FC_VISION = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.VISION)
+_PAID_ONLY = (_PAID,)
+_FREE_AND_PAID = (_FREE, _PAID)
 
+# Static catalog of GLM models. Rows are plain literals;
+# ZhipuAIConfig._build_models() turns them into Model instances.
+_MODEL_TABLE = (
+    # GLM-4 - Flagship model
+    {
+        "id": "glm-4",
+        "name": "GLM-4",
+        "litellm_model_id": "zhipu/glm-4",
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC_VISION,
+        "pricing": (100.0, 100.0),  # ¥100/1M tokens
+        "tier_availability": _PAID_ONLY,
+        "recommended": True,
+        "priority": 100,
+    },
+    # GLM-4 Flash - Fast and economical
+    {
+        "id": "glm-4-flash",
+        "name": "GLM-4 Flash",
+        "litellm_model_id": "zhipu/glm-4-flash",
+        "context_window": 128_000,
+        "capabilities": _CHAT_FC,
+        "pricing": (1.0, 1.0),  # ¥1/1M tokens
+        "tier_availability": _FREE_AND_PAID,
+        "recommended": True,
+        "priority": 90,
+    },
+    # GLM-4V - Vision model
+    {
+        "id": "glm-4v",
+        "name": "GLM-4V (Vision)",
+        "litellm_model_id": "zhipu/glm-4v",
+        "context_window": 8_000,
+        "capabilities": _CHAT_VISION,
+        "pricing": (50.0, 50.0),
+        "tier_availability": _PAID_ONLY,
+        "priority": 85,
+    },
+)
 
-class ZhipuAIConfig(ProviderConfig):
+
+class ZhipuAIConfig(StaticModelCatalog, ProviderConfig):
     """Configuration for Zhipu AI (智谱AI) provider."""
     
     name = "ZhipuAI"
@@ -45,75 +100,28 @@ class ZhipuAIConfig(ProviderConfig):
         return {}
     
     @classmethod
-    def get_models(cls) -> List[Model]:
+    def _build_models(cls) -> List[Model]:
         """Available GLM models."""
         return [
-            # GLM-4 - Flagship model
-            Model(
-                id="glm-4",
-                name="GLM-4",
-                provider=ModelProvider.ZHIPU,
-                litellm_model_id="zhipu/glm-4",
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                    ModelCapability.VISION,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=100.0,  # ¥100/1M tokens
-                    output_cost_per_million_tokens=100.0,
-                ),
-                tier_availability=["paid"],
-                recommended=True,
-                priority=100,
-            ),
-            
-            # GLM-4 Flash - Fast and economical
-            Model(
-                id="glm-4-flash",
-                name="GLM-4 Flash",
-                provider=ModelProvider.ZHIPU,
-                litellm_model_id="zhipu/glm-4-flash",
-                context_window=128_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.FUNCTION_CALLING,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=1.0,  # ¥1/1M tokens
-                    output_cost_per_million_tokens=1.0,
-                ),
-                tier_availability=["free", "paid"],
-                recommended=True,
-                priority=90,
-            ),
-            
-            # GLM-4V - Vision model
-            Model(
-                id="glm-4v",
-                name="GLM-4V (Vision)",
-                provider=ModelProvider.ZHIPU,
-                litellm_model_id="zhipu/glm-4v",
-                context_window=8_000,
-                capabilities=[
-                    ModelCapability.CHAT,
-                    ModelCapability.VISION,
-                ],
-                pricing=ModelPricing(
-                    input_cost_per_million_tokens=50.0,
-                    output_cost_per_million_tokens=50.0,
-                ),
-                tier_availability=["paid"],
-                priority=85,
-            ),
+            Model(**{
+                **row,
+                "id": sys.intern(row["id"]),
+                "litellm_model_id": sys.intern(row["litellm_model_id"]),
+                "provider": ModelProvider.ZHIPU,
+                "pricing": ModelPricing(*row["pricing"]),
+            })
+            for row in _MODEL_TABLE
         ]
     
     @classmethod
     def is_configured(cls) -> bool:
         """Check if Zhipu API key is configured."""
-        import os
-        return bool(os.getenv(cls.api_key_env))
+        return bool(getenv_cached(cls.api_key_env))
+    
+    @classmethod
+    async def is_configured_async(cls) -> bool:
+        """Async counterpart of is_configured() so providers can be probed together."""
+        return cls.is_configured()
     
     @classmethod
     def get_setup_instructions(cls) -> str:
@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Tuple, Any
-from .models import Model, ModelProvider, ModelCapability, ModelPricing, ModelConfig, ReasoningSettings
+from .models import Model, ModelProvider, ModelCapability, ModelPricing, ModelConfig, ReasoningSettings, capability_mask
 from .providers import provider_registry
 from .providers.anthropic import BedrockProvider
 from core.utils.config import config, EnvMode
@@ -789,7 +789,8 @@ class ModelRegistry:
     
     def get_by_capability(self, capability: ModelCapability, enabled_only: bool = True) -> List[Model]:
         models = self.get_all(enabled_only)
-        return [m for m in models if capability in m.capabilities]
+        bit = capability.bit
+        return [m for m in models if m.capability_mask & bit]
     
     def resolve_model_id(self, model_id: str) -> Optional[str]:
         resolved = self.get(model_id)
@@ -928,10 +929,8 @@ class ModelRegistry:
         models = self.get_by_tier(tier, enabled_only=True)
         
         if required_capabilities:
-            models = [
-                m for m in models
-                if all(cap in m.capabilities for cap in required_capabilities)
-            ]
+            required_mask = capability_mask(required_capabilities)
+            models = [m for m in models if m.has_capabilities(required_mask)]
         
         if min_context_window:
             models = [m for m in models if m.context_window >= min_context_window]
@@ -7,7 +7,7 @@ Provides abstraction layer for different authentication backends:
 - Aliyun/Tencent OAuth
 """
 
-from .adapter import AuthAdapter
+from .adapter import AuthAdapter, TokenCacheMixin, token_fingerprint
 from .factory import get_auth_adapter
 
-__all__ = ["AuthAdapter", "get_auth_adapter"]
+__all__ = ["AuthAdapter", "TokenCacheMixin", "get_auth_adapter", "token_fingerprint"]
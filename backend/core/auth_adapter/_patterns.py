@@ -0,0 +1,14 @@
+"""
+Precompiled validation patterns shared by auth adapter implementations.
+
+Use these instead of calling re.compile()/re.match(pattern, ...) inside
+request handlers, e.g. ``_patterns.E164.match(phone)``.
+"""
+
+import re
+
+# International phone number in E.164 format, e.g. +8613800138000
+E164 = re.compile(r"^\+[1-9]\d{7,14}$")
+
+# Loose email shape check; deliverability is verified by the email flow
+EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
@@ -1,5 +1,5 @@
 """
-Abstract authentication adapter interface for multi-cloud support.
+Authentication adapter interface (a typing.Protocol) for multi-cloud support.
 
 This adapter provides a unified interface for authentication operations:
 - User registration and login
@@ -9,13 +9,70 @@ This adapter provides a unified interface for authentication operations:
 - Password reset and email verification
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from __future__ import annotations
+
+import base64
+import copy
+import functools
+import hashlib
+import json
+import secrets
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Protocol, Set, Tuple, runtime_checkable
+from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
 
+# verify_token_cached() settings
+TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE_MAX_SIZE = 10_000
+
+# Methods TokenCacheMixin wraps, and the invalidation their first argument feeds
+_CACHE_INVALIDATING_METHODS = {
+    "sign_out": "invalidate_cached_token",
+    "update_password": "invalidate_cached_user",
+    "update_user": "invalidate_cached_user",
+    "delete_user": "invalidate_cached_user",
+}
+
+# Per-process key for token fingerprints that never leave this process
+_FINGERPRINT_KEY = secrets.token_bytes(32)
+
+
+def token_fingerprint(token: str, key: Optional[bytes] = None) -> bytes:
+    """
+    Keyed blake2b fingerprint of a token, for cache keys and revocation lists.
+    
+    Pass a stable ``key`` (derived from a server secret, at most 64 bytes)
+    when fingerprints are shared between processes, e.g. a revocation
+    list in Redis. Not suitable for password storage - use hash_password().
+    """
+    return hashlib.blake2b(
+        token.encode(),
+        key=_FINGERPRINT_KEY if key is None else key,
+        digest_size=16,
+    ).digest()
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """
+    ``exp`` claim of a JWT (seconds since the epoch), or None.
+    
+    The signature is not checked here; only call this for a token that
+    verify_token() has already accepted.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        exp = claims.get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
 class AuthProvider(str, Enum):
     """Authentication providers."""
     EMAIL = "email"
@@ -26,7 +83,7 @@ class AuthProvider(str, Enum):
     GITHUB = "github"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User object."""
     id: str
@@ -39,9 +96,19 @@ class User:
     created_at: Optional[datetime] = None
     last_sign_in_at: Optional[datetime] = None
     metadata: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_cached(cls, id: str, email: Optional[str] = None) -> User:
+        """
+        Build a User carrying only id/email.
+        
+        Meant for hot token-verification paths where the claims only carry
+        the identity; all other fields get their declared defaults.
+        """
+        return cls(id=id, email=email)
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Authentication session."""
     access_token: str
@@ -51,7 +118,7 @@ class Session:
     token_type: str = "Bearer"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OAuthConfig:
     """OAuth provider configuration."""
     provider: str
@@ -61,27 +128,150 @@ class OAuthConfig:
     scopes: List[str]
 
 
-class AuthAdapter(ABC):
+class TokenCacheMixin:
+    """
+    Token verification cache for AuthAdapter implementations.
+    
+    Mix in to get verify_token_cached(): valid tokens are remembered until
+    TOKEN_CACHE_TTL_SECONDS pass or the token's ``exp`` claim is reached,
+    whichever comes first, keyed by a digest of the token (raw tokens are
+    never stored); invalid tokens are not cached. Each hit returns a copy
+    of the cached User, so callers cannot change what others get.
+    
+    ``sign_out``, ``update_password``, ``update_user`` and ``delete_user``
+    defined on a subclass are wrapped to drop the token, or every cached
+    token of the user, so the change takes effect immediately. Call
+    invalidate_cached_token() / invalidate_cached_user() wherever else a
+    token is revoked or a user changes (e.g. reset_password_confirm()).
+    """
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, invalidate in _CACHE_INVALIDATING_METHODS.items():
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "_invalidates_token_cache", False):
+                setattr(cls, name, _invalidating(method, invalidate))
+    
+    async def verify_token_cached(
+        self,
+        token: str
+    ) -> Optional[User]:
+        """
+        Verify token, reusing recent successful verifications.
+        
+        Args:
+            token: Access token to verify
+            
+        Returns:
+            User if token is valid, None otherwise
+        """
+        cache = self._get_token_cache()
+        key = token_fingerprint(token)
+        now = time.monotonic()
+        
+        entry = cache.get(key)
+        if entry is not None:
+            user, expires_at = entry
+            if now < expires_at:
+                cache.move_to_end(key)
+                return copy.deepcopy(user)
+            self._drop_cached_token(key)
+        
+        user = await self.verify_token(token)
+        if user is None:
+            return None
+        
+        expires_at = now + TOKEN_CACHE_TTL_SECONDS
+        exp = _token_expiry(token)
+        if exp is not None:
+            expires_at = min(expires_at, now + (exp - time.time()))
+        
+        if expires_at > now:
+            cache[key] = (copy.deepcopy(user), expires_at)
+            self._get_user_token_index().setdefault(user.id, set()).add(key)
+            if len(cache) > TOKEN_CACHE_MAX_SIZE:
+                self._drop_cached_token(next(iter(cache)))
+        return user
+    
+    def invalidate_cached_token(self, token: str) -> None:
+        """Drop a token from the verification cache (e.g. on sign out)."""
+        self._drop_cached_token(token_fingerprint(token))
+    
+    def invalidate_cached_user(self, user_id: str) -> None:
+        """Drop every cached token of a user (e.g. on password change or deletion)."""
+        cache = self._get_token_cache()
+        for key in self._get_user_token_index().pop(user_id, ()):
+            cache.pop(key, None)
+    
+    def _drop_cached_token(self, key: bytes) -> None:
+        entry = self._get_token_cache().pop(key, None)
+        if entry is None:
+            return
+        index = self._get_user_token_index()
+        keys = index.get(entry[0].id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[entry[0].id]
+    
+    def _get_token_cache(self) -> OrderedDict[bytes, Tuple[User, float]]:
+        # Created lazily: implementations are not required to call a base __init__
+        cache = self.__dict__.get("_token_cache")
+        if cache is None:
+            cache = self._token_cache = OrderedDict()
+        return cache
+    
+    def _get_user_token_index(self) -> Dict[str, Set[bytes]]:
+        index = self.__dict__.get("_user_token_keys")
+        if index is None:
+            index = self._user_token_keys = {}
+        return index
+
+
+def _invalidating(method, invalidate: str):
+    """
+    Wrap an implementation method so its first argument leaves the cache.
+    
+    The entry is dropped before the call and again after it, in case a
+    concurrent verification cached it while the call was running.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, key: str, *args: Any, **kwargs: Any) -> Any:
+        getattr(self, invalidate)(key)
+        try:
+            return await method(self, key, *args, **kwargs)
+        finally:
+            getattr(self, invalidate)(key)
+    
+    wrapper._invalidates_token_cache = True
+    return wrapper
+
+
+@runtime_checkable
+class AuthAdapter(Protocol):
     """
-    Abstract base class for authentication adapters.
+    Structural interface for authentication adapters.
     
-    All auth providers must implement this interface.
+    All auth providers must implement this interface. Implementations are
+    matched structurally, so subclassing AuthAdapter is optional; a class
+    that does subclass it cannot be instantiated until every method is
+    implemented.
     """
     
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize authentication service."""
-        pass
+        ...
     
     @abstractmethod
     async def close(self) -> None:
         """Close authentication connections."""
-        pass
+        ...
     
     @abstractmethod
     async def health_check(self) -> Dict[str, Any]:
         """Check authentication service health."""
-        pass
+        ...
     
     # ==================== User Registration & Login ====================
     
@@ -95,6 +285,8 @@ class AuthAdapter(ABC):
         """
         Register a new user with email and password.
         
+        Validate the address with the precompiled ``_patterns.EMAIL``.
+        
         Args:
             email: User email
             password: User password (will be hashed)
@@ -103,7 +295,7 @@ class AuthAdapter(ABC):
         Returns:
             Session with access token and user info
         """
-        pass
+        ...
     
     @abstractmethod
     async def sign_up_with_phone(
@@ -116,6 +308,8 @@ class AuthAdapter(ABC):
         """
         Register a new user with phone number.
         
+        Validate the number with the precompiled ``_patterns.E164``.
+        
         Args:
             phone: Phone number (E.164 format)
             password: User password
@@ -125,7 +319,7 @@ class AuthAdapter(ABC):
         Returns:
             Session with access token and user info
         """
-        pass
+        ...
     
     @abstractmethod
     async def sign_in_with_email(
@@ -143,7 +337,7 @@ class AuthAdapter(ABC):
         Returns:
             Session with access token
         """
-        pass
+        ...
     
     @abstractmethod
     async def sign_in_with_phone(
@@ -161,7 +355,7 @@ class AuthAdapter(ABC):
         Returns:
             Session with access token
         """
-        pass
+        ...
     
     @abstractmethod
     async def sign_in_with_phone_otp(
@@ -179,7 +373,7 @@ class AuthAdapter(ABC):
         Returns:
             Session with access token
         """
-        pass
+        ...
     
     # ==================== OAuth ====================
     
@@ -199,7 +393,7 @@ class AuthAdapter(ABC):
         Returns:
             Authorization URL to redirect user to
         """
-        pass
+        ...
     
     @abstractmethod
     async def sign_in_with_oauth(
@@ -219,7 +413,7 @@ class AuthAdapter(ABC):
         Returns:
             Session with access token
         """
-        pass
+        ...
     
     # ==================== Token Management ====================
     
@@ -237,7 +431,7 @@ class AuthAdapter(ABC):
         Returns:
             User if token is valid, None otherwise
         """
-        pass
+        ...
     
     @abstractmethod
     async def refresh_session(
@@ -253,7 +447,7 @@ class AuthAdapter(ABC):
         Returns:
             New session with refreshed access token
         """
-        pass
+        ...
     
     @abstractmethod
     async def sign_out(
@@ -269,7 +463,7 @@ class AuthAdapter(ABC):
         Returns:
             True if successful
         """
-        pass
+        ...
     
     # ==================== User Management ====================
     
@@ -287,7 +481,7 @@ class AuthAdapter(ABC):
         Returns:
             User object or None
         """
-        pass
+        ...
     
     @abstractmethod
     async def get_user_by_email(
@@ -295,7 +489,7 @@ class AuthAdapter(ABC):
         email: str
     ) -> Optional[User]:
         """Get user by email."""
-        pass
+        ...
     
     @abstractmethod
     async def get_user_by_phone(
@@ -303,7 +497,7 @@ class AuthAdapter(ABC):
         phone: str
     ) -> Optional[User]:
         """Get user by phone number."""
-        pass
+        ...
     
     @abstractmethod
     async def update_user(
@@ -321,7 +515,7 @@ class AuthAdapter(ABC):
         Returns:
             Updated user object
         """
-        pass
+        ...
     
     @abstractmethod
     async def delete_user(
@@ -329,7 +523,7 @@ class AuthAdapter(ABC):
         user_id: str
     ) -> bool:
         """Delete user account."""
-        pass
+        ...
     
     # ==================== Password Management ====================
     
@@ -351,7 +545,7 @@ class AuthAdapter(ABC):
         Returns:
             True if successful
         """
-        pass
+        ...
     
     @abstractmethod
     async def reset_password_request(
@@ -367,7 +561,7 @@ class AuthAdapter(ABC):
         Returns:
             True if email sent
         """
-        pass
+        ...
     
     @abstractmethod
     async def reset_password_confirm(
@@ -385,7 +579,7 @@ class AuthAdapter(ABC):
         Returns:
             True if successful
         """
-        pass
+        ...
     
     # ==================== Verification ====================
     
@@ -395,7 +589,7 @@ class AuthAdapter(ABC):
         user_id: str
     ) -> bool:
         """Send email verification link."""
-        pass
+        ...
     
     @abstractmethod
     async def verify_email(
@@ -403,7 +597,7 @@ class AuthAdapter(ABC):
         token: str
     ) -> bool:
         """Verify email with token."""
-        pass
+        ...
     
     @abstractmethod
     async def send_phone_otp(
@@ -419,7 +613,7 @@ class AuthAdapter(ABC):
         Returns:
             True if SMS sent
         """
-        pass
+        ...
     
     @abstractmethod
     async def verify_phone(
@@ -437,7 +631,7 @@ class AuthAdapter(ABC):
         Returns:
             True if verified
         """
-        pass
+        ...
     
     # ==================== Utility ====================
     
@@ -446,8 +640,14 @@ class AuthAdapter(ABC):
         self,
         password: str
     ) -> str:
-        """Hash a password for storage."""
-        pass
+        """
+        Hash a password for storage.
+        
+        Use a deliberately slow KDF (Argon2id or bcrypt). Fast hashes such
+        as blake2b/SHA-256 are for token fingerprints only (see
+        token_fingerprint()), never for passwords.
+        """
+        ...
     
     @abstractmethod
     def verify_password(
@@ -456,7 +656,7 @@ class AuthAdapter(ABC):
         hashed: str
     ) -> bool:
         """Verify password against hash."""
-        pass
+        ...
     
     @abstractmethod
     def generate_token(
@@ -465,4 +665,4 @@ class AuthAdapter(ABC):
         expires_in: int = 3600
     ) -> str:
         """Generate JWT access token."""
-        pass
+        ...
@@ -8,12 +8,14 @@ Supports:
 
 from typing import Optional
 from enum import Enum
+from functools import lru_cache
+import asyncio
 import os
+import threading
 
 from core.utils.logger import logger
 from .adapter import AuthAdapter
 
-
 class AuthProvider(str, Enum):
     """Supported auth providers."""
     SUPABASE = "supabase"
@@ -21,12 +23,19 @@ class AuthProvider(str, Enum):
 
 
 _adapter_instance: Optional[AuthAdapter] = None
+_initialized_adapter: Optional[AuthAdapter] = None
+_adapter_lock = threading.Lock()
+_init_lock: Optional[asyncio.Lock] = None
 
 
+@lru_cache(maxsize=1)
 def get_auth_provider() -> AuthProvider:
     """
     Determine which auth provider to use.
     
+    The environment is read once per process; call
+    ``get_auth_provider.cache_clear()`` after changing it.
+    
     Priority:
     1. AUTH_PROVIDER env var
     2. CLOUD_PROVIDER env var
@@ -67,33 +76,57 @@ def get_auth_adapter(force_new: bool = False) -> AuthAdapter:
     if _adapter_instance is not None and not force_new:
         return _adapter_instance
     
-    provider = get_auth_provider()
-    logger.info(f"Initializing auth adapter for provider: {provider.value}")
-    
-    if provider == AuthProvider.SUPABASE:
-        from .adapters.supabase_auth import SupabaseAuthAdapter
-        _adapter_instance = SupabaseAuthAdapter()
-    elif provider == AuthProvider.JWT:
-        from .adapters.jwt_auth import JWTAuthAdapter
-        _adapter_instance = JWTAuthAdapter()
-    else:
-        raise ValueError(f"Unsupported auth provider: {provider}")
-    
-    return _adapter_instance
+    with _adapter_lock:
+        # Double-check after acquiring lock
+        if _adapter_instance is not None and not force_new:
+            return _adapter_instance
+        
+        if force_new:
+            get_auth_provider.cache_clear()
+        
+        provider = get_auth_provider()
+        logger.info(f"Initializing auth adapter for provider: {provider.value}")
+        
+        # Only the selected backend is imported; an ImportError (missing
+        # module or dependency) propagates
+        if provider == AuthProvider.SUPABASE:
+            from .adapters.supabase_auth import SupabaseAuthAdapter
+            _adapter_instance = SupabaseAuthAdapter()
+        elif provider == AuthProvider.JWT:
+            from .adapters.jwt_auth import JWTAuthAdapter
+            _adapter_instance = JWTAuthAdapter()
+        else:
+            raise ValueError(f"Unsupported auth provider: {provider}")
+        
+        return _adapter_instance
 
 
 async def initialize_auth() -> AuthAdapter:
-    """Initialize the auth adapter."""
+    """Initialize the auth adapter (at most once, even under concurrent startup)."""
+    global _init_lock, _initialized_adapter
+    
     adapter = get_auth_adapter()
-    await adapter.initialize()
-    logger.info(f"Auth adapter initialized: {type(adapter).__name__}")
+    if _initialized_adapter is adapter:
+        return adapter
+    
+    if _init_lock is None:
+        _init_lock = asyncio.Lock()
+    
+    async with _init_lock:
+        # Double-check after acquiring lock
+        if _initialized_adapter is not adapter:
+            await adapter.initialize()
+            _initialized_adapter = adapter
+            logger.info(f"Auth adapter initialized: {type(adapter).__name__}")
+    
     return adapter
 
 
 async def close_auth() -> None:
     """Close the auth adapter."""
-    global _adapter_instance
+    global _adapter_instance, _initialized_adapter
     if _adapter_instance:
         await _adapter_instance.close()
         _adapter_instance = None
+        _initialized_adapter = None
         logger.info("Auth adapter closed")
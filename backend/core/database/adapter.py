@@ -16,7 +16,7 @@ Key features abstracted:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, AsyncIterator, Callable
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable, Mapping, Sequence
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from enum import Enum
@@ -36,6 +36,13 @@ class DatabaseAdapter(ABC):
     
     All database providers must implement this interface to ensure
     consistent behavior across different cloud providers.
+    
+    Read methods return read-only rows (e.g. SQLAlchemy RowMapping, or
+    asyncpg Record on LocalAdapter) rather than dict copies. Every row
+    supports ``row["col"]``, ``row.get()``, ``keys()``/``values()``/
+    ``items()`` and ``dict(row)``; call ``dict(row)`` (or pass
+    ``as_dict=True`` where an adapter offers it) before mutating a row or
+    JSON-encoding it.
     """
     
     @abstractmethod
@@ -89,7 +96,7 @@ class DatabaseAdapter(ABC):
         query: str,
         params: Optional[Dict[str, Any]] = None,
         use_read_replica: bool = False
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Mapping[str, Any]]:
         """
         Execute a raw SQL query and return results.
         
@@ -99,7 +106,7 @@ class DatabaseAdapter(ABC):
             use_read_replica: Use read replica if available
             
         Returns:
-            List of rows as dictionaries
+            Read-only rows (see the class docstring)
         """
         pass
     
@@ -127,7 +134,7 @@ class DatabaseAdapter(ABC):
         table: str,
         data: Dict[str, Any],
         returning: Optional[List[str]] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Mapping[str, Any]]:
         """
         Insert a row into a table.
         
@@ -148,7 +155,7 @@ class DatabaseAdapter(ABC):
         data: Dict[str, Any],
         where: Dict[str, Any],
         returning: Optional[List[str]] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Mapping[str, Any]]:
         """
         Update rows in a table.
         
@@ -169,7 +176,7 @@ class DatabaseAdapter(ABC):
         table: str,
         where: Dict[str, Any],
         returning: Optional[List[str]] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Mapping[str, Any]]:
         """
         Delete rows from a table.
         
@@ -193,7 +200,7 @@ class DatabaseAdapter(ABC):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         use_read_replica: bool = True
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Mapping[str, Any]]:
         """
         Select rows from a table.
         
@@ -207,7 +214,7 @@ class DatabaseAdapter(ABC):
             use_read_replica: Use read replica if available
             
         Returns:
-            List of matching rows
+            Matching rows, read-only (see the class docstring)
         """
         pass
     
@@ -272,7 +279,7 @@ class DatabaseAdapter(ABC):
         pass
     
     @abstractmethod
-    async def get_table_schema(self, table: str) -> List[Dict[str, Any]]:
+    async def get_table_schema(self, table: str) -> Sequence[Mapping[str, Any]]:
         """
         Get schema information for a table.
         
@@ -1,13 +1,33 @@
 """Adapter implementations package."""
 
-from .supabase_adapter import SupabaseAdapter
-from .aliyun_adapter import AliyunAdapter
-from .tencent_adapter import TencentAdapter
-from .local_adapter import LocalAdapter
+import importlib
+
+# Adapters are imported on first attribute access, so importing one adapter
+# module (or this package) does not pull in another's client libraries
+_LAZY_ADAPTERS = {
+    "SupabaseAdapter": ".supabase_adapter",
+    "AliyunAdapter": ".aliyun_adapter",
+    "TencentAdapter": ".tencent_adapter",
+    "LocalAdapter": ".local_adapter",
+}
 
 __all__ = [
     "SupabaseAdapter",
-    "AliyunAdapter", 
+    "AliyunAdapter",
     "TencentAdapter",
     "LocalAdapter"
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    adapter_cls = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = adapter_cls
+    return adapter_cls
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
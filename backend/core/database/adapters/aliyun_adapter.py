@@ -12,19 +12,225 @@ Features:
 - Read replica support (if configured)
 """
 
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, NamedTuple, Set, Tuple, Union, AsyncIterator, Mapping
 from sqlalchemy import text, create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine, AsyncConnection
 from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
+from collections import defaultdict
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 import os
 import asyncio
+import json
+import time
 import uuid
 
 from ..adapter import DatabaseAdapter, RealtimeEvent
 from core.utils.logger import logger
 
 
+class AliyunRDSConfig(NamedTuple):
+    """Aliyun RDS connection settings read from the environment."""
+    host: Optional[str]
+    port: str
+    database: str
+    username: Optional[str]
+    password: Optional[str]
+    read_host: Optional[str]
+    kind: str
+    pool_size: int
+    max_overflow: int
+    schema_cache_ttl: float
+
+
+@lru_cache(maxsize=1)
+def _aliyun_config() -> AliyunRDSConfig:
+    """Read ALIYUN_RDS_* settings once per process."""
+    return AliyunRDSConfig(
+        host=os.getenv("ALIYUN_RDS_HOST"),
+        port=os.getenv("ALIYUN_RDS_PORT", "5432"),
+        database=os.getenv("ALIYUN_RDS_DATABASE", "kortix"),
+        username=os.getenv("ALIYUN_RDS_USERNAME"),
+        password=os.getenv("ALIYUN_RDS_PASSWORD"),
+        read_host=os.getenv("ALIYUN_RDS_READ_HOST"),
+        kind=os.getenv("ALIYUN_DB_KIND", "rds").lower(),
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_POOL_MAX_OVERFLOW", "20")),
+        schema_cache_ttl=float(os.getenv("DB_SCHEMA_CACHE_TTL_SECONDS", "300")),
+    )
+
+
+def _engine_options() -> Dict[str, Any]:
+    """Engine/pool keyword arguments shared by the primary and read engines."""
+    cfg = _aliyun_config()
+    options: Dict[str, Any] = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": cfg.pool_size,
+        "max_overflow": cfg.max_overflow,
+        "pool_timeout": 30,
+        # Recycle below the RDS idle timeout instead of pinging on checkout
+        "pool_recycle": 600,
+        "pool_pre_ping": False,
+        "pool_use_lifo": True,
+        "echo": False,
+    }
+    
+    if cfg.kind == "polardbx":
+        # The PolarDB-X proxy does not handle session-level prepared statements
+        options["connect_args"] = {
+            "server_settings": {"jit": "off"},
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        }
+    else:
+        # Builders below emit identical SQL per shape, so a larger cache hits
+        options["connect_args"] = {"prepared_statement_cache_size": 256}
+    
+    return options
+
+
+_HEALTH_CHECK_SQL = text("SELECT 1")
+
+_TABLE_EXISTS_SQL = text("""
+    SELECT EXISTS (
+        SELECT FROM information_schema.tables
+        WHERE table_name = :table_name
+    )
+""")
+
+_TABLE_SCHEMA_SQL = text("""
+    SELECT
+        column_name,
+        data_type,
+        is_nullable,
+        column_default
+    FROM information_schema.columns
+    WHERE table_name = :table_name
+    ORDER BY ordinal_position
+""")
+
+HEALTH_CHECK_TTL_SECONDS = 5.0
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+# Backoff between attempts to re-open a dropped LISTEN connection
+LISTEN_RECONNECT_MIN_SECONDS = 0.5
+LISTEN_RECONNECT_MAX_SECONDS = 30.0
+
+
+def _as_statement(query: Union[str, TextClause]) -> TextClause:
+    return text(query) if isinstance(query, str) else query
+
+
+def _returning_clause(returning: Tuple[str, ...]) -> str:
+    return f" RETURNING {', '.join(returning)}" if returning else ""
+
+
+@lru_cache(maxsize=1024)
+def _build_insert_stmt(
+    table: str,
+    cols: Tuple[str, ...],
+    returning: Tuple[str, ...] = ()
+) -> TextClause:
+    """Build (and cache) an INSERT statement for a table/column shape."""
+    columns = ", ".join(cols)
+    placeholders = ", ".join([f":{col}" for col in cols])
+    return text(
+        f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        f"{_returning_clause(returning)}"
+    )
+
+
+BULK_INSERT_CHUNK_SIZE = 500
+
+# PostgreSQL caps a single statement at 32767 bind parameters
+_MAX_BIND_PARAMS = 32767
+
+
+@lru_cache(maxsize=256)
+def _build_bulk_insert_stmt(table: str, cols: Tuple[str, ...], row_count: int) -> TextClause:
+    """Build (and cache) a multi-row INSERT with ``:c<row>_<col>`` binds."""
+    columns = ", ".join(cols)
+    values = ", ".join([
+        "(" + ", ".join([f":c{r}_{c}" for c in range(len(cols))]) + ")"
+        for r in range(row_count)
+    ])
+    return text(f"INSERT INTO {table} ({columns}) VALUES {values}")
+
+
+@lru_cache(maxsize=4096)
+def _compile_update(
+    table: str,
+    data_keys: Tuple[str, ...],
+    where_keys: Tuple[str, ...],
+    returning: Tuple[str, ...] = ()
+) -> Tuple[TextClause, Tuple[str, ...]]:
+    """
+    Compile (and cache) an UPDATE statement for a table/column shape.
+    
+    Binds are numbered ``:p0, :p1, ...`` over data_keys followed by
+    where_keys; the returned names are in that same order.
+    """
+    names = tuple(f"p{i}" for i in range(len(data_keys) + len(where_keys)))
+    data_names, where_names = names[:len(data_keys)], names[len(data_keys):]
+    
+    set_clause = ", ".join([f"{key} = :{name}" for key, name in zip(data_keys, data_names)])
+    where_clause = " AND ".join([f"{key} = :{name}" for key, name in zip(where_keys, where_names)])
+    
+    stmt = text(
+        f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+        f"{_returning_clause(returning)}"
+    )
+    return stmt, names
+
+
+@lru_cache(maxsize=1024)
+def _build_delete_stmt(
+    table: str,
+    where_keys: Tuple[str, ...],
+    returning: Tuple[str, ...] = ()
+) -> TextClause:
+    """Build (and cache) a DELETE statement for a table/filter shape."""
+    where_clause = " AND ".join([f"{key} = :{key}" for key in where_keys])
+    return text(
+        f"DELETE FROM {table} WHERE {where_clause}"
+        f"{_returning_clause(returning)}"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_select_stmt(
+    table: str,
+    cols: Tuple[str, ...],
+    where_keys: Tuple[str, ...],
+    order_by: Optional[str],
+    has_limit: bool,
+    has_offset: bool
+) -> TextClause:
+    """
+    Build (and cache) a SELECT statement for a table/column/filter shape.
+    
+    LIMIT/OFFSET are bound (``:_limit``/``:_offset``) rather than inlined, so
+    paging through a table reuses one cached statement.
+    """
+    query = f"SELECT {', '.join(cols) if cols else '*'} FROM {table}"
+    
+    if where_keys:
+        query += " WHERE " + " AND ".join([f"{key} = :{key}" for key in where_keys])
+    
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    
+    if has_limit:
+        query += " LIMIT :_limit"
+    
+    if has_offset:
+        query += " OFFSET :_offset"
+    
+    return text(query)
+
+
 class AliyunAdapter(DatabaseAdapter):
     """
     Adapter for Aliyun RDS/PolarDB PostgreSQL.
@@ -36,6 +242,9 @@ class AliyunAdapter(DatabaseAdapter):
     - ALIYUN_RDS_USERNAME: Database username
     - ALIYUN_RDS_PASSWORD: Database password
     - ALIYUN_RDS_READ_HOST: Optional read replica host
+    - ALIYUN_DB_KIND: "rds" (default) or "polardbx"
+    - DB_POOL_SIZE / DB_POOL_MAX_OVERFLOW: Pool sizing (default: 20/20)
+    - DB_SCHEMA_CACHE_TTL_SECONDS: Schema introspection cache TTL (default: 300)
     """
     
     def __init__(self):
@@ -43,23 +252,35 @@ class AliyunAdapter(DatabaseAdapter):
         self._read_engine: Optional[AsyncEngine] = None
         self._session_factory: Optional[async_sessionmaker] = None
         self._read_session_factory: Optional[async_sessionmaker] = None
+        self._read_url: Optional[str] = None
+        self._read_engine_lock = asyncio.Lock()
         self._initialized = False
         self._subscriptions: Dict[str, Dict[str, Any]] = {}
+        self._by_channel: Dict[str, List[str]] = defaultdict(list)
         self._listen_task: Optional[asyncio.Task] = None
+        self._listen_ready: Optional[asyncio.Future] = None
+        self._listen_conn: Any = None
+        self._listen_channels: set = set()
+        self._callback_tasks: Set[asyncio.Task] = set()
+        self._last_health_ts: float = 0.0
+        self._last_health_result: Optional[Dict[str, Any]] = None
+        self._schema_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # Session of the enclosing begin_transaction() and the task that owns
+        # it; one variable per adapter, so transactions of two adapters never mix
+        self._transaction: ContextVar[Optional[Tuple[AsyncSession, "asyncio.Task[Any]"]]] = ContextVar(
+            f"aliyun_transaction_{id(self)}", default=None
+        )
     
     def _get_database_url(self, read_replica: bool = False) -> str:
         """Build database connection URL."""
-        host = os.getenv("ALIYUN_RDS_READ_HOST") if read_replica else os.getenv("ALIYUN_RDS_HOST")
-        port = os.getenv("ALIYUN_RDS_PORT", "5432")
-        database = os.getenv("ALIYUN_RDS_DATABASE", "kortix")
-        username = os.getenv("ALIYUN_RDS_USERNAME")
-        password = os.getenv("ALIYUN_RDS_PASSWORD")
+        cfg = _aliyun_config()
+        host = cfg.read_host if read_replica else cfg.host
         
-        if not all([host, username, password]):
+        if not all([host, cfg.username, cfg.password]):
             raise ValueError("Missing required Aliyun RDS configuration")
         
         # Use asyncpg for async operations
-        return f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
+        return f"postgresql+asyncpg://{cfg.username}:{cfg.password}@{host}:{cfg.port}/{cfg.database}"
     
     async def initialize(self) -> None:
         """Initialize Aliyun RDS connection."""
@@ -69,15 +290,7 @@ class AliyunAdapter(DatabaseAdapter):
         try:
             # Create primary engine
             primary_url = self._get_database_url()
-            self._engine = create_async_engine(
-                primary_url,
-                poolclass=AsyncAdaptedQueuePool,
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30,
-                pool_recycle=3600,
-                echo=False
-            )
+            self._engine = create_async_engine(primary_url, **_engine_options())
             
             self._session_factory = async_sessionmaker(
                 self._engine,
@@ -85,29 +298,14 @@ class AliyunAdapter(DatabaseAdapter):
                 expire_on_commit=False
             )
             
-            # Create read replica engine if configured
-            if os.getenv("ALIYUN_RDS_READ_HOST"):
-                read_url = self._get_database_url(read_replica=True)
-                self._read_engine = create_async_engine(
-                    read_url,
-                    poolclass=AsyncAdaptedQueuePool,
-                    pool_size=5,
-                    max_overflow=10,
-                    pool_timeout=30,
-                    pool_recycle=3600,
-                    echo=False
-                )
-                
-                self._read_session_factory = async_sessionmaker(
-                    self._read_engine,
-                    class_=AsyncSession,
-                    expire_on_commit=False
-                )
+            # The read replica engine is created on first use
+            if _aliyun_config().read_host:
+                self._read_url = self._get_database_url(read_replica=True)
                 logger.info("Aliyun read replica configured")
             
             # Test connection
             async with self._engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_HEALTH_CHECK_SQL)
             
             self._initialized = True
             logger.info("Aliyun RDS adapter initialized")
@@ -124,37 +322,92 @@ class AliyunAdapter(DatabaseAdapter):
                 await self._listen_task
             except asyncio.CancelledError:
                 pass
+            self._listen_task = None
+        
+        for task in self._callback_tasks:
+            task.cancel()
+        if self._callback_tasks:
+            await asyncio.gather(*self._callback_tasks, return_exceptions=True)
+        
+        self._subscriptions.clear()
+        self._by_channel.clear()
+        self._listen_channels.clear()
+        self._listen_ready = None
         
         if self._engine:
             await self._engine.dispose()
         
         if self._read_engine:
             await self._read_engine.dispose()
+            self._read_engine = None
+            self._read_session_factory = None
         
         self._initialized = False
+        self._last_health_result = None
         logger.info("Aliyun RDS adapter closed")
     
     async def health_check(self) -> Dict[str, Any]:
-        """Check Aliyun RDS health."""
+        """
+        Check Aliyun RDS health.
+        
+        The SELECT 1 round trip runs at most once per HEALTH_CHECK_TTL_SECONDS;
+        calls in between get the cached result. Use get_connection_stats()
+        for an I/O-free liveness probe.
+        """
         if not self._initialized:
             return {"status": "unhealthy", "provider": "aliyun", "error": "Not initialized"}
         
+        now = time.monotonic()
+        if self._last_health_result is not None and now - self._last_health_ts < HEALTH_CHECK_TTL_SECONDS:
+            return self._last_health_result
+        
         try:
-            async with self._engine.connect() as conn:
-                result = await conn.execute(text("SELECT 1"))
-                return {
-                    "status": "healthy",
-                    "provider": "aliyun",
-                    "host": os.getenv("ALIYUN_RDS_HOST"),
-                    "database": os.getenv("ALIYUN_RDS_DATABASE"),
-                    "has_read_replica": self._read_engine is not None
-                }
+            await asyncio.wait_for(self._ping(), timeout=HEALTH_CHECK_TIMEOUT_SECONDS)
+            result = {
+                "status": "healthy",
+                "provider": "aliyun",
+                "host": _aliyun_config().host,
+                "database": _aliyun_config().database,
+                "has_read_replica": self._read_url is not None
+            }
+        except asyncio.TimeoutError:
+            result = {
+                "status": "unhealthy",
+                "provider": "aliyun",
+                "error": f"Health check timed out after {HEALTH_CHECK_TIMEOUT_SECONDS}s"
+            }
         except Exception as e:
-            return {
+            result = {
                 "status": "unhealthy",
                 "provider": "aliyun",
                 "error": str(e)
             }
+        
+        self._last_health_ts = now
+        self._last_health_result = result
+        return result
+    
+    async def _ping(self) -> None:
+        async with self._read_conn() as conn:
+            await conn.execute(_HEALTH_CHECK_SQL)
+    
+    async def _ensure_read_engine(self) -> Optional[AsyncEngine]:
+        """Create the read replica engine on first use, if one is configured."""
+        if self._read_engine is not None or self._read_url is None:
+            return self._read_engine
+        
+        async with self._read_engine_lock:
+            if self._read_engine is None:
+                engine = create_async_engine(self._read_url, **_engine_options())
+                self._read_session_factory = async_sessionmaker(
+                    engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False
+                )
+                self._read_engine = engine
+                logger.info("Aliyun read replica engine created")
+        
+        return self._read_engine
     
     @asynccontextmanager
     async def get_session(self) -> AsyncSession:
@@ -168,6 +421,7 @@ class AliyunAdapter(DatabaseAdapter):
     @asynccontextmanager
     async def get_read_session(self) -> AsyncSession:
         """Get a read-only session (uses read replica if available)."""
+        await self._ensure_read_engine()
         factory = self._read_session_factory or self._session_factory
         if not factory:
             raise RuntimeError("Aliyun adapter not initialized")
@@ -175,36 +429,118 @@ class AliyunAdapter(DatabaseAdapter):
         async with factory() as session:
             yield session
     
+    @asynccontextmanager
+    async def _read_conn(self, use_read_replica: bool = False) -> AsyncIterator[AsyncConnection]:
+        """
+        Check out a plain pooled connection, from the replica if asked.
+        
+        Inside begin_transaction() the transaction's connection is used
+        instead, so reads see the transaction's own writes.
+        """
+        session = self._transaction_session()
+        if session is not None:
+            yield await session.connection()
+            return
+        
+        engine = self._engine
+        if use_read_replica:
+            engine = await self._ensure_read_engine() or engine
+        
+        if not engine:
+            raise RuntimeError("Aliyun adapter not initialized")
+        
+        async with engine.connect() as conn:
+            yield conn
+    
+    async def _fetch_all(
+        self,
+        query: Union[str, TextClause],
+        params: Optional[Dict[str, Any]] = None,
+        read: bool = False,
+        as_dict: bool = False
+    ) -> List[Mapping[str, Any]]:
+        """Run a statement on a pooled connection, bypassing AsyncSession."""
+        async with self._read_conn(read) as conn:
+            result = await conn.execute(_as_statement(query), params or {})
+            rows = result.mappings().all()
+        
+        return [dict(row) for row in rows] if as_dict else rows
+    
     async def execute_query(
         self,
-        query: str,
+        query: Union[str, TextClause],
+        params: Optional[Dict[str, Any]] = None,
+        use_read_replica: bool = False,
+        as_dict: bool = False
+    ) -> List[Mapping[str, Any]]:
+        """
+        Execute a query.
+        
+        Rows are returned as read-only RowMapping views; pass ``as_dict=True``
+        when callers need mutable (e.g. JSON-serializable) dicts.
+        """
+        return await self._fetch_all(query, params, read=use_read_replica, as_dict=as_dict)
+    
+    async def _scalar_query(
+        self,
+        query: Union[str, TextClause],
         params: Optional[Dict[str, Any]] = None,
         use_read_replica: bool = False
-    ) -> List[Dict[str, Any]]:
-        """Execute a query."""
-        session_factory = self._read_session_factory if (use_read_replica and self._read_session_factory) else self._session_factory
+    ) -> Any:
+        """Execute a query and return the first column of the first row."""
+        async with self._read_conn(use_read_replica) as conn:
+            return (await conn.execute(_as_statement(query), params or {})).scalar()
+    
+    async def stream_query(
+        self,
+        query: Union[str, TextClause],
+        params: Optional[Dict[str, Any]] = None,
+        use_read_replica: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Execute a query and yield rows from a server-side cursor."""
+        async with self._read_conn(use_read_replica) as conn:
+            result = await conn.stream(_as_statement(query), params or {})
+            async for row in result.mappings():
+                yield dict(row)
+    
+    @asynccontextmanager
+    async def _write_conn(self) -> AsyncIterator[AsyncConnection]:
+        """
+        Connection for a mutation: the enclosing transaction's, or a fresh
+        engine.begin() that commits on successful exit.
+        """
+        session = self._transaction_session()
+        if session is not None:
+            yield await session.connection()
+            return
         
-        if not session_factory:
+        if not self._engine:
             raise RuntimeError("Aliyun adapter not initialized")
         
-        async with session_factory() as session:
-            result = await session.execute(text(query), params or {})
-            return [dict(row._mapping) for row in result]
+        async with self._engine.begin() as conn:
+            yield conn
     
     async def execute_mutation(
         self,
-        query: str,
+        query: Union[str, TextClause],
         params: Optional[Dict[str, Any]] = None
     ) -> int:
         """Execute a mutation query."""
-        if not self._session_factory:
-            raise RuntimeError("Aliyun adapter not initialized")
-        
-        async with self._session_factory() as session:
-            result = await session.execute(text(query), params or {})
-            await session.commit()
+        async with self._write_conn() as conn:
+            result = await conn.execute(_as_statement(query), params or {})
             return result.rowcount
     
+    async def _execute_returning(
+        self,
+        query: Union[str, TextClause],
+        params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Execute a mutation with RETURNING and commit it in one checkout."""
+        async with self._write_conn() as conn:
+            result = await conn.execute(_as_statement(query), params or {})
+            row = result.mappings().first()
+            return dict(row) if row else None
+    
     async def insert(
         self,
         table: str,
@@ -212,20 +548,60 @@ class AliyunAdapter(DatabaseAdapter):
         returning: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Insert a row."""
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(f":{key}" for key in data.keys())
-        
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        stmt = _build_insert_stmt(table, tuple(sorted(data)), tuple(returning or ()))
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
+            return await self._execute_returning(stmt, data)
         
-        if returning:
-            result = await self.execute_query(query, data)
-            return result[0] if result else None
-        else:
-            await self.execute_mutation(query, data)
-            return None
+        await self.execute_mutation(stmt, data)
+        return None
+    
+    async def bulk_insert(self, table: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many rows with multi-row INSERT statements.
+        
+        All rows must share the first row's columns. Rows are sent in chunks
+        of up to BULK_INSERT_CHUNK_SIZE within a single transaction.
+        
+        Returns:
+            Number of rows inserted
+        
+        Raises:
+            ValueError: If the first row is empty or another row's columns
+                differ from it (checked before anything is sent)
+        """
+        if not rows:
+            return 0
+        
+        cols = tuple(sorted(rows[0]))
+        if not cols:
+            raise ValueError("bulk_insert: rows[0] has no columns")
+        
+        expected = set(cols)
+        for i, row in enumerate(rows):
+            if row.keys() != expected:
+                raise ValueError(
+                    f"bulk_insert: rows[{i}] columns differ from rows[0] "
+                    f"(missing: {sorted(expected - row.keys())}, "
+                    f"unexpected: {sorted(row.keys() - expected)})"
+                )
+        
+        chunk_size = max(1, min(BULK_INSERT_CHUNK_SIZE, _MAX_BIND_PARAMS // len(cols)))
+        inserted = 0
+        
+        async with self._write_conn() as conn:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                params = {
+                    f"c{r}_{c}": row[col]
+                    for r, row in enumerate(chunk)
+                    for c, col in enumerate(cols)
+                }
+                stmt = _build_bulk_insert_stmt(table, cols, len(chunk))
+                result = await conn.execute(stmt, params)
+                inserted += result.rowcount
+        
+        return inserted
     
     async def update(
         self,
@@ -235,23 +611,16 @@ class AliyunAdapter(DatabaseAdapter):
         returning: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Update rows."""
-        set_clause = ", ".join(f"{key} = :data_{key}" for key in data.keys())
-        where_clause = " AND ".join(f"{key} = :where_{key}" for key in where.keys())
-        
-        params = {f"data_{k}": v for k, v in data.items()}
-        params.update({f"where_{k}": v for k, v in where.items()})
+        data_keys, where_keys = tuple(sorted(data)), tuple(sorted(where))
+        stmt, names = _compile_update(table, data_keys, where_keys, tuple(returning or ()))
         
-        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+        params = dict(zip(names, [data[k] for k in data_keys] + [where[k] for k in where_keys]))
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
+            return await self._execute_returning(stmt, params)
         
-        if returning:
-            result = await self.execute_query(query, params)
-            return result[0] if result else None
-        else:
-            await self.execute_mutation(query, params)
-            return None
+        await self.execute_mutation(stmt, params)
+        return None
     
     async def delete(
         self,
@@ -260,18 +629,13 @@ class AliyunAdapter(DatabaseAdapter):
         returning: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Delete rows."""
-        where_clause = " AND ".join(f"{key} = :{key}" for key in where.keys())
-        query = f"DELETE FROM {table} WHERE {where_clause}"
+        stmt = _build_delete_stmt(table, tuple(sorted(where)), tuple(returning or ()))
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
+            return await self._execute_returning(stmt, where)
         
-        if returning:
-            result = await self.execute_query(query, where)
-            return result[0] if result else None
-        else:
-            await self.execute_mutation(query, where)
-            return None
+        await self.execute_mutation(stmt, where)
+        return None
     
     async def select(
         self,
@@ -281,28 +645,46 @@ class AliyunAdapter(DatabaseAdapter):
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        use_read_replica: bool = True
-    ) -> List[Dict[str, Any]]:
+        use_read_replica: bool = True,
+        as_dict: bool = False
+    ) -> List[Mapping[str, Any]]:
         """Select rows."""
-        cols = ", ".join(columns) if columns else "*"
-        query = f"SELECT {cols} FROM {table}"
-        params = {}
-        
-        if where:
-            where_clause = " AND ".join(f"{key} = :{key}" for key in where.keys())
-            query += f" WHERE {where_clause}"
-            params = where
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        
+        stmt = _build_select_stmt(
+            table,
+            tuple(columns or ()),
+            tuple(sorted(where or ())),
+            order_by,
+            bool(limit),
+            bool(offset)
+        )
+        params = dict(where) if where else {}
         if limit:
-            query += f" LIMIT {limit}"
-        
+            params["_limit"] = limit
         if offset:
-            query += f" OFFSET {offset}"
-        
-        return await self.execute_query(query, params, use_read_replica=use_read_replica)
+            params["_offset"] = offset
+        return await self.execute_query(
+            stmt, params, use_read_replica=use_read_replica, as_dict=as_dict
+        )
+    
+    async def stream_select(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        use_read_replica: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Select rows without a LIMIT, streaming them instead of buffering."""
+        stmt = _build_select_stmt(
+            table,
+            tuple(columns or ()),
+            tuple(sorted(where or ())),
+            order_by,
+            False,
+            False
+        )
+        async for row in self.stream_query(stmt, where or {}, use_read_replica=use_read_replica):
+            yield row
     
     async def subscribe(
         self,
@@ -314,7 +696,9 @@ class AliyunAdapter(DatabaseAdapter):
         """
         Subscribe to real-time changes using PostgreSQL LISTEN/NOTIFY.
         
-        Note: This requires database triggers to be set up for the table.
+        All subscriptions share one dedicated connection. Table triggers must
+        NOTIFY ``table_<table>_<event>`` with a JSON payload; a ``record``
+        key, if present, is what ``where`` filters are matched against.
         """
         subscription_id = str(uuid.uuid4())
         channel = f"table_{table}_{event.value.lower()}"
@@ -326,52 +710,264 @@ class AliyunAdapter(DatabaseAdapter):
             "where": where,
             "channel": channel
         }
+        self._by_channel[channel].append(subscription_id)
         
-        # TODO: Implement LISTEN/NOTIFY with asyncpg
-        logger.warning("Real-time subscriptions require PostgreSQL triggers to be configured")
+        try:
+            listen_conn = await self._ensure_listener()
+            if channel not in self._listen_channels:
+                # Claim the channel before awaiting so concurrent subscribers
+                # don't register a second asyncpg listener for it
+                self._listen_channels.add(channel)
+                await listen_conn.add_listener(channel, self._dispatch)
+        except Exception:
+            self._listen_channels.discard(channel)
+            self._remove_subscription(subscription_id)
+            raise
         
         return subscription_id
     
     async def unsubscribe(self, subscription_id: str) -> None:
         """Unsubscribe from real-time changes."""
-        if subscription_id in self._subscriptions:
-            del self._subscriptions[subscription_id]
+        subscription = self._remove_subscription(subscription_id)
+        if subscription is None:
+            return
+        
+        channel = subscription["channel"]
+        if channel in self._by_channel:
+            return
+        
+        self._listen_channels.discard(channel)
+        if self._listen_conn is not None:
+            await self._listen_conn.remove_listener(channel, self._dispatch)
     
-    async def begin_transaction(self) -> Any:
-        """Begin a transaction."""
-        return self.get_session()
+    def _remove_subscription(self, subscription_id: str) -> Optional[Dict[str, Any]]:
+        """Drop a subscription and its channel index entry."""
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return None
+        
+        channel = subscription["channel"]
+        ids = self._by_channel.get(channel)
+        if ids is not None:
+            ids.remove(subscription_id)
+            if not ids:
+                del self._by_channel[channel]
+        return subscription
     
-    async def table_exists(self, table: str) -> bool:
-        """Check if table exists."""
-        query = """
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_name = :table_name
-        )
+    async def _ensure_listener(self) -> Any:
+        """Start the shared LISTEN connection task and wait until it is usable."""
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_ready = self._new_listen_ready()
+            self._listen_task = asyncio.create_task(self._listen_loop())
+        
+        return await asyncio.shield(self._listen_ready)
+    
+    @staticmethod
+    def _new_listen_ready() -> asyncio.Future:
+        """Future resolved with the driver connection once LISTEN is set up."""
+        ready = asyncio.get_running_loop().create_future()
+        # A failed attempt may have no subscriber waiting on it
+        ready.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return ready
+    
+    async def _listen_loop(self) -> None:
         """
-        result = await self.execute_query(query, {"table_name": table})
-        return result[0]["exists"] if result else False
-    
-    async def get_table_schema(self, table: str) -> List[Dict[str, Any]]:
-        """Get table schema."""
-        query = """
-        SELECT 
-            column_name,
-            data_type,
-            is_nullable,
-            column_default
-        FROM information_schema.columns
-        WHERE table_name = :table_name
-        ORDER BY ordinal_position
+        Keep a single asyncpg connection carrying every LISTEN channel.
+        
+        When the connection drops (or cannot be opened) it is re-opened with
+        exponential backoff and LISTEN is re-issued for every subscribed
+        channel. The task ends once no subscriptions remain, or on close().
+        """
+        delay = LISTEN_RECONNECT_MIN_SECONDS
+        try:
+            while True:
+                try:
+                    await self._listen_once()
+                    delay = LISTEN_RECONNECT_MIN_SECONDS
+                    logger.warning("Aliyun LISTEN connection closed")
+                except Exception as e:
+                    if not self._listen_ready.done():
+                        self._listen_ready.set_exception(e)
+                    logger.error(f"Aliyun LISTEN connection failed: {e}")
+                
+                if self._listen_ready.done():
+                    self._listen_ready = self._new_listen_ready()
+                
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, LISTEN_RECONNECT_MAX_SECONDS)
+                if not self._by_channel:
+                    return
+                logger.info(f"Reconnecting Aliyun LISTEN for {len(self._by_channel)} channel(s)")
+        finally:
+            if self._listen_ready is not None and not self._listen_ready.done():
+                self._listen_ready.cancel()
+    
+    async def _listen_once(self) -> None:
         """
-        return await self.execute_query(query, {"table_name": table})
+        Open the LISTEN connection, subscribe every channel and hold it.
+        
+        asyncpg invokes _dispatch for each notification, so this only keeps
+        the connection checked out until it terminates.
+        """
+        async with self._engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver_conn = raw.driver_connection
+            
+            terminated = asyncio.get_running_loop().create_future()
+            driver_conn.add_termination_listener(
+                lambda _conn: terminated.done() or terminated.set_result(None)
+            )
+            
+            try:
+                for channel in list(self._by_channel):
+                    self._listen_channels.add(channel)
+                    await driver_conn.add_listener(channel, self._dispatch)
+                
+                self._listen_conn = driver_conn
+                self._listen_ready.set_result(driver_conn)
+                await terminated
+            finally:
+                self._listen_conn = None
+                self._listen_channels.clear()
+                # Never hand a connection with live listeners back to the pool
+                await conn.invalidate()
+    
+    def _dispatch(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """Fan a NOTIFY payload out to the subscriptions on its channel."""
+        try:
+            data = json.loads(payload) if payload else {}
+        except ValueError:
+            data = {"payload": payload}
+        
+        record = data.get("record", data) if isinstance(data, dict) else {}
+        
+        for subscription_id in tuple(self._by_channel.get(channel, ())):
+            sub = self._subscriptions.get(subscription_id)
+            if sub is None:
+                continue
+            
+            where = sub["where"]
+            if where and any(record.get(k) != v for k, v in where.items()):
+                continue
+            
+            try:
+                result = sub["callback"](data)
+                if asyncio.iscoroutine(result):
+                    # Keep a reference so the task is not garbage-collected
+                    # and its failure is logged rather than lost
+                    task = asyncio.ensure_future(result)
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(
+                        lambda t, channel=channel: self._callback_done(t, channel)
+                    )
+            except Exception as e:
+                logger.error(f"Aliyun subscription callback failed on {channel}: {e}")
+    
+    def _callback_done(self, task: asyncio.Task, channel: str) -> None:
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Aliyun subscription callback failed on {channel}: {task.exception()}")
+    
+    @asynccontextmanager
+    async def begin_transaction(self) -> AsyncIterator[AsyncSession]:
+        """
+        Begin a transaction.
+        
+        Usage:
+            async with adapter.begin_transaction() as session:
+                ...
+        
+        Commits when the block exits cleanly and rolls back on exception.
+        The adapter's own query/CRUD helpers called inside the block run on
+        the same session; a nested begin_transaction() joins the outer one.
+        
+        The session belongs to the task that opened the block. AsyncSession
+        does not support concurrent use, so calling the adapter from a task
+        started inside the block (asyncio.gather, create_task) raises
+        RuntimeError; await such work in the owning task instead.
+        """
+        current = self._transaction_session()
+        if current is not None:
+            yield current
+            return
+        
+        if not self._session_factory:
+            raise RuntimeError("Aliyun adapter not initialized")
+        
+        async with self._session_factory() as session:
+            async with session.begin():
+                token = self._transaction.set((session, asyncio.current_task()))
+                try:
+                    yield session
+                finally:
+                    self._transaction.reset(token)
+    
+    def _transaction_session(self) -> Optional[AsyncSession]:
+        """
+        Session of the enclosing begin_transaction(), if any.
+        
+        Raises:
+            RuntimeError: If the transaction was opened by another task
+        """
+        transaction = self._transaction.get()
+        if transaction is None:
+            return None
+        
+        session, owner = transaction
+        if asyncio.current_task() is not owner:
+            raise RuntimeError(
+                "begin_transaction() session used from another task; "
+                "AsyncSession does not support concurrent use"
+            )
+        return session
+    
+    def _get_cached_schema(self, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        entry = self._schema_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return True, entry[1]
+        return False, None
+    
+    def _set_cached_schema(self, key: Tuple[str, str], value: Any) -> None:
+        expires_at = time.monotonic() + _aliyun_config().schema_cache_ttl
+        self._schema_cache[key] = (expires_at, value)
+    
+    def invalidate_schema_cache(self, table: Optional[str] = None) -> None:
+        """
+        Drop cached table_exists/get_table_schema results.
+        
+        Call after migrations; with no table, the whole cache is cleared.
+        """
+        if table is None:
+            self._schema_cache.clear()
+            return
+        
+        self._schema_cache.pop(("exists", table), None)
+        self._schema_cache.pop(("schema", table), None)
+    
+    async def table_exists(self, table: str) -> bool:
+        """Check if table exists (cached for DB_SCHEMA_CACHE_TTL_SECONDS)."""
+        key = ("exists", table)
+        hit, exists = self._get_cached_schema(key)
+        if not hit:
+            exists = bool(await self._scalar_query(_TABLE_EXISTS_SQL, {"table_name": table}))
+            self._set_cached_schema(key, exists)
+        return exists
+    
+    async def get_table_schema(self, table: str) -> List[Mapping[str, Any]]:
+        """Get table schema (cached for DB_SCHEMA_CACHE_TTL_SECONDS)."""
+        key = ("schema", table)
+        hit, columns = self._get_cached_schema(key)
+        if not hit:
+            columns = await self.execute_query(_TABLE_SCHEMA_SQL, {"table_name": table})
+            self._set_cached_schema(key, columns)
+        return list(columns)
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
         stats = {
             "provider": "aliyun",
             "initialized": self._initialized,
-            "has_read_replica": self._read_engine is not None
+            "has_read_replica": self._read_url is not None
         }
         
         if self._engine:
@@ -7,19 +7,286 @@ Supports:
 - Development/testing environments
 
 This adapter is similar to cloud adapters but optimized for local deployment.
+
+Event loop: asyncpg gets most of its throughput advantage on uvloop. The
+adapter does not install a loop itself; install it in the process entrypoint
+before the loop starts:
+
+    import uvloop
+    uvloop.install()
+
+Under uvicorn/gunicorn the same is achieved by having ``uvloop`` installed and
+running with ``--loop auto`` (UvicornWorker's default) or ``--loop uvloop``.
 """
 
-from typing import Optional, Dict, Any, List, Callable
-from sqlalchemy import text
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable, Awaitable, NamedTuple, Sequence, Tuple, Iterable, AsyncIterable, AsyncIterator, Union
+from sqlalchemy import text, RowMapping
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+import asyncio
+import json
 import os
+import re
+import time
 import uuid
 
 from ..adapter import DatabaseAdapter, RealtimeEvent
+from core.services.db import _validate_identifier, _validate_order_by
 from core.utils.logger import logger
 
+if TYPE_CHECKING:
+    from asyncpg import Record
+
+
+POOL_SATURATION_WARNING = 0.8
+
+ASYNCPG_POOL_MIN_SIZE = 10
+ASYNCPG_POOL_MAX_SIZE = 30
+
+INSERT_MANY_BATCH_SIZE = 1000
+
+SCHEMA_CACHE_TTL_SECONDS = 60.0
+
+# Statements that can change what table_exists/get_table_schema report
+_DDL_RE = re.compile(r"^\s*(ALTER|CREATE|DROP)\b", re.IGNORECASE)
+
+# PostgreSQL caps a single statement at 32767 bind parameters
+_MAX_BIND_PARAMS = 32767
+
+# Read results: asyncpg Records by default, plain dicts with as_dict=True.
+# A Record supports row["col"], row.get(), keys()/values()/items() and
+# dict(row), but is not a Mapping: iterating it yields values, not keys.
+# Inside request_scope() rows come from the scope's session as RowMappings,
+# which support the same access.
+_Row = Union["Record", RowMapping, Dict[str, Any]]
+
+
+async def _init_asyncpg_connection(conn: Any) -> None:
+    """
+    Decode json/jsonb columns on the raw asyncpg pool.
+    
+    asyncpg returns them as str by default; SQLAlchemy's asyncpg dialect
+    registers these codecs on its own connections, so reads through the pool
+    return the same dicts/lists as reads through the engine.
+    """
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name, encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+        )
+
+
+# Catalog lookups hit pg_class/pg_attribute indexes directly instead of
+# expanding the much heavier information_schema views. Both resolve the name
+# with to_regclass (search_path, or an explicit "schema.table") and only
+# count table-like relations: tables, partitioned tables, views,
+# materialized views and foreign tables.
+_TABLE_EXISTS_SQL = """
+    SELECT 1
+    FROM pg_catalog.pg_class c
+    WHERE c.oid = to_regclass(:table_name)
+      AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+"""
+
+_TABLE_SCHEMA_SQL = """
+    SELECT
+        a.attname AS column_name,
+        format_type(a.atttypid, a.atttypmod) AS data_type,
+        CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS is_nullable,
+        pg_get_expr(d.adbin, d.adrelid) AS column_default
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    LEFT JOIN pg_catalog.pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+    WHERE a.attrelid = to_regclass(:table_name)
+      AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+    ORDER BY a.attnum
+"""
+
+
+# Same bind-parameter syntax that sqlalchemy.text() recognises
+_NAMED_PARAM_RE = re.compile(r"(?<![:\w\\]):(\w+)(?!:)")
+
+
+@lru_cache(maxsize=4096)
+def _compile_sql(sql: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Rewrite ``:name`` binds to asyncpg's ``$N`` placeholders (cached per SQL).
+    
+    Returns the rewritten SQL and the parameter names in ``$N`` order; a
+    name used more than once maps to the same placeholder.
+    """
+    names: List[str] = []
+    
+    def _replace(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+    
+    return _NAMED_PARAM_RE.sub(_replace, sql), tuple(names)
+
+
+
+_ARRAY_TYPES = (list, tuple, set, frozenset)
+
+
+def _where_shape(where: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, bool], ...]:
+    """Sorted ``(key, is_array)`` pairs; the part of a filter that shapes SQL."""
+    if not where:
+        return ()
+    return tuple((key, isinstance(where[key], _ARRAY_TYPES)) for key in sorted(where))
+
+
+def _where_params(where: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Bind values for a filter; sets become lists so asyncpg sends an array."""
+    return {
+        f"{prefix}{key}": list(value) if isinstance(value, (set, frozenset)) else value
+        for key, value in where.items()
+    }
+
+
+def _build_where_clause(shape: Tuple[Tuple[str, bool], ...], prefix: str = "") -> str:
+    """
+    ``key = :key`` for scalars and ``key = ANY(:key)`` for list-like values.
+    
+    ANY keeps one statement shape whatever the list length, so the server's
+    prepared-statement cache is not flooded with per-length IN (...) lists.
+    Element types are inferred by asyncpg from the column being compared.
+    """
+    return " AND ".join([
+        f"{key} = ANY(:{prefix}{key})" if is_array else f"{key} = :{prefix}{key}"
+        for key, is_array in shape
+    ])
+
+
+class _SqlTemplate(NamedTuple):
+    """A statement in both bind styles, compiled once per shape."""
+    named: str                # ``:name`` binds, for SQLAlchemy text()
+    positional: str           # ``$N`` binds, for asyncpg
+    names: Tuple[str, ...]    # bind names in ``$N`` order
+
+
+def _template(named: str) -> _SqlTemplate:
+    positional, names = _compile_sql(named)
+    return _SqlTemplate(named, positional, names)
+
+
+def _returning_sql(returning: Tuple[str, ...]) -> str:
+    return "".join([" RETURNING ", ", ".join(returning)]) if returning else ""
+
+
+@lru_cache(maxsize=4096)
+def _insert_sql(table: str, cols: Tuple[str, ...], returning: Tuple[str, ...]) -> _SqlTemplate:
+    return _template("".join([
+        "INSERT INTO ", table,
+        " (", ", ".join(cols), ") VALUES (",
+        ", ".join([":" + col for col in cols]), ")",
+        _returning_sql(returning),
+    ]))
+
+
+@lru_cache(maxsize=256)
+def _insert_many_sql(
+    table: str,
+    cols: Tuple[str, ...],
+    row_count: int,
+    returning: Tuple[str, ...]
+) -> str:
+    """Multi-row INSERT with positional ``$N`` binds, row-major."""
+    width = len(cols)
+    values = ", ".join([
+        "(" + ", ".join([f"${r * width + c + 1}" for c in range(width)]) + ")"
+        for r in range(row_count)
+    ])
+    return "".join([
+        "INSERT INTO ", table, " (", ", ".join(cols), ") VALUES ", values,
+        _returning_sql(returning),
+    ])
+
+
+@lru_cache(maxsize=4096)
+def _update_sql(
+    table: str,
+    data_keys: Tuple[str, ...],
+    where_shape: Tuple[Tuple[str, bool], ...],
+    returning: Tuple[str, ...]
+) -> _SqlTemplate:
+    return _template("".join([
+        "UPDATE ", table,
+        " SET ", ", ".join([f"{key} = :data_{key}" for key in data_keys]),
+        " WHERE ", _build_where_clause(where_shape, "where_"),
+        _returning_sql(returning),
+    ]))
+
+
+@lru_cache(maxsize=4096)
+def _delete_sql(
+    table: str,
+    where_shape: Tuple[Tuple[str, bool], ...],
+    returning: Tuple[str, ...]
+) -> _SqlTemplate:
+    return _template("".join([
+        "DELETE FROM ", table,
+        " WHERE ", _build_where_clause(where_shape),
+        _returning_sql(returning),
+    ]))
+
+
+@lru_cache(maxsize=4096)
+def _compile_select(
+    table: str,
+    cols: Tuple[str, ...],
+    where_shape: Tuple[Tuple[str, bool], ...],
+    order_by: Optional[str],
+    has_limit: bool,
+    has_offset: bool
+) -> _SqlTemplate:
+    """
+    Build the SELECT for one query shape.
+    
+    LIMIT/OFFSET are bound (``:_limit``/``:_offset``) rather than inlined, so
+    paging through a table reuses one statement. ``order_by`` is spliced in,
+    so it is validated (and its columns quoted) here, once per distinct value.
+    """
+    parts = ["SELECT ", ", ".join(cols) if cols else "*", " FROM ", table]
+    
+    if where_shape:
+        parts += [" WHERE ", _build_where_clause(where_shape)]
+    
+    if order_by:
+        parts += [" ORDER BY ", _validate_order_by(order_by)]
+    
+    if has_limit:
+        parts.append(" LIMIT :_limit")
+    
+    if has_offset:
+        parts.append(" OFFSET :_offset")
+    
+    return _template("".join(parts))
+
+
+@lru_cache(maxsize=1024)
+def _select_after_sql(
+    table: str,
+    cols: Tuple[str, ...],
+    cursor_col: str,
+    first_page: bool
+) -> _SqlTemplate:
+    _validate_identifier(table, "table name")
+    _validate_identifier(cursor_col, "cursor column")
+    
+    parts = ["SELECT ", ", ".join(cols) if cols else "*", " FROM ", table]
+    if not first_page:
+        parts += [" WHERE ", cursor_col, " > :after"]
+    parts += [" ORDER BY ", cursor_col, " LIMIT :limit"]
+    
+    return _template("".join(parts))
+
 
 class LocalAdapter(DatabaseAdapter):
     """
@@ -33,13 +300,34 @@ class LocalAdapter(DatabaseAdapter):
     - POSTGRES_DATABASE: Database name (default: kortix)
     - POSTGRES_USER: Database username
     - POSTGRES_PASSWORD: Database password
+    - POSTGRES_POOL_SIZE / POSTGRES_MAX_OVERFLOW: Pool sizing (default: 25/50)
+    - POSTGRES_STATEMENT_CACHE_SIZE: asyncpg statement cache size (default: 1024)
+    - POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: SQLAlchemy asyncpg prepared
+      statement cache size (default: 256)
+    
+    Cached prepared statements can go stale when a migration changes the
+    tables they use (InvalidCachedStatementError). For migrations, set both
+    cache sizes to 0, run the migration, then restart with the normal sizes.
     """
     
+    # Real-time delivery is not wired up; say so once per process, not per call
+    _warned_no_realtime = False
+    
     def __init__(self):
         self._engine: Optional[AsyncEngine] = None
         self._session_factory: Optional[async_sessionmaker] = None
+        self._asyncpg_pool: Any = None
+        self._pool_capacity = 0
+        self._version: Optional[str] = None
+        self._schema_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._schema_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
         self._initialized = False
         self._subscriptions: Dict[str, Dict[str, Any]] = {}
+        # Session of the enclosing request_scope() and the task that owns it;
+        # one variable per adapter, so scopes of two adapters never mix
+        self._scope: ContextVar[Optional[Tuple[AsyncSession, "asyncio.Task[Any]"]]] = ContextVar(
+            f"local_request_scope_{id(self)}", default=None
+        )
     
     def _get_database_url(self) -> str:
         """Build database connection URL."""
@@ -64,6 +352,11 @@ class LocalAdapter(DatabaseAdapter):
         
         return f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
     
+    @staticmethod
+    def _get_asyncpg_dsn(db_url: str) -> str:
+        """Plain libpq-style DSN for asyncpg (no SQLAlchemy driver suffix)."""
+        return db_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+    
     async def initialize(self) -> None:
         """Initialize local PostgreSQL connection."""
         if self._initialized:
@@ -72,15 +365,32 @@ class LocalAdapter(DatabaseAdapter):
         try:
             db_url = self._get_database_url()
             
-            # Use larger pool for local development
+            # 0 disables a cache; see the class docstring for migrations
+            statement_cache_size = int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "1024"))
+            prepared_statement_cache_size = int(
+                os.getenv("POSTGRES_PREPARED_STATEMENT_CACHE_SIZE", "256")
+            )
+            
+            # Size the pool for expected concurrency (pool_size + overflow
+            # ~= concurrent DB users); pre-ping drops connections gone stale
+            # while idle
+            pool_size = int(os.getenv("POSTGRES_POOL_SIZE", "25"))
+            max_overflow = int(os.getenv("POSTGRES_MAX_OVERFLOW", "50"))
+            self._pool_capacity = pool_size + max(max_overflow, 0)
+            
             self._engine = create_async_engine(
                 db_url,
                 poolclass=AsyncAdaptedQueuePool,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
                 pool_timeout=30,
                 pool_recycle=3600,
-                echo=os.getenv("POSTGRES_ECHO", "false").lower() == "true"
+                pool_pre_ping=True,
+                echo=os.getenv("POSTGRES_ECHO", "false").lower() == "true",
+                connect_args={
+                    "statement_cache_size": statement_cache_size,
+                    "prepared_statement_cache_size": prepared_statement_cache_size
+                }
             )
             
             self._session_factory = async_sessionmaker(
@@ -89,9 +399,21 @@ class LocalAdapter(DatabaseAdapter):
                 expire_on_commit=False
             )
             
-            # Test connection
+            # Test connection; the server version is fixed for the life of
+            # the pool, so read it here once for health_check()
             async with self._engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+                self._version = await conn.scalar(text("SELECT version()"))
+            
+            # Reads go straight to a long-lived asyncpg pool, skipping
+            # SQLAlchemy's session/result layer; writes stay on the engine
+            import asyncpg
+            self._asyncpg_pool = await asyncpg.create_pool(
+                self._get_asyncpg_dsn(db_url),
+                min_size=ASYNCPG_POOL_MIN_SIZE,
+                max_size=ASYNCPG_POOL_MAX_SIZE,
+                statement_cache_size=statement_cache_size,
+                init=_init_asyncpg_connection
+            )
             
             self._initialized = True
             logger.info("Local PostgreSQL adapter initialized")
@@ -102,6 +424,10 @@ class LocalAdapter(DatabaseAdapter):
     
     async def close(self) -> None:
         """Close connections."""
+        if self._asyncpg_pool:
+            await self._asyncpg_pool.close()
+            self._asyncpg_pool = None
+        
         if self._engine:
             await self._engine.dispose()
         
@@ -114,16 +440,15 @@ class LocalAdapter(DatabaseAdapter):
             return {"status": "unhealthy", "provider": "local", "error": "Not initialized"}
         
         try:
-            async with self._engine.connect() as conn:
-                result = await conn.execute(text("SELECT version()"))
-                version = result.scalar()
-                return {
-                    "status": "healthy",
-                    "provider": "local",
-                    "host": os.getenv("POSTGRES_HOST", "localhost"),
-                    "database": os.getenv("POSTGRES_DATABASE", "kortix"),
-                    "version": version
-                }
+            await self._asyncpg_pool.fetchval("SELECT 1")
+            
+            return {
+                "status": "healthy",
+                "provider": "local",
+                "host": os.getenv("POSTGRES_HOST", "localhost"),
+                "database": os.getenv("POSTGRES_DATABASE", "kortix"),
+                "version": self._version
+            }
         except Exception as e:
             return {
                 "status": "unhealthy",
@@ -133,7 +458,17 @@ class LocalAdapter(DatabaseAdapter):
     
     @asynccontextmanager
     async def get_session(self) -> AsyncSession:
-        """Get a database session."""
+        """
+        Get a database session.
+        
+        Inside request_scope() the request's session is yielded instead of
+        checking out a new one.
+        """
+        current = self._scope_session()
+        if current is not None:
+            yield current
+            return
+        
         if not self._session_factory:
             raise RuntimeError("Local adapter not initialized")
         
@@ -143,39 +478,213 @@ class LocalAdapter(DatabaseAdapter):
     @asynccontextmanager
     async def get_read_session(self) -> AsyncSession:
         """Get a read-only session (same as write for local)."""
+        async with self.get_session() as session:
+            yield session
+    
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator[AsyncSession]:
+        """
+        Share one SQLAlchemy session, and transaction, across the block.
+        
+        Intended for per-request middleware:
+        
+            @app.middleware("http")
+            async def db_session(request, call_next):
+                async with adapter.request_scope():
+                    return await call_next(request)
+        
+        Inside the scope every operation of this adapter (reads, writes,
+        ``returning`` writes, insert_many, bulk_copy) runs on the request's
+        session, in one transaction: later reads see earlier writes, and
+        nothing is committed individually. The session commits once when the
+        block exits cleanly and rolls back if it raises.
+        
+        The session belongs to the task that opened the scope. AsyncSession
+        does not support concurrent use, so using the adapter from a task
+        started inside the scope (asyncio.gather, create_task) raises
+        RuntimeError; execute_many_queries() runs its queries one after
+        another instead. Nested scopes reuse the outer session.
+        """
+        current = self._scope_session()
+        if current is not None:
+            yield current
+            return
+        
         if not self._session_factory:
             raise RuntimeError("Local adapter not initialized")
         
         async with self._session_factory() as session:
-            yield session
+            token = self._scope.set((session, asyncio.current_task()))
+            try:
+                yield session
+                await session.commit()
+            except BaseException:
+                await session.rollback()
+                raise
+            finally:
+                self._scope.reset(token)
+    
+    def _scope_session(self) -> Optional[AsyncSession]:
+        """
+        Session of the enclosing request_scope(), if any.
+        
+        Raises:
+            RuntimeError: If the scope was opened by another task
+        """
+        scope = self._scope.get()
+        if scope is None:
+            return None
+        
+        session, owner = scope
+        if asyncio.current_task() is not owner:
+            raise RuntimeError(
+                "request_scope() session used from another task; "
+                "AsyncSession does not support concurrent use"
+            )
+        return session
+    
+    @staticmethod
+    async def _scope_execute(session: AsyncSession, sql: str, args: Any) -> CursorResult:
+        """
+        Run ``$N`` SQL on the scope's connection, inside its transaction.
+        
+        The asyncpg dialect's paramstyle is ``$N`` as well, so the compiled
+        SQL is passed as is; a list of tuples runs as executemany.
+        """
+        conn = await session.connection()
+        return await conn.exec_driver_sql(sql, args)
     
     async def execute_query(
         self,
         query: str,
         params: Optional[Dict[str, Any]] = None,
+        use_read_replica: bool = False,
+        as_dict: bool = False
+    ) -> List[_Row]:
+        """
+        Execute a query.
+        
+        Rows are asyncpg ``Record`` objects (see ``_Row``); pass
+        ``as_dict=True`` when callers need real dicts (e.g. to iterate keys,
+        mutate or JSON-serialize rows).
+        """
+        sql, args = self._bind(query, params)
+        
+        session = self._scope_session()
+        if session is not None:
+            result = await self._scope_execute(session, sql, tuple(args))
+            return self._rows(result.mappings().all(), as_dict)
+        
+        if not self._asyncpg_pool:
+            raise RuntimeError("Local adapter not initialized")
+        
+        return self._rows(await self._asyncpg_pool.fetch(sql, *args), as_dict)
+    
+    async def execute_many_queries(
+        self,
+        queries: List[Tuple[str, Optional[Dict[str, Any]]]],
         use_read_replica: bool = False
-    ) -> List[Dict[str, Any]]:
-        """Execute a query."""
-        if not self._session_factory:
+    ) -> List[List["Record"]]:
+        """
+        Run independent queries concurrently, each on its own pooled connection.
+        
+        Total latency is that of the slowest query rather than the sum.
+        Results are returned in the same order as ``queries``. Inside
+        request_scope() they share the scope's session, so they run one
+        after another.
+        """
+        if self._scope_session() is not None:
+            return [
+                await self.execute_query(query, params, use_read_replica=use_read_replica)
+                for query, params in queries
+            ]
+        
+        return list(await asyncio.gather(*[
+            self.execute_query(query, params, use_read_replica=use_read_replica)
+            for query, params in queries
+        ]))
+    
+    async def fetch_one(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        as_dict: bool = False
+    ) -> Optional[_Row]:
+        """Execute a query and return its first row."""
+        sql, args = self._bind(query, params)
+        
+        session = self._scope_session()
+        if session is not None:
+            row = (await self._scope_execute(session, sql, tuple(args))).mappings().first()
+        else:
+            if not self._asyncpg_pool:
+                raise RuntimeError("Local adapter not initialized")
+            row = await self._asyncpg_pool.fetchrow(sql, *args)
+        
+        return dict(row) if as_dict and row is not None else row
+    
+    async def fetch_value(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Execute a query and return its first value."""
+        sql, args = self._bind(query, params)
+        
+        session = self._scope_session()
+        if session is not None:
+            return (await self._scope_execute(session, sql, tuple(args))).scalar()
+        
+        if not self._asyncpg_pool:
             raise RuntimeError("Local adapter not initialized")
         
-        async with self._session_factory() as session:
-            result = await session.execute(text(query), params or {})
-            return [dict(row._mapping) for row in result]
+        return await self._asyncpg_pool.fetchval(sql, *args)
+    
+    async def _fetch_template(self, template: _SqlTemplate, params: Dict[str, Any]) -> List[_Row]:
+        """Fetch with a prebuilt template, skipping the SQL rewrite lookup."""
+        args = [params[name] for name in template.names]
+        
+        session = self._scope_session()
+        if session is not None:
+            result = await self._scope_execute(session, template.positional, tuple(args))
+            return result.mappings().all()
+        
+        if not self._asyncpg_pool:
+            raise RuntimeError("Local adapter not initialized")
+        
+        return await self._asyncpg_pool.fetch(template.positional, *args)
+    
+    @staticmethod
+    def _rows(records: Sequence[_Row], as_dict: bool) -> List[_Row]:
+        return [dict(record) for record in records] if as_dict else records
+    
+    @staticmethod
+    def _bind(query: str, params: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """Compiled ``$N`` SQL plus positional args taken from ``params``."""
+        sql, names = _compile_sql(query)
+        return sql, [params[name] for name in names] if names else []
     
     async def execute_mutation(
         self,
         query: str,
         params: Optional[Dict[str, Any]] = None
     ) -> int:
-        """Execute a mutation query."""
-        if not self._session_factory:
-            raise RuntimeError("Local adapter not initialized")
+        """
+        Execute a mutation query.
         
-        async with self._session_factory() as session:
+        Inside request_scope() the statement joins the request's transaction
+        and is committed when the scope exits.
+        """
+        in_scope = self._scope_session() is not None
+        async with self.get_session() as session:
             result = await session.execute(text(query), params or {})
-            await session.commit()
-            return result.rowcount
+            if not in_scope:
+                await session.commit()
+        
+        if _DDL_RE.match(query):
+            self.invalidate_schema_cache()
+        
+        return result.rowcount
     
     async def insert(
         self,
@@ -184,18 +693,112 @@ class LocalAdapter(DatabaseAdapter):
         returning: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Insert a row."""
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(f":{key}" for key in data.keys())
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        template = _insert_sql(table, tuple(sorted(data)), tuple(returning or ()))
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
-            result = await self.execute_query(query, data)
-            return result[0] if result else None
+            result = await self._fetch_template(template, data)
+            return dict(result[0]) if result else None
         else:
-            await self.execute_mutation(query, data)
+            await self.execute_mutation(template.named, data)
             return None
     
+    async def insert_many(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        returning: Optional[List[str]] = None,
+        batch_size: int = INSERT_MANY_BATCH_SIZE
+    ) -> List[_Row]:
+        """
+        Insert many rows in one transaction.
+        
+        Columns are the union of all row keys; missing values are NULL.
+        Without ``returning`` the rows go through asyncpg's executemany;
+        with it, through multi-row INSERT ... VALUES statements of up to
+        ``batch_size`` rows (fewer for wide rows, to stay under the bind
+        parameter limit).
+        
+        Returns:
+            The RETURNING rows, or an empty list when ``returning`` is not set
+        """
+        if not rows:
+            return []
+        
+        cols = tuple(sorted({key for row in rows for key in row}))
+        values = [tuple([row.get(col) for col in cols]) for row in rows]
+        chunk_size = max(1, min(batch_size, _MAX_BIND_PARAMS // len(cols)))
+        returning_cols = tuple(returning or ())
+        
+        session = self._scope_session()
+        if session is not None:
+            # A savepoint keeps the call all-or-nothing inside the scope
+            async with session.begin_nested():
+                if not returning:
+                    await self._scope_execute(session, _insert_sql(table, cols, ()).positional, values)
+                    return []
+                
+                inserted: List[_Row] = []
+                for start in range(0, len(values), chunk_size):
+                    chunk = values[start:start + chunk_size]
+                    sql = _insert_many_sql(table, cols, len(chunk), returning_cols)
+                    args = tuple([value for row in chunk for value in row])
+                    inserted.extend((await self._scope_execute(session, sql, args)).mappings().all())
+                return inserted
+        
+        if not self._asyncpg_pool:
+            raise RuntimeError("Local adapter not initialized")
+        
+        async with self._asyncpg_pool.acquire() as conn:
+            async with conn.transaction():
+                if not returning:
+                    await conn.executemany(_insert_sql(table, cols, ()).positional, values)
+                    return []
+                
+                inserted = []
+                for start in range(0, len(values), chunk_size):
+                    chunk = values[start:start + chunk_size]
+                    sql = _insert_many_sql(table, cols, len(chunk), returning_cols)
+                    args = [value for row in chunk for value in row]
+                    inserted.extend(await conn.fetch(sql, *args))
+                
+                return inserted
+    
+    async def bulk_copy(
+        self,
+        table: str,
+        columns: List[str],
+        rows: Union[Iterable[Sequence[Any]], AsyncIterable[Sequence[Any]]]
+    ) -> int:
+        """
+        Load rows with PostgreSQL's binary COPY protocol.
+        
+        The fastest path for large ingests: no per-row parse/plan/execute.
+        ``rows`` yields value tuples in ``columns`` order and may be a
+        (async) generator, so the input is never fully materialized.
+        COPY has no RETURNING, and rows skip INSERT rules; row triggers
+        still fire.
+        
+        Returns:
+            Number of rows copied
+        """
+        session = self._scope_session()
+        if session is not None:
+            conn = await session.connection()
+            driver_conn = (await conn.get_raw_connection()).driver_connection
+            if not driver_conn.is_in_transaction():
+                # The dialect only sends BEGIN with the first statement
+                await conn.exec_driver_sql("SELECT 1")
+            status = await driver_conn.copy_records_to_table(table, records=rows, columns=columns)
+        else:
+            if not self._asyncpg_pool:
+                raise RuntimeError("Local adapter not initialized")
+            
+            async with self._asyncpg_pool.acquire() as conn:
+                status = await conn.copy_records_to_table(table, records=rows, columns=columns)
+        
+        # asyncpg returns the command tag, e.g. "COPY 1000"
+        return int(status.rsplit(" ", 1)[-1])
+    
     async def update(
         self,
         table: str,
@@ -204,20 +807,16 @@ class LocalAdapter(DatabaseAdapter):
         returning: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Update rows."""
-        set_clause = ", ".join(f"{key} = :data_{key}" for key in data.keys())
-        where_clause = " AND ".join(f"{key} = :where_{key}" for key in where.keys())
+        template = _update_sql(table, tuple(sorted(data)), _where_shape(where), tuple(returning or ()))
         
         params = {f"data_{k}": v for k, v in data.items()}
-        params.update({f"where_{k}": v for k, v in where.items()})
-        
-        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+        params.update(_where_params(where, "where_"))
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
-            result = await self.execute_query(query, params)
-            return result[0] if result else None
+            result = await self._fetch_template(template, params)
+            return dict(result[0]) if result else None
         else:
-            await self.execute_mutation(query, params)
+            await self.execute_mutation(template.named, params)
             return None
     
     async def delete(
@@ -227,15 +826,14 @@ class LocalAdapter(DatabaseAdapter):
         returning: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Delete rows."""
-        where_clause = " AND ".join(f"{key} = :{key}" for key in where.keys())
-        query = f"DELETE FROM {table} WHERE {where_clause}"
+        template = _delete_sql(table, _where_shape(where), tuple(returning or ()))
+        params = _where_params(where)
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
-            result = await self.execute_query(query, where)
-            return result[0] if result else None
+            result = await self._fetch_template(template, params)
+            return dict(result[0]) if result else None
         else:
-            await self.execute_mutation(query, where)
+            await self.execute_mutation(template.named, params)
             return None
     
     async def select(
@@ -246,28 +844,60 @@ class LocalAdapter(DatabaseAdapter):
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        use_read_replica: bool = True
-    ) -> List[Dict[str, Any]]:
-        """Select rows."""
-        cols = ", ".join(columns) if columns else "*"
-        query = f"SELECT {cols} FROM {table}"
-        params = {}
-        
-        if where:
-            where_clause = " AND ".join(f"{key} = :{key}" for key in where.keys())
-            query += f" WHERE {where_clause}"
-            params = where
+        use_read_replica: bool = True,
+        as_dict: bool = False
+    ) -> List[_Row]:
+        """
+        Select rows.
         
-        if order_by:
-            query += f" ORDER BY {order_by}"
+        A list, tuple or set value in ``where`` matches any of its elements
+        (``col = ANY(:col)``). Rows are asyncpg Records unless ``as_dict``.
         
+        Raises:
+            ValueError: If ``order_by`` is not a comma-separated list of
+                column names, each optionally followed by ASC/DESC and
+                NULLS FIRST/LAST
+        """
+        template = _compile_select(
+            table,
+            tuple(columns or ()),
+            _where_shape(where),
+            order_by,
+            bool(limit),
+            bool(offset)
+        )
+        params = _where_params(where) if where else {}
         if limit:
-            query += f" LIMIT {limit}"
-        
+            params["_limit"] = limit
         if offset:
-            query += f" OFFSET {offset}"
+            params["_offset"] = offset
+        return self._rows(await self._fetch_template(template, params), as_dict)
+    
+    async def select_after(
+        self,
+        table: str,
+        cursor_col: str,
+        after_value: Any,
+        limit: int,
+        columns: Optional[List[str]] = None,
+        as_dict: bool = False
+    ) -> List[_Row]:
+        """
+        Keyset (seek) pagination: rows with ``cursor_col > after_value``.
+        
+        Prefer this over ``select(..., offset=N)`` for deep pages. OFFSET
+        makes PostgreSQL read and discard N rows, while a seek on an indexed
+        ``cursor_col`` costs the same on every page. Pass ``after_value=None``
+        for the first page, then the last row's ``cursor_col`` value.
         
-        return await self.execute_query(query, params, use_read_replica=use_read_replica)
+        Raises:
+            ValueError: If ``table`` or ``cursor_col`` is not a plain identifier
+        """
+        template = _select_after_sql(
+            table, tuple(columns or ()), cursor_col, after_value is None
+        )
+        rows = await self._fetch_template(template, {"after": after_value, "limit": limit})
+        return self._rows(rows, as_dict)
     
     async def subscribe(
         self,
@@ -277,8 +907,17 @@ class LocalAdapter(DatabaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> str:
         """Subscribe to real-time changes."""
+        if not LocalAdapter._warned_no_realtime:
+            logger.warning("Real-time subscriptions require PostgreSQL triggers and LISTEN/NOTIFY to be configured")
+            LocalAdapter._warned_no_realtime = True
+        
         subscription_id = str(uuid.uuid4())
-        logger.warning("Real-time subscriptions require PostgreSQL triggers and LISTEN/NOTIFY to be configured")
+        self._subscriptions[subscription_id] = {
+            "table": table,
+            "event": event,
+            "callback": callback,
+            "where": where
+        }
         return subscription_id
     
     async def unsubscribe(self, subscription_id: str) -> None:
@@ -290,33 +929,73 @@ class LocalAdapter(DatabaseAdapter):
         """Begin a transaction."""
         return self.get_session()
     
+    async def _cached_schema(
+        self,
+        key: Tuple[str, str],
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return a cached introspection result, loading it at most once per TTL.
+        
+        Concurrent misses for the same key wait on one loader call.
+        """
+        entry = self._schema_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        
+        lock = self._schema_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._schema_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            
+            value = await loader()
+            self._schema_cache[key] = (time.monotonic() + SCHEMA_CACHE_TTL_SECONDS, value)
+            return value
+    
+    def invalidate_schema_cache(self, table: Optional[str] = None) -> None:
+        """Drop cached introspection results for one table, or all of them."""
+        if table is None:
+            self._schema_cache.clear()
+            return
+        
+        self._schema_cache.pop(("exists", table), None)
+        self._schema_cache.pop(("schema", table), None)
+    
     async def table_exists(self, table: str) -> bool:
-        """Check if table exists."""
-        query = """
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_name = :table_name
-        )
         """
-        result = await self.execute_query(query, {"table_name": table})
-        return result[0]["exists"] if result else False
-    
-    async def get_table_schema(self, table: str) -> List[Dict[str, Any]]:
-        """Get table schema."""
-        query = """
-        SELECT 
-            column_name,
-            data_type,
-            is_nullable,
-            column_default
-        FROM information_schema.columns
-        WHERE table_name = :table_name
-        ORDER BY ordinal_position
+        Check if a table exists (cached).
+        
+        ``table`` is resolved like in a query: through search_path, or as
+        ``schema.table``. Views, materialized views and foreign tables count.
+        """
+        async def load() -> bool:
+            return bool(await self.fetch_value(_TABLE_EXISTS_SQL, {"table_name": table}))
+        
+        return await self._cached_schema(("exists", table), load)
+    
+    async def get_table_schema(self, table: str) -> List["Record"]:
         """
-        return await self.execute_query(query, {"table_name": table})
+        Get table schema (cached).
+        
+        ``data_type`` comes from format_type(), so it includes modifiers
+        (e.g. ``character varying(255)``).
+        """
+        async def load() -> List["Record"]:
+            return await self.execute_query(_TABLE_SCHEMA_SQL, {"table_name": table})
+        
+        return list(await self._cached_schema(("schema", table), load))
     
     def get_connection_stats(self) -> Dict[str, Any]:
-        """Get connection statistics."""
+        """
+        Get connection statistics.
+        
+        ``pool`` is the SQLAlchemy engine pool (sessions and plain
+        mutations); ``asyncpg_pool`` serves reads and writes with
+        ``returning``. Each reports ``saturation`` (in use / capacity) and
+        ``saturated`` once it passes POOL_SATURATION_WARNING, for callers
+        that alert on it.
+        """
         stats = {
             "provider": "local",
             "initialized": self._initialized
@@ -324,11 +1003,32 @@ class LocalAdapter(DatabaseAdapter):
         
         if self._engine:
             pool = self._engine.pool
+            checked_out = pool.checkedout()
+            capacity = self._pool_capacity
+            saturation = checked_out / capacity if capacity else 0.0
+            
             stats["pool"] = {
                 "size": pool.size(),
                 "checked_in": pool.checkedin(),
                 "overflow": pool.overflow(),
-                "checked_out": pool.checkedout()
+                "checked_out": checked_out,
+                "saturation": round(saturation, 3),
+                "saturated": saturation > POOL_SATURATION_WARNING
+            }
+        
+        if self._asyncpg_pool:
+            size = self._asyncpg_pool.get_size()
+            idle = self._asyncpg_pool.get_idle_size()
+            max_size = self._asyncpg_pool.get_max_size()
+            saturation = (size - idle) / max_size if max_size else 0.0
+            
+            stats["asyncpg_pool"] = {
+                "size": size,
+                "idle": idle,
+                "in_use": size - idle,
+                "max_size": max_size,
+                "saturation": round(saturation, 3),
+                "saturated": saturation > POOL_SATURATION_WARNING
             }
         
         return stats
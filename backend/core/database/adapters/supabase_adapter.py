@@ -5,8 +5,10 @@ Wraps existing Supabase client to conform to DatabaseAdapter interface.
 Maintains backward compatibility with existing codebase.
 """
 
-from typing import Optional, Dict, Any, List, AsyncIterator, Callable
+from typing import Optional, Dict, Any, List, Callable, Mapping, Sequence, Tuple
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import os
 
 from ..adapter import DatabaseAdapter, RealtimeEvent
@@ -15,6 +17,28 @@ from core.services.supabase import get_supabase_client
 from core.utils.logger import logger
 
 
+# Statements issued on every health check / introspection call, compiled once
+_SELECT_1 = text("SELECT 1")
+
+_TABLE_EXISTS = text("""
+SELECT EXISTS (
+    SELECT FROM information_schema.tables 
+    WHERE table_name = :table_name
+)
+""")
+
+_TABLE_SCHEMA = text("""
+SELECT 
+    column_name,
+    data_type,
+    is_nullable,
+    column_default
+FROM information_schema.columns
+WHERE table_name = :table_name
+ORDER BY ordinal_position
+""")
+
+
 class SupabaseAdapter(DatabaseAdapter):
     """
     Adapter for Supabase (existing implementation).
@@ -52,7 +76,7 @@ class SupabaseAdapter(DatabaseAdapter):
         """Check Supabase health."""
         try:
             async with get_session() as session:
-                result = await session.execute("SELECT 1")
+                result = await session.execute(_SELECT_1)
                 return {
                     "status": "healthy",
                     "provider": "supabase",
@@ -78,19 +102,55 @@ class SupabaseAdapter(DatabaseAdapter):
         self,
         query: str,
         params: Optional[Dict[str, Any]] = None,
-        use_read_replica: bool = False
-    ) -> List[Dict[str, Any]]:
-        """Execute a query using existing infrastructure."""
+        use_read_replica: bool = False,
+        session: Optional[AsyncSession] = None
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Execute a query using existing infrastructure.
+        
+        Pass ``session`` to run on a session the caller already holds
+        instead of checking out a new one.
+        """
+        if session is not None:
+            result = await session.execute(text(query), params or {})
+            return result.mappings().all()
+        
         return await execute_query(query, params, use_read_replica=use_read_replica)
     
+    async def execute_many_queries(
+        self,
+        queries: List[Tuple[str, Optional[Dict[str, Any]]]],
+        use_read_replica: bool = False
+    ) -> List[Sequence[Mapping[str, Any]]]:
+        """
+        Run independent queries concurrently, each on its own pooled connection.
+        
+        Total latency is that of the slowest query rather than the sum.
+        Results are returned in the same order as ``queries``.
+        """
+        return list(await asyncio.gather(*[
+            self.execute_query(query, params, use_read_replica=use_read_replica)
+            for query, params in queries
+        ]))
+    
     async def execute_mutation(
         self,
         query: str,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        session: Optional[AsyncSession] = None
     ) -> int:
-        """Execute a mutation query."""
+        """
+        Execute a mutation query.
+        
+        With ``session``, the statement joins the caller's session and is
+        not committed here; the caller owns the transaction.
+        """
+        if session is not None:
+            result = await session.execute(text(query), params or {})
+            return result.rowcount
+        
         async with get_session() as session:
-            result = await session.execute(query, params or {})
+            result = await session.execute(text(query), params or {})
             await session.commit()
             return result.rowcount
     
@@ -204,28 +264,15 @@ class SupabaseAdapter(DatabaseAdapter):
     
     async def table_exists(self, table: str) -> bool:
         """Check if table exists."""
-        query = """
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_name = :table_name
-        )
-        """
-        result = await self.execute_query(query, {"table_name": table})
-        return result[0]["exists"] if result else False
+        async with get_read_session() as session:
+            result = await session.execute(_TABLE_EXISTS, {"table_name": table})
+            return bool(result.scalar())
     
     async def get_table_schema(self, table: str) -> List[Dict[str, Any]]:
         """Get table schema."""
-        query = """
-        SELECT 
-            column_name,
-            data_type,
-            is_nullable,
-            column_default
-        FROM information_schema.columns
-        WHERE table_name = :table_name
-        ORDER BY ordinal_position
-        """
-        return await self.execute_query(query, {"table_name": table})
+        async with get_read_session() as session:
+            result = await session.execute(_TABLE_SCHEMA, {"table_name": table})
+            return result.mappings().all()
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
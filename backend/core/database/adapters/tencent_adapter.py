@@ -8,18 +8,120 @@ Supports:
 Similar to Aliyun adapter but configured for Tencent Cloud.
 """
 
-from typing import Optional, Dict, Any, List, Callable
-from sqlalchemy import text
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable, Hashable, Mapping, NamedTuple, Sequence, Set, Tuple, Union
+from sqlalchemy import text, Table, MetaData, insert, update, delete, select, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import Executable
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
 from sqlalchemy.pool import AsyncAdaptedQueuePool
+from collections import defaultdict
 from contextlib import asynccontextmanager
+from decimal import Decimal
+from functools import lru_cache, partial
+import asyncio
 import os
+import re
+import time
 import uuid
 
+import orjson
+
 from ..adapter import DatabaseAdapter, RealtimeEvent
 from core.utils.logger import logger
 
 
+class TencentRDSConfig(NamedTuple):
+    """Tencent Cloud RDS connection settings read from the environment."""
+    host: Optional[str]
+    port: str
+    database: str
+    username: Optional[str]
+    password: Optional[str]
+    read_host: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _tencent_config() -> TencentRDSConfig:
+    """Read TENCENT_RDS_* settings once per process."""
+    return TencentRDSConfig(
+        host=os.getenv("TENCENT_RDS_HOST"),
+        port=os.getenv("TENCENT_RDS_PORT", "5432"),
+        database=os.getenv("TENCENT_RDS_DATABASE", "kortix"),
+        username=os.getenv("TENCENT_RDS_USERNAME"),
+        password=os.getenv("TENCENT_RDS_PASSWORD"),
+        read_host=os.getenv("TENCENT_RDS_READ_HOST"),
+    )
+
+
+def _engine_options() -> Dict[str, Any]:
+    """Engine/pool keyword arguments shared by the primary and read engines."""
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", "40")),
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        # Ping on checkout so connections dropped by the server/LB are replaced
+        # before use; LIFO hands out the most recently used (warm) connection
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+        "echo": False,
+    }
+
+
+HEALTH_CHECK_TTL_SECONDS = 5.0
+
+# select_by_id_batched: how long to gather lookups, and the id count that
+# triggers an early flush
+BATCH_WINDOW_SECONDS = 0.002
+BATCH_MAX_IDS = 1000
+
+_SELECT_1 = text("SELECT 1")
+
+# Statements that can leave a reflected Table out of date
+_DDL_RE = re.compile(r"^\s*(ALTER|CREATE|DROP)\b", re.IGNORECASE)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def serialize_rows(rows: Sequence[Mapping[str, Any]]) -> bytes:
+    """
+    Serialize query rows to a JSON array (bytes) with orjson.
+    
+    datetimes, dates and UUIDs are encoded natively; naive datetimes are
+    taken as UTC (``+00:00``). Decimals become strings, and any other type
+    raises TypeError. orjson does not serialize RowMapping directly: each
+    row goes through _json_default, which copies it into a dict.
+    """
+    return orjson.dumps(rows, default=_json_default, option=orjson.OPT_NAIVE_UTC)
+
+
+def _as_statement(query: Union[str, Executable]) -> Executable:
+    return text(query) if isinstance(query, str) else query
+
+
+class _PendingLookup:
+    """Id lookups gathered for one (table, id_col, replica) batch."""
+    __slots__ = ("ids", "waiters", "timer")
+    
+    def __init__(self):
+        self.ids: Set[Hashable] = set()
+        self.waiters: List[Tuple[List[Hashable], "asyncio.Future[List[Mapping[str, Any]]]"]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+def _fail_waiters(batch: _PendingLookup, error: BaseException) -> None:
+    for _, future in batch.waiters:
+        if not future.done():
+            future.set_exception(error)
+
+
 class TencentAdapter(DatabaseAdapter):
     """
     Adapter for Tencent Cloud TDSQL-C/PostgreSQL.
@@ -31,6 +133,7 @@ class TencentAdapter(DatabaseAdapter):
     - TENCENT_RDS_USERNAME: Database username
     - TENCENT_RDS_PASSWORD: Database password
     - TENCENT_RDS_READ_HOST: Optional read replica host
+    - DB_POOL_SIZE / DB_POOL_MAX_OVERFLOW: Pool sizing per engine (default: 20/40)
     """
     
     def __init__(self):
@@ -38,21 +141,26 @@ class TencentAdapter(DatabaseAdapter):
         self._read_engine: Optional[AsyncEngine] = None
         self._session_factory: Optional[async_sessionmaker] = None
         self._read_session_factory: Optional[async_sessionmaker] = None
+        # Replica factory if configured, else the primary; fixed at initialize()
+        self._read_factory_effective: Optional[async_sessionmaker] = None
+        self._primary_url: Optional[str] = None
+        self._read_url: Optional[str] = None
+        self._last_health_ok: float = 0.0
+        self._tables: Dict[str, Table] = {}
+        self._pending_lookups: Dict[Tuple[str, str, bool], _PendingLookup] = {}
+        self._lookup_tasks: Set["asyncio.Task[None]"] = set()
         self._initialized = False
         self._subscriptions: Dict[str, Dict[str, Any]] = {}
     
     def _get_database_url(self, read_replica: bool = False) -> str:
         """Build database connection URL."""
-        host = os.getenv("TENCENT_RDS_READ_HOST") if read_replica else os.getenv("TENCENT_RDS_HOST")
-        port = os.getenv("TENCENT_RDS_PORT", "5432")
-        database = os.getenv("TENCENT_RDS_DATABASE", "kortix")
-        username = os.getenv("TENCENT_RDS_USERNAME")
-        password = os.getenv("TENCENT_RDS_PASSWORD")
+        cfg = _tencent_config()
+        host = cfg.read_host if read_replica else cfg.host
         
-        if not all([host, username, password]):
+        if not all([host, cfg.username, cfg.password]):
             raise ValueError("Missing required Tencent Cloud RDS configuration")
         
-        return f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
+        return f"postgresql+asyncpg://{cfg.username}:{cfg.password}@{host}:{cfg.port}/{cfg.database}"
     
     async def initialize(self) -> None:
         """Initialize Tencent Cloud connection."""
@@ -60,16 +168,8 @@ class TencentAdapter(DatabaseAdapter):
             return
         
         try:
-            primary_url = self._get_database_url()
-            self._engine = create_async_engine(
-                primary_url,
-                poolclass=AsyncAdaptedQueuePool,
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30,
-                pool_recycle=3600,
-                echo=False
-            )
+            self._primary_url = self._get_database_url()
+            self._engine = create_async_engine(self._primary_url, **_engine_options())
             
             self._session_factory = async_sessionmaker(
                 self._engine,
@@ -77,17 +177,9 @@ class TencentAdapter(DatabaseAdapter):
                 expire_on_commit=False
             )
             
-            if os.getenv("TENCENT_RDS_READ_HOST"):
-                read_url = self._get_database_url(read_replica=True)
-                self._read_engine = create_async_engine(
-                    read_url,
-                    poolclass=AsyncAdaptedQueuePool,
-                    pool_size=5,
-                    max_overflow=10,
-                    pool_timeout=30,
-                    pool_recycle=3600,
-                    echo=False
-                )
+            if _tencent_config().read_host:
+                self._read_url = self._get_database_url(read_replica=True)
+                self._read_engine = create_async_engine(self._read_url, **_engine_options())
                 
                 self._read_session_factory = async_sessionmaker(
                     self._read_engine,
@@ -96,8 +188,16 @@ class TencentAdapter(DatabaseAdapter):
                 )
                 logger.info("Tencent Cloud read replica configured")
             
+            self._read_factory_effective = self._read_session_factory or self._session_factory
+            
             async with self._engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_SELECT_1)
+            
+            # Open pool_size connections up front so the first requests do
+            # not pay TCP/TLS/auth setup
+            await self._warm_pool(self._engine)
+            if self._read_engine:
+                await self._warm_pool(self._read_engine)
             
             self._initialized = True
             logger.info("Tencent Cloud adapter initialized")
@@ -106,8 +206,27 @@ class TencentAdapter(DatabaseAdapter):
             logger.error(f"Failed to initialize Tencent adapter: {e}")
             raise
     
+    @staticmethod
+    async def _warm_pool(engine: AsyncEngine) -> None:
+        """Check out pool_size connections concurrently and return them to the pool."""
+        conns = await asyncio.gather(
+            *[engine.connect() for _ in range(engine.pool.size())],
+            return_exceptions=True
+        )
+        
+        for conn in conns:
+            if isinstance(conn, BaseException):
+                logger.warning(f"Tencent pool warm-up connection failed: {conn}")
+            else:
+                await conn.close()
+    
     async def close(self) -> None:
-        """Close connections."""
+        """Close connections, first running any batched lookups still pending."""
+        for key, batch in list(self._pending_lookups.items()):
+            self._flush_lookup(key, batch)
+        if self._lookup_tasks:
+            await asyncio.gather(*self._lookup_tasks, return_exceptions=True)
+        
         if self._engine:
             await self._engine.dispose()
         
@@ -115,29 +234,48 @@ class TencentAdapter(DatabaseAdapter):
             await self._read_engine.dispose()
         
         self._initialized = False
+        self._last_health_ok = 0.0
         logger.info("Tencent Cloud adapter closed")
     
     async def health_check(self) -> Dict[str, Any]:
-        """Check health."""
+        """
+        Check health.
+        
+        After a successful SELECT 1, further calls within
+        HEALTH_CHECK_TTL_SECONDS answer from pool counters alone, without a
+        round trip; failures are never cached.
+        """
         if not self._initialized:
             return {"status": "unhealthy", "provider": "tencent", "error": "Not initialized"}
         
+        if time.monotonic() - self._last_health_ok < HEALTH_CHECK_TTL_SECONDS:
+            return self._healthy_status()
+        
         try:
             async with self._engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
-                return {
-                    "status": "healthy",
-                    "provider": "tencent",
-                    "host": os.getenv("TENCENT_RDS_HOST"),
-                    "database": os.getenv("TENCENT_RDS_DATABASE"),
-                    "has_read_replica": self._read_engine is not None
-                }
+                await conn.execute(_SELECT_1)
         except Exception as e:
+            self._last_health_ok = 0.0
             return {
                 "status": "unhealthy",
                 "provider": "tencent",
                 "error": str(e)
             }
+        
+        self._last_health_ok = time.monotonic()
+        return self._healthy_status()
+    
+    def _healthy_status(self) -> Dict[str, Any]:
+        pool = self._engine.pool
+        return {
+            "status": "healthy",
+            "provider": "tencent",
+            "host": _tencent_config().host,
+            "database": _tencent_config().database,
+            "has_read_replica": self._read_engine is not None,
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow()
+        }
     
     @asynccontextmanager
     async def get_session(self) -> AsyncSession:
@@ -151,7 +289,7 @@ class TencentAdapter(DatabaseAdapter):
     @asynccontextmanager
     async def get_read_session(self) -> AsyncSession:
         """Get a read-only session."""
-        factory = self._read_session_factory or self._session_factory
+        factory = self._read_factory_effective
         if not factory:
             raise RuntimeError("Tencent adapter not initialized")
         
@@ -160,23 +298,70 @@ class TencentAdapter(DatabaseAdapter):
     
     async def execute_query(
         self,
-        query: str,
+        query: Union[str, Executable],
         params: Optional[Dict[str, Any]] = None,
         use_read_replica: bool = False
-    ) -> List[Dict[str, Any]]:
-        """Execute a query."""
-        factory = self._read_session_factory if (use_read_replica and self._read_session_factory) else self._session_factory
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Execute a query.
+        
+        Rows are returned as read-only RowMapping views rather than copied
+        into dicts; call dict(row) where a mutable copy is needed.
+        """
+        factory = self._read_factory_effective if use_read_replica else self._session_factory
         
         if not factory:
             raise RuntimeError("Tencent adapter not initialized")
         
         async with factory() as session:
-            result = await session.execute(text(query), params or {})
-            return [dict(row._mapping) for row in result]
+            result = await session.execute(_as_statement(query), params or {})
+            return result.mappings().all()
+    
+    async def execute_query_json(
+        self,
+        query: Union[str, Executable],
+        params: Optional[Dict[str, Any]] = None,
+        use_read_replica: bool = False
+    ) -> bytes:
+        """Execute a query and return the rows as a JSON array, ready to send."""
+        return serialize_rows(
+            await self.execute_query(query, params, use_read_replica=use_read_replica)
+        )
+    
+    async def execute_query_stream(
+        self,
+        query: Union[str, Executable],
+        params: Optional[Dict[str, Any]] = None,
+        use_read_replica: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a query and yield rows from a server-side cursor.
+        
+        Memory stays constant regardless of result size, so prefer this over
+        execute_query for exports and bulk migrations.
+        """
+        factory = self._read_factory_effective if use_read_replica else self._session_factory
+        
+        if not factory:
+            raise RuntimeError("Tencent adapter not initialized")
+        
+        async with factory() as session:
+            result = await session.stream(_as_statement(query), params or {})
+            async for row in result.mappings():
+                yield dict(row)
+    
+    async def _scalar(self, query: Union[str, Executable], params: Optional[Dict[str, Any]] = None) -> Any:
+        """Run a single-row, single-column query and return that value."""
+        if not self._session_factory:
+            raise RuntimeError("Tencent adapter not initialized")
+        
+        async with self._session_factory() as session:
+            result = await session.execute(_as_statement(query), params or {})
+            return result.scalar_one()
     
     async def execute_mutation(
         self,
-        query: str,
+        query: Union[str, Executable],
         params: Optional[Dict[str, Any]] = None
     ) -> int:
         """Execute a mutation query."""
@@ -184,28 +369,71 @@ class TencentAdapter(DatabaseAdapter):
             raise RuntimeError("Tencent adapter not initialized")
         
         async with self._session_factory() as session:
-            result = await session.execute(text(query), params or {})
+            result = await session.execute(_as_statement(query), params or {})
+            await session.commit()
+        
+        if isinstance(query, str) and _DDL_RE.match(query):
+            self.invalidate_table_cache()
+        
+        return result.rowcount
+    
+    async def _execute_returning(self, stmt: Executable) -> Optional[Mapping[str, Any]]:
+        """Run a mutation with RETURNING, commit it, and return the first row."""
+        if not self._session_factory:
+            raise RuntimeError("Tencent adapter not initialized")
+        
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            row = result.mappings().first()
             await session.commit()
-            return result.rowcount
+            return row
+    
+    async def _table(self, name: str) -> Table:
+        """
+        Reflected Table for ``name``, loaded once and cached.
+        
+        Core statements built on it compile to the same SQL for the same
+        shape, so SQLAlchemy's compiled cache and asyncpg's prepared
+        statement cache both hit on repeat calls.
+        """
+        tbl = self._tables.get(name)
+        if tbl is None:
+            if not self._engine:
+                raise RuntimeError("Tencent adapter not initialized")
+            
+            schema, _, table_name = name.rpartition(".")
+            async with self._engine.connect() as conn:
+                tbl = await conn.run_sync(
+                    lambda sync_conn: Table(
+                        table_name, MetaData(), schema=schema or None, autoload_with=sync_conn
+                    )
+                )
+            self._tables[name] = tbl
+        
+        return tbl
+    
+    def invalidate_table_cache(self, table: Optional[str] = None) -> None:
+        """Drop cached reflections (all, or one table) after a schema change."""
+        if table is None:
+            self._tables.clear()
+        else:
+            self._tables.pop(table, None)
     
     async def insert(
         self,
         table: str,
         data: Dict[str, Any],
         returning: Optional[List[str]] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Mapping[str, Any]]:
         """Insert a row."""
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(f":{key}" for key in data.keys())
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        tbl = await self._table(table)
+        stmt = insert(tbl).values(**data)
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
-            result = await self.execute_query(query, data)
-            return result[0] if result else None
-        else:
-            await self.execute_mutation(query, data)
-            return None
+            return await self._execute_returning(stmt.returning(*[tbl.c[col] for col in returning]))
+        
+        await self.execute_mutation(stmt)
+        return None
     
     async def update(
         self,
@@ -213,41 +441,46 @@ class TencentAdapter(DatabaseAdapter):
         data: Dict[str, Any],
         where: Dict[str, Any],
         returning: Optional[List[str]] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Update rows."""
-        set_clause = ", ".join(f"{key} = :data_{key}" for key in data.keys())
-        where_clause = " AND ".join(f"{key} = :where_{key}" for key in where.keys())
-        
-        params = {f"data_{k}": v for k, v in data.items()}
-        params.update({f"where_{k}": v for k, v in where.items()})
+    ) -> Optional[Mapping[str, Any]]:
+        """
+        Update rows.
         
-        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+        Raises:
+            ValueError: If ``where`` is empty (it would update every row)
+        """
+        if not where:
+            raise ValueError("update: where must not be empty")
+        tbl = await self._table(table)
+        stmt = update(tbl).where(*[tbl.c[key] == value for key, value in where.items()]).values(**data)
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
-            result = await self.execute_query(query, params)
-            return result[0] if result else None
-        else:
-            await self.execute_mutation(query, params)
-            return None
+            return await self._execute_returning(stmt.returning(*[tbl.c[col] for col in returning]))
+        
+        await self.execute_mutation(stmt)
+        return None
     
     async def delete(
         self,
         table: str,
         where: Dict[str, Any],
         returning: Optional[List[str]] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Delete rows."""
-        where_clause = " AND ".join(f"{key} = :{key}" for key in where.keys())
-        query = f"DELETE FROM {table} WHERE {where_clause}"
+    ) -> Optional[Mapping[str, Any]]:
+        """
+        Delete rows.
+        
+        Raises:
+            ValueError: If ``where`` is empty (it would delete every row)
+        """
+        if not where:
+            raise ValueError("delete: where must not be empty")
+        tbl = await self._table(table)
+        stmt = delete(tbl).where(*[tbl.c[key] == value for key, value in where.items()])
         
         if returning:
-            query += f" RETURNING {', '.join(returning)}"
-            result = await self.execute_query(query, where)
-            return result[0] if result else None
-        else:
-            await self.execute_mutation(query, where)
-            return None
+            return await self._execute_returning(stmt.returning(*[tbl.c[col] for col in returning]))
+        
+        await self.execute_mutation(stmt)
+        return None
     
     async def select(
         self,
@@ -258,27 +491,108 @@ class TencentAdapter(DatabaseAdapter):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         use_read_replica: bool = True
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Mapping[str, Any]]:
         """Select rows."""
-        cols = ", ".join(columns) if columns else "*"
-        query = f"SELECT {cols} FROM {table}"
-        params = {}
+        tbl = await self._table(table)
+        stmt = select(*[tbl.c[col] for col in columns]) if columns else select(tbl)
         
         if where:
-            where_clause = " AND ".join(f"{key} = :{key}" for key in where.keys())
-            query += f" WHERE {where_clause}"
-            params = where
+            stmt = stmt.where(*[tbl.c[key] == value for key, value in where.items()])
         
         if order_by:
-            query += f" ORDER BY {order_by}"
+            stmt = stmt.order_by(text(order_by))
         
         if limit:
-            query += f" LIMIT {limit}"
+            stmt = stmt.limit(limit)
         
         if offset:
-            query += f" OFFSET {offset}"
+            stmt = stmt.offset(offset)
+        
+        return await self.execute_query(stmt, use_read_replica=use_read_replica)
+    
+    async def select_by_id_batched(
+        self,
+        table: str,
+        id_col: str,
+        ids: Sequence[Hashable],
+        use_read_replica: bool = True
+    ) -> List[Mapping[str, Any]]:
+        """
+        Fetch the rows whose ``id_col`` is in ``ids``, coalescing concurrent calls.
+        
+        Lookups against the same table/column arriving within
+        BATCH_WINDOW_SECONDS are merged into one
+        ``SELECT * ... WHERE id_col = ANY(:ids)``, and each caller gets back
+        only its own rows (in ``ids`` order). Use it for bursts of small
+        by-id reads, e.g. concurrent request handlers; select() is
+        unaffected. ``ids`` must use the column's Python type (e.g. UUID, not
+        str) so rows can be matched back to callers.
+        """
+        if not ids:
+            return []
         
-        return await self.execute_query(query, params, use_read_replica=use_read_replica)
+        key = (table, id_col, use_read_replica)
+        loop = asyncio.get_running_loop()
+        
+        batch = self._pending_lookups.get(key)
+        if batch is None:
+            batch = self._pending_lookups[key] = _PendingLookup()
+            batch.timer = loop.call_later(BATCH_WINDOW_SECONDS, self._flush_lookup, key, batch)
+        
+        wanted = list(dict.fromkeys(ids))
+        future = loop.create_future()
+        batch.ids.update(wanted)
+        batch.waiters.append((wanted, future))
+        
+        if len(batch.ids) >= BATCH_MAX_IDS:
+            self._flush_lookup(key, batch)
+        
+        return await future
+    
+    def _flush_lookup(self, key: Tuple[str, str, bool], batch: _PendingLookup) -> None:
+        # The window timer may already be queued when a size-triggered flush runs
+        if self._pending_lookups.get(key) is not batch:
+            return
+        del self._pending_lookups[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        
+        task = asyncio.create_task(self._run_lookup(key, batch))
+        self._lookup_tasks.add(task)
+        task.add_done_callback(partial(self._lookup_done, key, batch))
+    
+    def _lookup_done(
+        self, key: Tuple[str, str, bool], batch: _PendingLookup, task: "asyncio.Task[None]"
+    ) -> None:
+        self._lookup_tasks.discard(task)
+        # A task cancelled before its first step never enters _run_lookup's
+        # try/finally, so waiters are failed here as well
+        _fail_waiters(batch, RuntimeError(f"Batched lookup on {key[0]}.{key[1]} was cancelled"))
+    
+    async def _run_lookup(self, key: Tuple[str, str, bool], batch: _PendingLookup) -> None:
+        table, id_col, use_read_replica = key
+        error: BaseException = RuntimeError(f"Batched lookup on {table}.{id_col} was cancelled")
+        
+        try:
+            tbl = await self._table(table)
+            col = tbl.c[id_col]
+            stmt = select(tbl).where(col == any_(bindparam("ids", type_=ARRAY(col.type))))
+            rows = await self.execute_query(
+                stmt, {"ids": list(batch.ids)}, use_read_replica=use_read_replica
+            )
+            
+            by_id: Dict[Hashable, List[Mapping[str, Any]]] = defaultdict(list)
+            for row in rows:
+                by_id[row[id_col]].append(row)
+            
+            for wanted, future in batch.waiters:
+                if not future.done():
+                    future.set_result([row for id_value in wanted for row in by_id.get(id_value, ())])
+        except Exception as e:
+            error = e
+        finally:
+            # Never leave a caller waiting, including when this task is cancelled
+            _fail_waiters(batch, error)
     
     async def subscribe(
         self,
@@ -309,10 +623,9 @@ class TencentAdapter(DatabaseAdapter):
             WHERE table_name = :table_name
         )
         """
-        result = await self.execute_query(query, {"table_name": table})
-        return result[0]["exists"] if result else False
+        return bool(await self._scalar(query, {"table_name": table}))
     
-    async def get_table_schema(self, table: str) -> List[Dict[str, Any]]:
+    async def get_table_schema(self, table: str) -> Sequence[Mapping[str, Any]]:
         """Get table schema."""
         query = """
         SELECT 
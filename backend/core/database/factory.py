@@ -8,8 +8,11 @@ Supports:
 - Local PostgreSQL (self-hosted)
 """
 
-from typing import Optional
+from typing import Optional, Callable, Dict, Tuple
+from contextvars import ContextVar
 from enum import Enum
+from functools import lru_cache
+import importlib
 import os
 
 from core.utils.logger import logger
@@ -24,13 +27,48 @@ class DatabaseProvider(str, Enum):
     LOCAL = "local"
 
 
+# Process-wide adapter, used by every context without an override
 _adapter_instance: Optional[DatabaseAdapter] = None
 
+# Per-context override: a test (or task) can _adapter_cv.set(MockAdapter())
+# and see its own adapter without affecting concurrently running ones
+_adapter_cv: ContextVar[Optional[DatabaseAdapter]] = ContextVar("db_adapter", default=None)
 
+# Adapter modules are imported on first use so that one provider does not pull
+# in another's client libraries (the adapters package imports them lazily too)
+_ADAPTER_PATHS: Dict[DatabaseProvider, Tuple[str, str]] = {
+    DatabaseProvider.SUPABASE: (".adapters.supabase_adapter", "SupabaseAdapter"),
+    DatabaseProvider.ALIYUN: (".adapters.aliyun_adapter", "AliyunAdapter"),
+    DatabaseProvider.TENCENT: (".adapters.tencent_adapter", "TencentAdapter"),
+    DatabaseProvider.LOCAL: (".adapters.local_adapter", "LocalAdapter"),
+}
+
+_PROVIDER_CLASSES: Dict[DatabaseProvider, Callable[[], DatabaseAdapter]] = {}
+
+
+def _load_class(provider: DatabaseProvider) -> Callable[[], DatabaseAdapter]:
+    """Import the adapter class for a provider once and cache it."""
+    adapter_cls = _PROVIDER_CLASSES.get(provider)
+    if adapter_cls is None:
+        path = _ADAPTER_PATHS.get(provider)
+        if path is None:
+            raise ValueError(f"Unsupported database provider: {provider}")
+        
+        module_name, class_name = path
+        adapter_cls = getattr(importlib.import_module(module_name, __package__), class_name)
+        _PROVIDER_CLASSES[provider] = adapter_cls
+    
+    return adapter_cls
+
+
+@lru_cache(maxsize=1)
 def get_database_provider() -> DatabaseProvider:
     """
     Determine which database provider to use based on environment variables.
     
+    Detected once per process; call ``get_database_provider.cache_clear()``
+    after changing the environment (e.g. in tests).
+    
     Priority:
     1. CLOUD_PROVIDER env var (aliyun, tencent, local, supabase)
     2. DATABASE_PROVIDER env var (backward compatibility)
@@ -74,38 +112,39 @@ def get_database_provider() -> DatabaseProvider:
 
 def get_database_adapter(force_new: bool = False) -> DatabaseAdapter:
     """
-    Get the database adapter instance (singleton).
+    Get the database adapter instance.
+    
+    Returns the current context's override (``_adapter_cv``) if one is set,
+    otherwise the process-wide singleton.
     
     Args:
-        force_new: Force creation of a new adapter instance
+        force_new: Force creation of a new adapter instance; it replaces the
+            override if one is set, otherwise the singleton. The provider is
+            detected from the environment again
         
     Returns:
         DatabaseAdapter instance for the configured provider
     """
     global _adapter_instance
     
-    if _adapter_instance is not None and not force_new:
-        return _adapter_instance
+    override = _adapter_cv.get()
+    if not force_new:
+        if override is not None:
+            return override
+        if _adapter_instance is not None:
+            return _adapter_instance
+    else:
+        get_database_provider.cache_clear()
     
     provider = get_database_provider()
     logger.info(f"Initializing database adapter for provider: {provider.value}")
     
-    if provider == DatabaseProvider.SUPABASE:
-        from .adapters.supabase_adapter import SupabaseAdapter
-        _adapter_instance = SupabaseAdapter()
-    elif provider == DatabaseProvider.ALIYUN:
-        from .adapters.aliyun_adapter import AliyunAdapter
-        _adapter_instance = AliyunAdapter()
-    elif provider == DatabaseProvider.TENCENT:
-        from .adapters.tencent_adapter import TencentAdapter
-        _adapter_instance = TencentAdapter()
-    elif provider == DatabaseProvider.LOCAL:
-        from .adapters.local_adapter import LocalAdapter
-        _adapter_instance = LocalAdapter()
+    adapter = _load_class(provider)()
+    if override is not None:
+        _adapter_cv.set(adapter)
     else:
-        raise ValueError(f"Unsupported database provider: {provider}")
-    
-    return _adapter_instance
+        _adapter_instance = adapter
+    return adapter
 
 
 async def initialize_database() -> DatabaseAdapter:
@@ -127,7 +166,13 @@ async def close_database() -> None:
     Should be called during application shutdown.
     """
     global _adapter_instance
-    if _adapter_instance:
+    
+    override = _adapter_cv.get()
+    if override is not None:
+        await override.close()
+        _adapter_cv.set(None)
+        logger.info("Database adapter closed")
+    elif _adapter_instance:
         await _adapter_instance.close()
         _adapter_instance = None
         logger.info("Database adapter closed")
@@ -14,10 +14,26 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Callable, Awaitable, TypeVar
+from datetime import datetime, timezone
 from enum import Enum
 from dataclasses import dataclass
+from weakref import WeakValueDictionary
+import asyncio
+import os
+import re
+
+
+# 批量发送时同时进行的请求数上限，避免触发服务商限流
+BULK_SEND_CONCURRENCY = int(os.getenv("BULK_SEND_CONCURRENCY", "16"))
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# 支持+86、86、不带前缀
+_PHONE_RE = re.compile(r'^(\+?86)?1[3-9]\d{9}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+_M = TypeVar("_M")
+_R = TypeVar("_R")
 
 
 class NotificationProvider(str, Enum):
@@ -45,14 +61,31 @@ class SMSStatus(str, Enum):
     FAILED = "failed"         # 失败
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class EmailRecipient:
     """邮件收件人"""
     email: str                          # 邮箱地址
     name: Optional[str] = None         # 收件人姓名
+    
+    @classmethod
+    def get(cls, email: str, name: Optional[str] = None) -> "EmailRecipient":
+        """
+        获取收件人实例（相同邮箱+姓名复用同一对象）
+        
+        批量发送时同一收件人不必重复创建；不再被引用的实例会自动回收。
+        """
+        key = (email, name)
+        recipient = _RECIPIENT_CACHE.get(key)
+        if recipient is None:
+            recipient = cls(email=email, name=name)
+            _RECIPIENT_CACHE[key] = recipient
+        return recipient
+
 
+_RECIPIENT_CACHE: "WeakValueDictionary[tuple, EmailRecipient]" = WeakValueDictionary()
 
-@dataclass
+
+@dataclass(slots=True)
 class EmailMessage:
     """邮件消息"""
     to: List[EmailRecipient]           # 收件人列表
@@ -67,16 +100,16 @@ class EmailMessage:
     attachments: Optional[List[Dict[str, Any]]] = None  # 附件
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailResult:
     """邮件发送结果"""
     message_id: str                    # 消息ID
     status: EmailStatus                # 状态
-    sent_at: datetime                  # 发送时间
+    sent_at: datetime                  # 发送时间（UTC，带时区）
     error: Optional[str] = None        # 错误信息
 
 
-@dataclass
+@dataclass(slots=True)
 class SMSMessage:
     """短信消息"""
     phone: str                         # 手机号
@@ -86,12 +119,12 @@ class SMSMessage:
     sign_name: Optional[str] = None    # 签名
 
 
-@dataclass
+@dataclass(slots=True)
 class SMSResult:
     """短信发送结果"""
     message_id: str                    # 消息ID
     status: SMSStatus                  # 状态
-    sent_at: datetime                  # 发送时间
+    sent_at: datetime                  # 发送时间（UTC，带时区）
     error: Optional[str] = None        # 错误信息
 
 
@@ -144,7 +177,7 @@ class NotificationAdapter(ABC):
             EmailResult: 发送结果
         """
         message = EmailMessage(
-            to=[EmailRecipient(email=to_email, name=to_name)],
+            to=[EmailRecipient.get(to_email, to_name)],
             subject=subject,
             html_content=html_content,
             text_content=text_content
@@ -279,20 +312,9 @@ class NotificationAdapter(ABC):
         Returns:
             List[EmailResult]: 发送结果列表
         """
-        results = []
-        for message in messages:
-            try:
-                result = await self.send_email(message)
-                results.append(result)
-            except Exception as e:
-                # 单个失败不影响其他
-                results.append(EmailResult(
-                    message_id="",
-                    status=EmailStatus.FAILED,
-                    sent_at=datetime.utcnow(),
-                    error=str(e)
-                ))
-        return results
+        return await self._send_concurrently(
+            self.send_email, messages, EmailResult, EmailStatus.FAILED
+        )
     
     async def send_bulk_sms(
         self,
@@ -307,19 +329,76 @@ class NotificationAdapter(ABC):
         Returns:
             List[SMSResult]: 发送结果列表
         """
-        results = []
-        for message in messages:
-            try:
-                result = await self.send_sms(message)
-                results.append(result)
-            except Exception as e:
-                results.append(SMSResult(
-                    message_id="",
-                    status=SMSStatus.FAILED,
-                    sent_at=datetime.utcnow(),
-                    error=str(e)
-                ))
-        return results
+        return await self._send_concurrently(
+            self.send_sms, messages, SMSResult, SMSStatus.FAILED
+        )
+    
+    async def send_template_sms_bulk(
+        self,
+        phones: List[str],
+        template_code: str,
+        template_params: Dict[str, str],
+        sign_name: Optional[str] = None
+    ) -> List[SMSResult]:
+        """
+        批量发送同一模板短信
+        
+        默认实现并发调用 send_template_sms（每个号码一次请求）。
+        支持批量接口的服务商（如阿里云 SendBatchSms、腾讯云 SendSms
+        多号码）应重写此方法，用一次 HTTPS 请求发送给全部号码。
+        
+        Args:
+            phones: 手机号列表
+            template_code: 模板代码
+            template_params: 模板参数（所有号码相同）
+            sign_name: 签名
+            
+        Returns:
+            List[SMSResult]: 发送结果列表，顺序与 phones 一致
+        """
+        return await self._send_concurrently(
+            lambda phone: self.send_template_sms(phone, template_code, template_params, sign_name),
+            phones,
+            SMSResult,
+            SMSStatus.FAILED
+        )
+    
+    async def _send_concurrently(
+        self,
+        send: Callable[[_M], Awaitable[_R]],
+        messages: List[_M],
+        result_type: Callable[..., _R],
+        failed_status: Enum
+    ) -> List[_R]:
+        """
+        并发发送，最多 BULK_SEND_CONCURRENCY 个请求同时进行
+        
+        总耗时约为最慢一批的网络往返，而不是逐条累加。
+        结果顺序与 messages 一致；单个失败不影响其他，失败项转换为
+        status=failed_status 的 result_type 结果。
+        """
+        semaphore = asyncio.Semaphore(BULK_SEND_CONCURRENCY)
+        
+        async def _send(message: _M) -> _R:
+            async with semaphore:
+                return await send(message)
+        
+        results = await asyncio.gather(
+            *(_send(message) for message in messages),
+            return_exceptions=True
+        )
+        # 整批共用一个失败时间戳
+        now = datetime.now(timezone.utc)
+        return [
+            # CancelledError 不是 Exception 的子类，需按 BaseException 判断
+            result_type(
+                message_id="",
+                status=failed_status,
+                sent_at=now,
+                error=str(result) or type(result).__name__
+            ) if isinstance(result, BaseException) else result
+            for result in results
+        ]
     
     # ========================================================================
     # 工具方法
@@ -335,9 +414,7 @@ class NotificationAdapter(ABC):
         Returns:
             bool: 是否有效
         """
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     def validate_phone(self, phone: str) -> bool:
         """
@@ -349,10 +426,7 @@ class NotificationAdapter(ABC):
         Returns:
             bool: 是否有效
         """
-        import re
-        # 支持+86、86、不带前缀
-        pattern = r'^(\+?86)?1[3-9]\d{9}$'
-        return re.match(pattern, phone) is not None
+        return _PHONE_RE.match(phone) is not None
     
     def normalize_phone(self, phone: str) -> str:
         """
@@ -364,8 +438,9 @@ class NotificationAdapter(ABC):
         Returns:
             str: 标准化手机号（11位）
         """
-        # 移除所有非数字字符
-        phone = ''.join(filter(str.isdigit, phone))
+        # 移除所有非数字字符（已是纯数字时跳过正则替换）
+        if not (phone.isascii() and phone.isdigit()):
+            phone = _NON_DIGIT_RE.sub('', phone)
         # 移除86前缀
         if phone.startswith('86') and len(phone) == 13:
             phone = phone[2:]
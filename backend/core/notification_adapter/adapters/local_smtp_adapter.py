@@ -4,10 +4,14 @@
 用于本地开发和测试环境
 """
 
+import asyncio
 import os
 import uuid
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from string import Template
+from typing import Optional, Dict, Any, List, Set, Tuple
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -23,6 +27,51 @@ from ..adapter import (
 )
 
 
+# 连接池上限：同时打开的SMTP连接数
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "5"))
+
+# 单个SMTP连接最多发送的邮件数，达到后重连（避免服务端单连接限制）
+SMTP_MAX_PER_CONN = int(os.getenv("SMTP_MAX_PER_CONN", "100"))
+
+# SMTP网络操作超时（秒），较慢的中继服务器需要较长时间
+SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT", "30"))
+
+# 等待单封邮件发送完成的超时（秒），包括在队列中排队的时间
+SMTP_SEND_TIMEOUT_SECONDS = float(os.getenv("SMTP_SEND_TIMEOUT", "120"))
+
+# 后台发送任务每批最多取出的邮件数（同一连接上连续发送）
+SMTP_BATCH_SIZE = 50
+
+# Mock短信最多保留的条数，超出后淘汰最早的记录
+SMS_STORAGE_MAX = 10_000
+
+# (发件人, 收件人列表, 邮件内容, 结果Future)
+_OutgoingMail = Tuple[str, List[str], str, "asyncio.Future[None]"]
+
+
+@lru_cache(maxsize=1024)
+def _format_addr(name: Optional[str], email: str) -> str:
+    """格式化邮件地址头：'名称 <邮箱>'，无名称时仅为邮箱"""
+    return f"{name} <{email}>" if name else email
+
+
+@lru_cache(maxsize=256)
+def _template_skeleton(template_id: str) -> Tuple[str, Template, Template]:
+    """
+    按模板ID缓存的邮件骨架
+    
+    Returns:
+        (主题, HTML模板, 纯文本模板)，模板中的 $vars 为模板变量占位
+    """
+    subject = f"Template: {template_id}"
+    escaped = subject.replace("$", "$$")
+    return (
+        subject,
+        Template(f"<h1>{escaped}</h1><pre>$vars</pre>"),
+        Template(f"{escaped}\n$vars")
+    )
+
+
 class LocalSMTPAdapter(NotificationAdapter):
     """
     本地SMTP + Mock短信适配器
@@ -46,9 +95,25 @@ class LocalSMTPAdapter(NotificationAdapter):
         # 默认发件人
         self.default_from_email = os.getenv("SMTP_FROM_EMAIL", "noreply@localhost")
         self.default_from_name = os.getenv("SMTP_FROM_NAME", "Kortix Local")
+        self._default_from_header = _format_addr(self.default_from_name, self.default_from_email)
+        
+        # 以下异步原语绑定事件循环，由 _ensure_worker() 在当前循环中创建
+        # （适配器是进程级单例，可能跨多个 asyncio.run() 使用）
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
-        # Mock短信存储（开发用）
-        self._sms_storage: Dict[str, SMSResult] = {}
+        # SMTP连接池：空闲连接及其已发送数（后进先出，优先复用最近用过的连接），
+        # 信号量限制同时占用的连接数
+        self._pool: Optional["asyncio.LifoQueue[Tuple[smtplib.SMTP, int]]"] = None
+        self._pool_slots: Optional[asyncio.Semaphore] = None
+        self._senders: Set[asyncio.Task] = set()
+        
+        # 待发送队列，由后台任务 _drain() 批量发送
+        self._queue: Optional["asyncio.Queue[_OutgoingMail]"] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        
+        # Mock短信存储（开发用），按发送顺序保存，最多 SMS_STORAGE_MAX 条
+        self._sms_storage: "OrderedDict[str, SMSResult]" = OrderedDict()
+        self._last_sms: Optional[SMSResult] = None
     
     # ========================================================================
     # 邮件服务
@@ -57,61 +122,319 @@ class LocalSMTPAdapter(NotificationAdapter):
     async def send_email(self, message: EmailMessage) -> EmailResult:
         """发送邮件"""
         try:
-            # 创建邮件
-            msg = MIMEMultipart('alternative')
+            # 创建邮件：同时有纯文本和HTML时才使用 multipart/alternative
+            if message.text_content and message.html_content:
+                msg = MIMEMultipart('alternative')
+                msg.attach(MIMEText(message.text_content, 'plain', 'utf-8'))
+                msg.attach(MIMEText(message.html_content, 'html', 'utf-8'))
+            elif message.html_content:
+                msg = MIMEText(message.html_content, 'html', 'utf-8')
+            else:
+                msg = MIMEText(message.text_content or '', 'plain', 'utf-8')
+            
             msg['Subject'] = message.subject
-            msg['From'] = f"{message.from_name or self.default_from_name} <{message.from_email or self.default_from_email}>"
-            msg['To'] = ', '.join([f"{r.name} <{r.email}>" if r.name else r.email for r in message.to])
+            if message.from_name is None and message.from_email is None:
+                msg['From'] = self._default_from_header
+            else:
+                msg['From'] = _format_addr(
+                    message.from_name or self.default_from_name,
+                    message.from_email or self.default_from_email
+                )
+            msg['To'] = ', '.join([_format_addr(r.name, r.email) for r in message.to])
             
             if message.reply_to:
                 msg['Reply-To'] = message.reply_to
             
             if message.cc:
-                msg['Cc'] = ', '.join([f"{r.name} <{r.email}>" if r.name else r.email for r in message.cc])
+                msg['Cc'] = ', '.join([_format_addr(r.name, r.email) for r in message.cc])
             
-            # 添加内容
-            if message.text_content:
-                msg.attach(MIMEText(message.text_content, 'plain', 'utf-8'))
+            recipients = [r.email for r in message.to]
+            if message.cc:
+                recipients.extend([r.email for r in message.cc])
+            if message.bcc:
+                recipients.extend([r.email for r in message.bcc])
             
-            if message.html_content:
-                msg.attach(MIMEText(message.html_content, 'html', 'utf-8'))
-            
-            # 发送
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.smtp_use_tls:
-                    server.starttls()
-                
-                if self.smtp_user and self.smtp_password:
-                    server.login(self.smtp_user, self.smtp_password)
-                
-                recipients = [r.email for r in message.to]
-                if message.cc:
-                    recipients.extend([r.email for r in message.cc])
-                if message.bcc:
-                    recipients.extend([r.email for r in message.bcc])
-                
-                server.sendmail(
-                    message.from_email or self.default_from_email,
-                    recipients,
-                    msg.as_string()
-                )
+            # 发送：交给后台任务，与其他待发邮件共用SMTP连接
+            self._ensure_worker()
+            future = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait((
+                message.from_email or self.default_from_email,
+                recipients,
+                msg.as_string(),
+                future
+            ))
+            try:
+                await asyncio.wait_for(future, SMTP_SEND_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"SMTP send timed out after {SMTP_SEND_TIMEOUT_SECONDS:g}s") from None
             
             message_id = f"local_{uuid.uuid4().hex[:16]}"
             
             return EmailResult(
                 message_id=message_id,
                 status=EmailStatus.SENT,
-                sent_at=datetime.utcnow()
+                sent_at=datetime.now(timezone.utc)
             )
             
         except Exception as e:
             return EmailResult(
                 message_id="",
                 status=EmailStatus.FAILED,
-                sent_at=datetime.utcnow(),
+                sent_at=datetime.now(timezone.utc),
                 error=str(e)
             )
     
+    def _ensure_worker(self) -> None:
+        """
+        确保当前事件循环中有后台发送任务
+        
+        首次使用或事件循环变化时，在当前循环中重建队列和连接池。
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset_loop_state()
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._pool = asyncio.LifoQueue()
+            self._pool_slots = asyncio.Semaphore(SMTP_POOL_SIZE)
+        
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._drain())
+    
+    def _reset_loop_state(self) -> None:
+        """丢弃上一个事件循环遗留的队列和连接（该循环已不再运行）"""
+        if self._pool is not None:
+            while not self._pool.empty():
+                conn, _ = self._pool.get_nowait()
+                conn.close()
+        
+        self._loop = None
+        self._queue = None
+        self._pool = None
+        self._pool_slots = None
+        self._senders = set()
+        self._worker_task = None
+    
+    async def _drain(self) -> None:
+        """
+        后台发送任务
+        
+        每取到一个连接，就从队列中取出一批邮件交给该连接发送；连接都被
+        占用时在此等待，期间队列继续积累。积压的邮件按连接池大小分摊到
+        各连接（每批最多 SMTP_BATCH_SIZE 封），最多 SMTP_POOL_SIZE 批同时发送。
+        """
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                conn, used = await self._acquire()
+            except asyncio.CancelledError:
+                self._fail_pending(batch, "SMTP send worker stopped")
+                raise
+            except Exception as e:
+                # 本批失败，任务继续处理后续邮件
+                self._fail_pending(batch, f"SMTP send worker error: {e}")
+                continue
+            
+            try:
+                batch_size = min(SMTP_BATCH_SIZE, -(-(self._queue.qsize() + 1) // SMTP_POOL_SIZE))
+                while len(batch) < batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                
+                task = asyncio.create_task(self._deliver(conn, used, batch))
+            except Exception as e:
+                # 连接未交给发送任务，在此归还
+                self._fail_pending(batch, f"SMTP send worker error: {e}")
+                await self._release(conn, used)
+                continue
+            
+            self._senders.add(task)
+            task.add_done_callback(self._senders.discard)
+    
+    async def _deliver(
+        self,
+        conn: Optional[smtplib.SMTP],
+        used: int,
+        batch: List[_OutgoingMail]
+    ) -> None:
+        """
+        在一个连接上发送一批邮件，并通过各自的 Future 返回结果
+        
+        smtplib 是阻塞的，整批在线程池中发送，不阻塞事件循环。
+        """
+        returned: Optional[smtplib.SMTP] = None
+        try:
+            # 跳过调用方已取消的邮件
+            pending = [item for item in batch if not item[3].done()]
+            returned, used, outcomes = await asyncio.to_thread(
+                self._send_batch,
+                conn,
+                used,
+                [(from_addr, recipients, body) for from_addr, recipients, body, _ in pending]
+            )
+            
+            for (*_, future), error in zip(pending, outcomes):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+        finally:
+            # 发送被中断时，不让调用方一直等待
+            self._fail_pending(batch, "SMTP send worker stopped")
+            await self._release(returned, used)
+    
+    @staticmethod
+    def _fail_pending(batch: List[_OutgoingMail], reason: str) -> None:
+        """让尚未完成的邮件以 RuntimeError 失败"""
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError(reason))
+    
+    async def _acquire(self) -> Tuple[Optional[smtplib.SMTP], int]:
+        """
+        从连接池占用一个连接
+        
+        池中有空闲连接时直接复用；否则返回 (None, 0)，由发送线程新建连接。
+        已有 SMTP_POOL_SIZE 个连接被占用时等待归还。
+        """
+        await self._pool_slots.acquire()
+        try:
+            return self._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            return None, 0
+    
+    async def _release(self, conn: Optional[smtplib.SMTP], used: int) -> None:
+        """归还连接；已发送 SMTP_MAX_PER_CONN 封的连接直接断开"""
+        try:
+            if conn is None:
+                return
+            if used >= SMTP_MAX_PER_CONN:
+                await asyncio.to_thread(self._close_conn, conn)
+            else:
+                self._pool.put_nowait((conn, used))
+        finally:
+            self._pool_slots.release()
+    
+    def _send_batch(
+        self,
+        conn: Optional[smtplib.SMTP],
+        used: int,
+        batch: List[Tuple[str, List[str], str]]
+    ) -> Tuple[Optional[smtplib.SMTP], int, List[Optional[Exception]]]:
+        """
+        在一个连接上发送一批邮件（阻塞，在工作线程中运行）
+        
+        复用的连接先 NOOP 检查存活；连接断开、响应异常或已发送
+        SMTP_MAX_PER_CONN 封后重新连接。
+        
+        Returns:
+            (连接, 该连接已发送数, 结果列表)；结果与 batch 对应，
+            成功为 None，失败为异常
+        """
+        if conn is not None and not self._is_alive(conn):
+            self._close_conn(conn)
+            conn = None
+        
+        outcomes: List[Optional[Exception]] = []
+        for from_addr, recipients, body in batch:
+            try:
+                if conn is None or used >= SMTP_MAX_PER_CONN:
+                    if conn is not None:
+                        self._close_conn(conn)
+                        conn = None
+                    conn, used = self._connect(), 0
+                conn.sendmail(from_addr, recipients, body)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as e:
+                # 服务端拒收，连接本身仍可用（连接失败时 conn 已为 None）
+                outcomes.append(e)
+                continue
+            except Exception as e:
+                # 连接已断开或出错，下一封重新连接
+                if conn is not None:
+                    self._close_conn(conn)
+                    conn = None
+                outcomes.append(e)
+                continue
+            
+            used += 1
+            outcomes.append(None)
+        
+        return conn, used, outcomes
+    
+    def _connect(self) -> smtplib.SMTP:
+        """建立新的SMTP连接"""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=SMTP_TIMEOUT_SECONDS)
+        try:
+            if self.smtp_use_tls:
+                server.starttls()
+            
+            if self.smtp_user and self.smtp_password:
+                server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        
+        return server
+    
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        """NOOP 检查空闲连接是否仍可用"""
+        try:
+            code, _ = server.noop()
+        except (OSError, smtplib.SMTPException):
+            return False
+        return 200 <= code < 300
+    
+    @staticmethod
+    def _close_conn(server: smtplib.SMTP) -> None:
+        """关闭SMTP连接"""
+        try:
+            server.quit()
+        except (OSError, smtplib.SMTPException):
+            server.close()
+    
+    async def close(self) -> None:
+        """停止后台发送任务，等待发送中的邮件完成并关闭所有SMTP连接"""
+        if self._loop is not asyncio.get_running_loop():
+            # 尚未使用，或队列和连接属于已结束的事件循环
+            self._reset_loop_state()
+            return
+        
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+        
+        # 等待已交给连接的批次发送完毕，连接归还到池中后统一关闭
+        if self._senders:
+            await asyncio.gather(*self._senders, return_exceptions=True)
+        
+        # 未发送的邮件直接失败
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("LocalSMTPAdapter closed"))
+        
+        idle = []
+        while not self._pool.empty():
+            conn, _ = self._pool.get_nowait()
+            idle.append(conn)
+        for conn in idle:
+            await asyncio.to_thread(self._close_conn, conn)
+    
+    async def __aenter__(self) -> "LocalSMTPAdapter":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
     async def send_template_email(
         self,
         to_email: str,
@@ -124,10 +447,10 @@ class LocalSMTPAdapter(NotificationAdapter):
         
         本地环境不支持云端模板，这里简单渲染
         """
-        # 简单的模板渲染（实际应使用Jinja2等模板引擎）
-        subject = f"Template: {template_id}"
-        html_content = f"<h1>Template: {template_id}</h1><pre>{template_vars}</pre>"
-        text_content = f"Template: {template_id}\n{template_vars}"
+        # 简单的模板渲染（实际应使用Jinja2等模板引擎），骨架按模板ID缓存
+        subject, html_template, text_template = _template_skeleton(template_id)
+        html_content = html_template.substitute(vars=template_vars)
+        text_content = text_template.substitute(vars=template_vars)
         
         return await self.send_simple_email(
             to_email=to_email,
@@ -166,11 +489,14 @@ class LocalSMTPAdapter(NotificationAdapter):
         result = SMSResult(
             message_id=message_id,
             status=SMSStatus.SENT,
-            sent_at=datetime.utcnow()
+            sent_at=datetime.now(timezone.utc)
         )
         
         # 存储到内存（方便测试验证）
         self._sms_storage[message_id] = result
+        self._last_sms = result
+        if len(self._sms_storage) > SMS_STORAGE_MAX:
+            self._sms_storage.popitem(last=False)
         
         return result
     
@@ -225,10 +551,9 @@ class LocalSMTPAdapter(NotificationAdapter):
     
     def get_last_sms(self) -> Optional[SMSResult]:
         """获取最后发送的短信（测试用）"""
-        if self._sms_storage:
-            return list(self._sms_storage.values())[-1]
-        return None
+        return self._last_sms
     
     def clear_sms_storage(self):
         """清空短信存储（测试用）"""
         self._sms_storage.clear()
+        self._last_sms = None
@@ -5,13 +5,39 @@
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 from .adapter import NotificationAdapter, NotificationProvider
 
 
 # 单例实例
 _adapter_instance: Optional[NotificationAdapter] = None
 
+# NOTIFICATION_PROVIDER 取值 -> 提供商
+_PROVIDER_ALIASES: Dict[str, NotificationProvider] = {
+    "aliyun": NotificationProvider.ALIYUN,
+    "ali": NotificationProvider.ALIYUN,
+    "alibaba": NotificationProvider.ALIYUN,
+    "tencent": NotificationProvider.TENCENT,
+    "tc": NotificationProvider.TENCENT,
+    "qcloud": NotificationProvider.TENCENT,
+    "local": NotificationProvider.LOCAL_SMTP,
+    "smtp": NotificationProvider.LOCAL_SMTP,
+    "local_smtp": NotificationProvider.LOCAL_SMTP,
+    "mailtrap": NotificationProvider.MAILTRAP,
+}
+
+# CLOUD_PROVIDER 取值 -> 提供商
+_CLOUD_PROVIDER_ALIASES: Dict[str, NotificationProvider] = {
+    "aliyun": NotificationProvider.ALIYUN,
+    "ali": NotificationProvider.ALIYUN,
+    "alibaba": NotificationProvider.ALIYUN,
+    "tencent": NotificationProvider.TENCENT,
+    "tc": NotificationProvider.TENCENT,
+    "qcloud": NotificationProvider.TENCENT,
+    "local": NotificationProvider.LOCAL_SMTP,
+}
+
 
 def get_notification_adapter() -> NotificationAdapter:
     """
@@ -37,33 +63,25 @@ def get_notification_adapter() -> NotificationAdapter:
     return _adapter_instance
 
 
+@lru_cache(maxsize=1)
 def _detect_provider() -> NotificationProvider:
     """
     自动检测通知提供商
     
+    每个进程只检测一次；修改环境变量后需调用 reset_adapter()。
+    
     Returns:
         NotificationProvider: 检测到的提供商
     """
     # 1. 显式指定
-    notification_provider = os.getenv("NOTIFICATION_PROVIDER", "").lower()
-    if notification_provider:
-        if notification_provider in ["aliyun", "ali", "alibaba"]:
-            return NotificationProvider.ALIYUN
-        elif notification_provider in ["tencent", "tc", "qcloud"]:
-            return NotificationProvider.TENCENT
-        elif notification_provider in ["local", "smtp", "local_smtp"]:
-            return NotificationProvider.LOCAL_SMTP
-        elif notification_provider == "mailtrap":
-            return NotificationProvider.MAILTRAP
+    provider = _PROVIDER_ALIASES.get(os.getenv("NOTIFICATION_PROVIDER", "").lower())
+    if provider is not None:
+        return provider
     
     # 2. 根据云服务商
-    cloud_provider = os.getenv("CLOUD_PROVIDER", "").lower()
-    if cloud_provider in ["aliyun", "ali", "alibaba"]:
-        return NotificationProvider.ALIYUN
-    elif cloud_provider in ["tencent", "tc", "qcloud"]:
-        return NotificationProvider.TENCENT
-    elif cloud_provider == "local":
-        return NotificationProvider.LOCAL_SMTP
+    provider = _CLOUD_PROVIDER_ALIASES.get(os.getenv("CLOUD_PROVIDER", "").lower())
+    if provider is not None:
+        return provider
     
     # 3. 检测API密钥
     if os.getenv("ALIYUN_ACCESS_KEY_ID") and os.getenv("ALIYUN_ACCESS_KEY_SECRET"):
@@ -110,6 +128,7 @@ def _create_adapter(provider: NotificationProvider) -> NotificationAdapter:
 
 
 def reset_adapter():
-    """重置单例实例（用于测试）"""
+    """重置单例实例及提供商检测结果（用于测试）"""
     global _adapter_instance
     _adapter_instance = None
+    _detect_provider.cache_clear()
@@ -1,17 +1,6 @@
 """支付适配器模块"""
 
-from .adapter import (
-    PaymentAdapter,
-    PaymentProvider,
-    PaymentIntent,
-    PaymentStatus,
-    Subscription,
-    SubscriptionStatus,
-    Customer,
-    Refund,
-    Currency
-)
-from .factory import get_payment_adapter, reset_adapter
+import importlib
 
 __all__ = [
     "PaymentAdapter",
@@ -26,3 +15,33 @@ __all__ = [
     "get_payment_adapter",
     "reset_adapter",
 ]
+
+# 导出的名称在首次访问时才导入所在模块（PEP 562），
+# 只导入本包而不使用支付功能时不加载接口定义
+_LAZY_ATTRS = {
+    "PaymentAdapter": ".adapter",
+    "PaymentProvider": ".adapter",
+    "PaymentIntent": ".adapter",
+    "PaymentStatus": ".adapter",
+    "Subscription": ".adapter",
+    "SubscriptionStatus": ".adapter",
+    "Customer": ".adapter",
+    "Refund": ".adapter",
+    "Currency": ".adapter",
+    "get_payment_adapter": ".factory",
+    "reset_adapter": ".factory",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -51,6 +51,14 @@ class Currency(str, Enum):
     EUR = "EUR"  # 欧元
 
 
+# 货币显示符号（format_amount 使用）
+_CURRENCY_SYMBOLS: Dict[Currency, str] = {
+    Currency.CNY: "¥",
+    Currency.USD: "$",
+    Currency.EUR: "€",
+}
+
+
 @dataclass
 class PaymentIntent:
     """支付意图"""
@@ -97,8 +105,8 @@ class Refund:
     id: str                                    # 退款ID
     payment_id: str                           # 原支付ID
     amount: int                               # 退款金额（分）
-    reason: Optional[str] = None              # 退款原因
     status: PaymentStatus                     # 状态
+    reason: Optional[str] = None              # 退款原因
     created_at: Optional[datetime] = None     # 创建时间
 
 
@@ -370,10 +378,11 @@ class PaymentAdapter(ABC):
         Returns:
             str: 格式化字符串，如 "¥99.00", "$9.99"
         """
-        if currency == Currency.CNY:
-            return f"¥{amount / 100:.2f}"
-        elif currency == Currency.USD:
-            return f"${amount / 100:.2f}"
-        elif currency == Currency.EUR:
-            return f"€{amount / 100:.2f}"
-        return f"{amount / 100:.2f} {currency.value}"
+        # 整数运算拆分元/分，避免浮点转换
+        units, cents = divmod(abs(amount), 100)
+        value = f"{'-' if amount < 0 else ''}{units}.{cents:02d}"
+        
+        symbol = _CURRENCY_SYMBOLS.get(currency)
+        if symbol is not None:
+            return f"{symbol}{value}"
+        return f"{value} {currency.value}"
@@ -116,6 +116,10 @@ def setup_api_keys() -> None:
         os.environ["OLLAMA_BASE_URL"] = config.OLLAMA_BASE_URL
         logger.info(f"Ollama base URL configured: {config.OLLAMA_BASE_URL}")
     
+    # Provider configs memoize env lookups; make them see the keys set above
+    from core.ai_models.providers.base import clear_env_cache
+    clear_env_cache()
+    
     # Log configured China-friendly providers
     china_providers = []
     if os.getenv("DASHSCOPE_API_KEY"):
@@ -0,0 +1,3 @@
+"""
+AI model provider tests
+"""
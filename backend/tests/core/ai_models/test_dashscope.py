@@ -0,0 +1,19 @@
+"""
+DashScope Provider Tests
+
+- Every model gets its own ModelConfig, so changing one leaves the rest alone
+
+Run with: pytest tests/core/ai_models/test_dashscope.py -v
+"""
+
+from core.ai_models.providers.dashscope import DashScopeConfig
+
+
+def test_models_do_not_share_config(monkeypatch):
+    first, second = DashScopeConfig.get_models()[:2]
+
+    monkeypatch.setattr(first.config, "timeout", 5)
+
+    assert first.config is not second.config
+    assert second.config.timeout is None
+    assert second.config.api_base == DashScopeConfig.api_base
@@ -0,0 +1,50 @@
+"""
+Provider Env Cache Tests
+
+- getenv_cached() reads each key once until clear_env_cache() is called
+- is_configured() of key-based providers goes through that cache
+
+Run with: pytest tests/core/ai_models/test_env_cache.py -v
+"""
+
+import pytest
+
+from core.ai_models.providers.base import clear_env_cache, getenv_cached
+from core.ai_models.providers.dashscope import DashScopeConfig
+from core.ai_models.providers.zhipu import ZhipuAIConfig
+
+
+@pytest.fixture(autouse=True)
+def env_cache():
+    clear_env_cache()
+    yield
+    clear_env_cache()
+
+
+def test_getenv_cached_keeps_first_value_until_cleared(monkeypatch):
+    monkeypatch.setenv("SUNA_TEST_ENV_CACHE", "first")
+    assert getenv_cached("SUNA_TEST_ENV_CACHE") == "first"
+
+    monkeypatch.setenv("SUNA_TEST_ENV_CACHE", "second")
+    assert getenv_cached("SUNA_TEST_ENV_CACHE") == "first"
+
+    clear_env_cache()
+    assert getenv_cached("SUNA_TEST_ENV_CACHE") == "second"
+
+
+def test_getenv_cached_default(monkeypatch):
+    monkeypatch.delenv("SUNA_TEST_ENV_CACHE", raising=False)
+
+    assert getenv_cached("SUNA_TEST_ENV_CACHE", "fallback") == "fallback"
+
+
+@pytest.mark.parametrize("provider", [DashScopeConfig, ZhipuAIConfig])
+def test_is_configured_uses_cached_key(provider, monkeypatch):
+    monkeypatch.delenv(provider.api_key_env, raising=False)
+    assert provider.is_configured() is False
+
+    monkeypatch.setenv(provider.api_key_env, "sk-test")
+    assert provider.is_configured() is False
+
+    clear_env_cache()
+    assert provider.is_configured() is True
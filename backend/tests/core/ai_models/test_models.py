@@ -0,0 +1,92 @@
+"""
+Model Record Tests
+
+- Model, ModelConfig and ModelPricing are slotted
+- capability_mask is precomputed from capabilities and drives supports_*
+- Capability filters in the registry go through the mask
+
+Run with: pytest tests/core/ai_models/test_models.py -v
+"""
+
+import pytest
+
+from core.ai_models.models import (
+    Model,
+    ModelCapability,
+    ModelConfig,
+    ModelPricing,
+    ModelProvider,
+    capability_mask,
+)
+from core.ai_models.registry import ModelRegistry
+
+
+def _model(model_id: str, *capabilities: ModelCapability, **kwargs) -> Model:
+    return Model(
+        id=model_id,
+        name=model_id,
+        provider=ModelProvider.OPENAI,
+        capabilities=capabilities,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("record", [
+    Model(id="m", name="m", provider=ModelProvider.OPENAI),
+    ModelConfig(),
+    ModelPricing(1.0, 2.0),
+], ids=["Model", "ModelConfig", "ModelPricing"])
+def test_records_are_slotted(record):
+    assert not hasattr(record, "__dict__")
+    with pytest.raises((AttributeError, TypeError)):
+        record.unexpected = 1
+
+
+def test_capability_mask_matches_capabilities():
+    model = _model("m", ModelCapability.VISION, ModelCapability.FUNCTION_CALLING)
+
+    assert ModelCapability.CHAT in model.capabilities
+    assert model.capability_mask == capability_mask(
+        [ModelCapability.CHAT, ModelCapability.VISION, ModelCapability.FUNCTION_CALLING]
+    )
+    assert model.supports_vision
+    assert model.supports_functions
+    assert not model.supports_thinking
+    assert not model.supports_caching
+
+
+def test_has_capabilities_requires_every_bit():
+    model = _model("m", ModelCapability.VISION)
+
+    assert model.has_capabilities(capability_mask([ModelCapability.CHAT, ModelCapability.VISION]))
+    assert not model.has_capabilities(
+        capability_mask([ModelCapability.VISION, ModelCapability.THINKING])
+    )
+
+
+def test_capability_bits_are_distinct():
+    bits = [cap.bit for cap in ModelCapability]
+
+    assert len(set(bits)) == len(bits)
+    assert all(bit and bit & (bit - 1) == 0 for bit in bits)
+
+
+def test_registry_filters_by_capability_mask():
+    registry = ModelRegistry()
+    registry._models = {}
+    registry.register(_model("plain", tier_availability=("free",), priority=1))
+    registry.register(_model(
+        "vision", ModelCapability.VISION, tier_availability=("free",), priority=2
+    ))
+    registry.register(_model(
+        "thinking", ModelCapability.VISION, ModelCapability.THINKING,
+        tier_availability=("free",), priority=3,
+    ))
+
+    vision_ids = {m.id for m in registry.get_by_capability(ModelCapability.VISION)}
+    best = registry.select_best_model(
+        "free", required_capabilities=[ModelCapability.VISION, ModelCapability.THINKING]
+    )
+
+    assert vision_ids == {"vision", "thinking"}
+    assert best.id == "thinking"
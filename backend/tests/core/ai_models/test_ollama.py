@@ -0,0 +1,136 @@
+"""
+Ollama Provider Tests
+
+- is_configured() probes the server at most once per TTL window
+- is_configured_async() shares that cache with the sync check
+- The sync probe reuses one keep-alive HTTP session
+- The base URL comes from the memoized env lookup
+- Every model shares one read-only zero-cost pricing object
+
+Run with: pytest tests/core/ai_models/test_ollama.py -v
+"""
+
+import time
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from core.ai_models.providers import ollama
+from core.ai_models.providers.base import clear_env_cache
+from core.ai_models.providers.dashscope import DashScopeConfig
+from core.ai_models.providers.ollama import OllamaConfig
+from core.ai_models.providers.zhipu import ZhipuAIConfig
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Replace the HTTP probe with a counter and start from an empty cache."""
+    calls = []
+
+    def probe():
+        calls.append("sync")
+        return True
+
+    async def probe_async():
+        calls.append("async")
+        return True
+
+    monkeypatch.setattr(ollama, "_configured_cache", (False, 0.0))
+    monkeypatch.setattr(OllamaConfig, "_probe", probe)
+    monkeypatch.setattr(OllamaConfig, "_probe_async", probe_async)
+    return calls
+
+
+@pytest.fixture
+def env_cache():
+    """Clear the memoized env lookups around a test that changes the environment."""
+    clear_env_cache()
+    yield
+    clear_env_cache()
+
+
+def test_is_configured_reuses_recent_probe(probes):
+    assert OllamaConfig.is_configured() is True
+    assert OllamaConfig.is_configured() is True
+
+    assert probes == ["sync"]
+
+
+def test_is_configured_probes_again_after_ttl(probes, monkeypatch):
+    stale = time.monotonic() - ollama._CONFIGURED_TTL_SECONDS - 1
+    monkeypatch.setattr(ollama, "_configured_cache", (False, stale))
+
+    assert OllamaConfig.is_configured() is True
+    assert probes == ["sync"]
+
+
+@pytest.mark.asyncio
+async def test_async_probe_shares_the_cache(probes):
+    assert await OllamaConfig.is_configured_async() is True
+    assert OllamaConfig.is_configured() is True
+    assert await OllamaConfig.is_configured_async() is True
+
+    assert probes == ["async"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider, env", [
+    (DashScopeConfig, "DASHSCOPE_API_KEY"),
+    (ZhipuAIConfig, "ZHIPU_API_KEY"),
+])
+async def test_key_based_providers_have_async_check(provider, env, monkeypatch, env_cache):
+    monkeypatch.setenv(env, "sk-test")
+
+    assert await provider.is_configured_async() is True
+
+
+class _FakeResponse:
+    status_code = 200
+
+
+class _FakeSession:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return _FakeResponse()
+
+
+def test_probe_reuses_session(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(ollama, "_session", session)
+
+    assert OllamaConfig._probe() is True
+    assert OllamaConfig._probe() is True
+
+    assert session.urls == [f"{OllamaConfig.get_base_url()}/api/tags"] * 2
+
+
+def test_get_session_creates_one_session(monkeypatch):
+    pytest.importorskip("requests")
+    monkeypatch.setattr(ollama, "_session", None)
+
+    assert ollama._get_session() is ollama._get_session()
+
+
+def test_base_url_is_read_through_env_cache(monkeypatch, env_cache):
+    monkeypatch.delenv("OLLAMA_BASE_URL", raising=False)
+    assert OllamaConfig.get_base_url() == OllamaConfig.default_api_base
+
+    monkeypatch.setenv("OLLAMA_BASE_URL", "http://ollama:11434")
+    assert OllamaConfig.get_base_url() == OllamaConfig.default_api_base
+
+    clear_env_cache()
+    assert OllamaConfig.get_base_url() == "http://ollama:11434"
+
+
+def test_models_share_frozen_free_pricing():
+    pricing = {id(model.pricing) for model in OllamaConfig.get_models()}
+    shared = OllamaConfig.get_models()[0].pricing
+
+    assert len(pricing) == 1
+    assert shared.input_cost_per_million_tokens == 0.0
+    assert shared.output_cost_per_million_tokens == 0.0
+    with pytest.raises(FrozenInstanceError):
+        shared.input_cost_per_million_tokens = 1.0
@@ -0,0 +1,141 @@
+"""
+Static Provider Catalog Tests
+
+Covers the DashScope, ZhipuAI and Ollama model catalogs:
+- The catalog is built once per provider class and reused
+- Rows of the literal model tables become complete Model instances
+- Model ids, LiteLLM ids and tier names are interned
+- Capabilities and tiers are tuples shared between rows with the same values
+- get_model() resolves ids and aliases from a prebuilt index
+
+Run with: pytest tests/core/ai_models/test_provider_catalogs.py -v
+"""
+
+import sys
+
+import pytest
+
+from core.ai_models.models import ModelCapability, ModelProvider
+from core.ai_models.providers.base import StaticModelCatalog
+from core.ai_models.providers.dashscope import DashScopeConfig
+from core.ai_models.providers.ollama import OllamaConfig
+from core.ai_models.providers.zhipu import ZhipuAIConfig
+
+PROVIDERS = [DashScopeConfig, ZhipuAIConfig, OllamaConfig]
+
+
+@pytest.fixture
+def fresh_catalog(monkeypatch):
+    """Drop a provider's cached catalog for the duration of a test."""
+    def reset(provider):
+        monkeypatch.setattr(provider, "_cached_models", None)
+        monkeypatch.setattr(provider, "_models_by_id", None)
+        monkeypatch.setattr(provider, "_models_by_alias", None)
+        return provider
+    return reset
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_catalog_is_built_once(provider, fresh_catalog, monkeypatch):
+    provider = fresh_catalog(provider)
+    build = provider._build_models
+    calls = []
+
+    def counting_build():
+        calls.append(1)
+        return build()
+
+    monkeypatch.setattr(provider, "_build_models", counting_build)
+
+    first = provider.get_models()
+    second = provider.get_models()
+
+    assert len(calls) == 1
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+
+@pytest.mark.parametrize("provider, provider_id, count", [
+    (DashScopeConfig, ModelProvider.DASHSCOPE, 6),
+    (ZhipuAIConfig, ModelProvider.ZHIPU, 3),
+    (OllamaConfig, ModelProvider.OLLAMA, 6),
+])
+def test_catalog_rows_become_models(provider, provider_id, count):
+    models = provider.get_models()
+
+    assert len(models) == count
+    assert len({m.id for m in models}) == count
+    for model in models:
+        assert model.provider is provider_id
+        assert model.litellm_model_id.startswith(f"{provider_id.value}/")
+        assert model.pricing is not None
+        assert isinstance(model.aliases, list)
+
+
+def _by_id(provider):
+    return {model.id: model for model in provider.get_models()}
+
+
+def test_catalog_row_fields():
+    qwen_plus = _by_id(DashScopeConfig)["qwen-plus"]
+    assert qwen_plus.name == "Qwen Plus"
+    assert qwen_plus.context_window == 128_000
+    assert qwen_plus.pricing.input_cost_per_million_tokens == 4.0
+    assert qwen_plus.pricing.output_cost_per_million_tokens == 12.0
+    assert qwen_plus.supports_vision
+    assert qwen_plus.is_free_tier
+    assert qwen_plus.config.api_base == DashScopeConfig.api_base
+
+    glm_4v = _by_id(ZhipuAIConfig)["glm-4v"]
+    assert list(glm_4v.capabilities) == [ModelCapability.CHAT, ModelCapability.VISION]
+    assert list(glm_4v.tier_availability) == ["paid"]
+
+    qwen_local = _by_id(OllamaConfig)["qwen2.5:7b"]
+    assert qwen_local.aliases == ["qwen2.5"]
+    assert qwen_local.recommended
+    assert qwen_local.pricing.input_cost_per_million_tokens == 0.0
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_catalog_strings_are_interned(provider):
+    for model in provider.get_models():
+        assert sys.intern(model.id) is model.id
+        assert sys.intern(model.litellm_model_id) is model.litellm_model_id
+        assert all(sys.intern(tier) is tier for tier in model.tier_availability)
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_get_model_by_id_and_alias(provider):
+    for model in provider.get_models():
+        assert provider.get_model(model.id) is model
+        for alias in model.aliases:
+            assert provider.get_model(alias) is model
+
+    assert provider.get_model("no-such-model") is None
+
+
+def test_get_model_resolves_ollama_alias():
+    assert OllamaConfig.get_model("llama3.1").id == "llama3.1:8b"
+
+
+def test_catalog_requires_build_models():
+    class Incomplete(StaticModelCatalog):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_capabilities_and_tiers_are_shared_tuples(provider):
+    models = provider.get_models()
+    for model in models:
+        assert isinstance(model.capabilities, tuple)
+        assert isinstance(model.tier_availability, tuple)
+
+    for first in models:
+        for second in models:
+            if first.capabilities == second.capabilities:
+                assert first.capabilities is second.capabilities
+            if first.tier_availability == second.tier_availability:
+                assert first.tier_availability is second.tier_availability
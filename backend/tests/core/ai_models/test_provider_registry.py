@@ -0,0 +1,52 @@
+"""
+Provider Registry Tests
+
+- DashScope, Ollama and ZhipuAI configs are imported on first lookup,
+  not when the providers package is imported
+- A lazily registered provider whose module fails to import is skipped
+
+Run with: pytest tests/core/ai_models/test_provider_registry.py -v
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from core.ai_models.providers.dashscope import DashScopeConfig
+from core.ai_models.providers.provider_registry import ProviderRegistry
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+def test_importing_providers_does_not_load_china_configs():
+    code = (
+        "import sys\n"
+        "import core.ai_models.providers\n"
+        "names = ('dashscope', 'ollama', 'zhipu')\n"
+        "print([n for n in names if 'core.ai_models.providers.' + n in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_lazy_provider_resolves_on_lookup():
+    registry = ProviderRegistry()
+
+    assert "dashscope" not in registry._providers
+    provider = registry.get_for_model("dashscope/qwen-plus")
+
+    assert isinstance(provider, DashScopeConfig)
+    assert registry.get("dashscope") is provider
+
+
+def test_lazy_provider_that_fails_to_import_is_skipped():
+    registry = ProviderRegistry()
+    registry.register_lazy("missing", ".does_not_exist", "MissingConfig")
+
+    assert registry.get("missing") is None
+    assert "missing" not in registry.get_all()
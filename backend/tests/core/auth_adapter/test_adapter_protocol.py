@@ -0,0 +1,32 @@
+"""
+AuthAdapter Protocol Tests
+
+- A subclass missing any method cannot be instantiated
+- A class implementing every method satisfies isinstance() without subclassing
+
+Run with: pytest tests/core/auth_adapter/test_adapter_protocol.py -v
+"""
+
+import pytest
+
+from core.auth_adapter.adapter import AuthAdapter
+
+
+async def _noop(self, *args, **kwargs):
+    return None
+
+
+def test_incomplete_subclass_cannot_be_instantiated():
+    class Partial(AuthAdapter):
+        async def initialize(self) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        Partial()
+
+
+def test_structural_implementation_is_an_auth_adapter():
+    methods = {name: _noop for name in AuthAdapter.__abstractmethods__}
+    Structural = type("Structural", (), methods)
+
+    assert isinstance(Structural(), AuthAdapter)
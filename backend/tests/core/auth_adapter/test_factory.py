@@ -0,0 +1,120 @@
+"""
+Auth Factory Tests
+
+- The provider is detected from the environment once, until force_new
+- Concurrent callers share one adapter, initialized once
+- Only the selected provider's adapter module is imported
+- An ImportError from that module propagates instead of being hidden
+
+Run with: pytest tests/core/auth_adapter/test_factory.py -v
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from core.auth_adapter import factory
+
+
+JWT_MODULE = "core.auth_adapter.adapters.jwt_auth"
+SUPABASE_MODULE = "core.auth_adapter.adapters.supabase_auth"
+
+
+@pytest.fixture
+def jwt_provider(monkeypatch):
+    monkeypatch.setenv("AUTH_PROVIDER", "jwt")
+    monkeypatch.setattr(factory, "_adapter_instance", None)
+    yield
+    factory.get_auth_provider.cache_clear()
+
+
+def test_selected_adapter_is_imported_on_demand(jwt_provider, monkeypatch):
+    module = types.ModuleType(JWT_MODULE)
+    module.JWTAuthAdapter = type("JWTAuthAdapter", (), {})
+    monkeypatch.setitem(sys.modules, JWT_MODULE, module)
+    monkeypatch.delitem(sys.modules, SUPABASE_MODULE, raising=False)
+
+    adapter = factory.get_auth_adapter(force_new=True)
+
+    assert isinstance(adapter, module.JWTAuthAdapter)
+    assert SUPABASE_MODULE not in sys.modules
+
+
+def test_import_error_propagates(jwt_provider, monkeypatch):
+    # A None entry makes the import fail, like a missing dependency would
+    monkeypatch.setitem(sys.modules, JWT_MODULE, None)
+
+    with pytest.raises(ImportError):
+        factory.get_auth_adapter(force_new=True)
+
+
+def test_provider_is_detected_once(jwt_provider, monkeypatch):
+    factory.get_auth_provider.cache_clear()
+    assert factory.get_auth_provider() is factory.AuthProvider.JWT
+
+    monkeypatch.setenv("AUTH_PROVIDER", "supabase")
+    assert factory.get_auth_provider() is factory.AuthProvider.JWT
+
+    monkeypatch.setitem(sys.modules, SUPABASE_MODULE, types.SimpleNamespace(
+        SupabaseAuthAdapter=type("SupabaseAuthAdapter", (), {})
+    ))
+    adapter = factory.get_auth_adapter(force_new=True)
+
+    assert type(adapter).__name__ == "SupabaseAuthAdapter"
+    assert factory.get_auth_provider() is factory.AuthProvider.SUPABASE
+
+
+class _CountingAdapter:
+    instances = 0
+
+    def __init__(self):
+        # Slow construction widens the window for a second thread to race in
+        time.sleep(0.01)
+        type(self).instances += 1
+        self.initialized = 0
+
+    async def initialize(self):
+        await asyncio.sleep(0)
+        self.initialized += 1
+
+
+@pytest.fixture
+def counting_adapter(jwt_provider, monkeypatch):
+    _CountingAdapter.instances = 0
+    module = types.ModuleType(JWT_MODULE)
+    module.JWTAuthAdapter = _CountingAdapter
+    monkeypatch.setitem(sys.modules, JWT_MODULE, module)
+    monkeypatch.setattr(factory, "_initialized_adapter", None)
+    monkeypatch.setattr(factory, "_init_lock", None)
+    factory.get_auth_provider.cache_clear()
+    return _CountingAdapter
+
+
+def test_concurrent_threads_share_one_adapter(counting_adapter):
+    barrier = threading.Barrier(8)
+    adapters = []
+
+    def worker():
+        barrier.wait()
+        adapters.append(factory.get_auth_adapter())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counting_adapter.instances == 1
+    assert all(adapter is adapters[0] for adapter in adapters)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_initialize_runs_once(counting_adapter):
+    adapters = await asyncio.gather(*[factory.initialize_auth() for _ in range(5)])
+
+    assert all(adapter is adapters[0] for adapter in adapters)
+    assert adapters[0].initialized == 1
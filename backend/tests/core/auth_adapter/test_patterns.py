@@ -0,0 +1,37 @@
+"""
+Auth Validation Pattern Tests
+
+- E164 accepts international numbers with a leading + and 8-15 digits
+- EMAIL accepts a basic local@domain.tld shape
+
+Run with: pytest tests/core/auth_adapter/test_patterns.py -v
+"""
+
+import pytest
+
+from core.auth_adapter import _patterns
+
+
+@pytest.mark.parametrize("phone, valid", [
+    ("+8613800138000", True),
+    ("+14155552671", True),
+    ("13800138000", False),
+    ("+0123456789", False),
+    ("+86 138 0013 8000", False),
+    ("+1234567", False),
+    ("+1234567890123456", False),
+])
+def test_e164(phone, valid):
+    assert bool(_patterns.E164.match(phone)) is valid
+
+
+@pytest.mark.parametrize("email, valid", [
+    ("user@example.com", True),
+    ("first.last+tag@mail.example.cn", True),
+    ("user@example", False),
+    ("user example@example.com", False),
+    ("@example.com", False),
+    ("user@@example.com", False),
+])
+def test_email(email, valid):
+    assert bool(_patterns.EMAIL.match(email)) is valid
@@ -0,0 +1,149 @@
+"""
+TokenCacheMixin Tests
+
+Drives verify_token_cached() on a stub adapter that counts verify_token calls:
+- Valid tokens are served from the cache; invalid ones are not cached
+- An entry expires at its token's exp claim, if that comes before the TTL
+- Cache hits return copies, so mutating one does not leak into the next
+- sign_out drops the token; update_password/delete_user drop the user's tokens
+
+Run with: pytest tests/core/auth_adapter/test_token_cache.py -v
+"""
+
+import base64
+import json
+import time
+from typing import Dict, Optional
+
+import pytest
+
+from core.auth_adapter import adapter as auth_adapter
+from core.auth_adapter.adapter import TokenCacheMixin, User
+
+
+def _jwt(sub: str, exp: Optional[float] = None) -> str:
+    """Unsigned JWT-shaped token; the stub adapter accepts it as is."""
+    claims = {"sub": sub}
+    if exp is not None:
+        claims["exp"] = exp
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload}.sig"
+
+
+class _StubAuth(TokenCacheMixin):
+    def __init__(self):
+        self.verifications = 0
+        self.users: Dict[str, User] = {}
+
+    async def verify_token(self, token: str) -> Optional[User]:
+        self.verifications += 1
+        payload = token.split(".")[1]
+        sub = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["sub"]
+        return self.users.get(sub)
+
+    async def sign_out(self, token: str) -> bool:
+        return True
+
+    async def update_password(self, user_id: str, old_password: str, new_password: str) -> bool:
+        return True
+
+    async def delete_user(self, user_id: str) -> bool:
+        self.users.pop(user_id, None)
+        return True
+
+
+@pytest.fixture
+def auth() -> _StubAuth:
+    stub = _StubAuth()
+    stub.users["u1"] = User(id="u1", email="u1@example.com", metadata={"role": "member"})
+    return stub
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_cached(auth):
+    token = _jwt("u1")
+
+    first = await auth.verify_token_cached(token)
+    second = await auth.verify_token_cached(token)
+
+    assert first.id == second.id == "u1"
+    assert auth.verifications == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_not_cached(auth):
+    token = _jwt("nobody")
+
+    assert await auth.verify_token_cached(token) is None
+    assert await auth.verify_token_cached(token) is None
+    assert auth.verifications == 2
+
+
+@pytest.mark.asyncio
+async def test_entry_expires_with_the_token(auth, monkeypatch):
+    token = _jwt("u1", exp=time.time() + 10)
+    await auth.verify_token_cached(token)
+
+    # Well inside the TTL, but past the token's exp
+    later = time.monotonic() + 11
+    monkeypatch.setattr(auth_adapter.time, "monotonic", lambda: later)
+    await auth.verify_token_cached(token)
+
+    assert auth.verifications == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_not_cached(auth):
+    token = _jwt("u1", exp=time.time() - 1)
+
+    await auth.verify_token_cached(token)
+    await auth.verify_token_cached(token)
+
+    assert auth.verifications == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_copies(auth):
+    token = _jwt("u1")
+
+    first = await auth.verify_token_cached(token)
+    first.email = "changed@example.com"
+    first.metadata["role"] = "admin"
+    second = await auth.verify_token_cached(token)
+
+    assert second.email == "u1@example.com"
+    assert second.metadata == {"role": "member"}
+
+
+@pytest.mark.asyncio
+async def test_sign_out_drops_the_token(auth):
+    token = _jwt("u1")
+    await auth.verify_token_cached(token)
+
+    await auth.sign_out(token)
+    await auth.verify_token_cached(token)
+
+    assert auth.verifications == 2
+
+
+@pytest.mark.asyncio
+async def test_password_change_drops_all_user_tokens(auth):
+    tokens = [_jwt("u1", exp=time.time() + 100 + i) for i in range(2)]
+    for token in tokens:
+        await auth.verify_token_cached(token)
+
+    await auth.update_password("u1", "old", "new")
+    for token in tokens:
+        await auth.verify_token_cached(token)
+
+    assert auth.verifications == 4
+
+
+@pytest.mark.asyncio
+async def test_deleted_user_stops_verifying(auth):
+    token = _jwt("u1")
+    await auth.verify_token_cached(token)
+
+    await auth.delete_user("u1")
+
+    assert await auth.verify_token_cached(token) is None
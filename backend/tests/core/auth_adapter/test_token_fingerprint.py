@@ -0,0 +1,28 @@
+"""
+token_fingerprint() Tests
+
+- Fingerprints are 16-byte keyed blake2b digests, stable within a process
+- A caller-supplied key gives fingerprints that can be shared across processes
+
+Run with: pytest tests/core/auth_adapter/test_token_fingerprint.py -v
+"""
+
+import hashlib
+
+from core.auth_adapter import token_fingerprint
+
+
+def test_fingerprint_is_stable_and_distinct():
+    first = token_fingerprint("token-a")
+
+    assert len(first) == 16
+    assert token_fingerprint("token-a") == first
+    assert token_fingerprint("token-b") != first
+
+
+def test_fingerprint_with_explicit_key():
+    key = b"server-secret"
+    expected = hashlib.blake2b(b"token-a", key=key, digest_size=16).digest()
+
+    assert token_fingerprint("token-a", key=key) == expected
+    assert token_fingerprint("token-a") != expected
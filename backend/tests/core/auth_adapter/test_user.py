@@ -0,0 +1,50 @@
+"""
+Auth Record Tests
+
+- User and Session are slotted; OAuthConfig is slotted and read-only
+- User.from_cached() fills every other field with its declared default
+
+Run with: pytest tests/core/auth_adapter/test_user.py -v
+"""
+
+from dataclasses import FrozenInstanceError, fields
+
+import pytest
+
+from core.auth_adapter.adapter import OAuthConfig, Session, User
+
+
+def _oauth_config() -> OAuthConfig:
+    return OAuthConfig(
+        provider="github",
+        client_id="id",
+        client_secret="secret",
+        redirect_uri="http://localhost/callback",
+        scopes=["read:user"],
+    )
+
+
+@pytest.mark.parametrize("record", [
+    User(id="u1"),
+    Session(access_token="token"),
+    _oauth_config(),
+], ids=["User", "Session", "OAuthConfig"])
+def test_records_are_slotted(record):
+    assert not hasattr(record, "__dict__")
+    with pytest.raises((AttributeError, TypeError)):
+        record.unexpected = 1
+
+
+def test_oauth_config_is_read_only():
+    config = _oauth_config()
+
+    with pytest.raises(FrozenInstanceError):
+        config.client_secret = "changed"
+
+
+def test_from_cached_uses_declared_defaults():
+    user = User.from_cached("u1", "u1@example.com")
+
+    assert user == User(id="u1", email="u1@example.com")
+    for f in fields(User):
+        getattr(user, f.name)
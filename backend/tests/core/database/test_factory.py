@@ -0,0 +1,144 @@
+"""
+Database Factory Tests
+
+- The provider is detected from the environment once per process
+- get_database_adapter(force_new=True) detects the provider again
+- A context's _adapter_cv override is seen only in that context, and
+  force_new/close_database act on the override rather than the singleton
+- Importing one adapter module does not import the others
+
+Run with: pytest tests/core/database/test_factory.py -v
+"""
+
+import asyncio
+import contextvars
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.database import factory
+from core.database.factory import DatabaseProvider
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def stub_adapters(monkeypatch):
+    classes = {provider: type(provider.value, (), {}) for provider in DatabaseProvider}
+    monkeypatch.setattr(factory, "_PROVIDER_CLASSES", classes)
+    monkeypatch.setattr(factory, "_adapter_instance", None)
+    factory.get_database_provider.cache_clear()
+    yield
+    factory.get_database_provider.cache_clear()
+
+
+_PROVIDER_ENV = [
+    "CLOUD_PROVIDER", "DATABASE_PROVIDER", "SUPABASE_URL", "ALIYUN_RDS_HOST",
+    "ALIYUN_ACCESS_KEY_ID", "TENCENT_RDS_HOST", "TENCENT_SECRET_ID", "DATABASE_URL",
+]
+
+
+@pytest.fixture
+def provider_env(monkeypatch):
+    """No provider settings, and no cached detection."""
+    for name in _PROVIDER_ENV:
+        monkeypatch.delenv(name, raising=False)
+    factory.get_database_provider.cache_clear()
+    yield monkeypatch
+    factory.get_database_provider.cache_clear()
+
+
+@pytest.mark.parametrize("env, provider", [
+    ({}, DatabaseProvider.SUPABASE),
+    ({"CLOUD_PROVIDER": "Alibaba"}, DatabaseProvider.ALIYUN),
+    ({"CLOUD_PROVIDER": "local", "SUPABASE_URL": "https://x.supabase.co"}, DatabaseProvider.LOCAL),
+    ({"DATABASE_PROVIDER": "tencent", "DATABASE_URL": "postgresql://db"}, DatabaseProvider.TENCENT),
+    ({"DATABASE_PROVIDER": "oracle", "DATABASE_URL": "postgresql://db"}, DatabaseProvider.LOCAL),
+    ({"TENCENT_SECRET_ID": "id", "DATABASE_URL": "postgresql://db"}, DatabaseProvider.TENCENT),
+])
+def test_provider_detection(provider_env, env, provider):
+    for name, value in env.items():
+        provider_env.setenv(name, value)
+
+    assert factory.get_database_provider() is provider
+
+
+def test_provider_is_detected_once(provider_env):
+    provider_env.setenv("CLOUD_PROVIDER", "aliyun")
+    assert factory.get_database_provider() is DatabaseProvider.ALIYUN
+
+    provider_env.setenv("CLOUD_PROVIDER", "local")
+    assert factory.get_database_provider() is DatabaseProvider.ALIYUN
+
+    factory.get_database_provider.cache_clear()
+    assert factory.get_database_provider() is DatabaseProvider.LOCAL
+
+
+def test_force_new_detects_provider_again(stub_adapters, monkeypatch):
+    monkeypatch.setenv("CLOUD_PROVIDER", "tencent")
+    assert type(factory.get_database_adapter()).__name__ == "tencent"
+
+    monkeypatch.setenv("CLOUD_PROVIDER", "aliyun")
+    assert type(factory.get_database_adapter()).__name__ == "tencent"
+    assert type(factory.get_database_adapter(force_new=True)).__name__ == "aliyun"
+
+
+class _ClosingAdapter:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_override_is_scoped_to_its_context(stub_adapters, monkeypatch):
+    monkeypatch.setenv("CLOUD_PROVIDER", "local")
+    singleton = factory.get_database_adapter()
+    override = _ClosingAdapter()
+
+    def with_override():
+        factory._adapter_cv.set(override)
+        return factory.get_database_adapter()
+
+    assert contextvars.copy_context().run(with_override) is override
+    assert factory.get_database_adapter() is singleton
+
+
+@pytest.mark.asyncio
+async def test_force_new_and_close_act_on_the_override(stub_adapters, monkeypatch):
+    monkeypatch.setenv("CLOUD_PROVIDER", "local")
+    singleton = factory.get_database_adapter()
+    override = _ClosingAdapter()
+
+    async def in_task():
+        # Tasks run in a copy of the context, so the override stays in here
+        factory._adapter_cv.set(override)
+        fresh = factory.get_database_adapter(force_new=True)
+        assert factory.get_database_adapter() is fresh
+
+        factory._adapter_cv.set(override)
+        await factory.close_database()
+        return factory._adapter_cv.get()
+
+    assert await asyncio.create_task(in_task()) is None
+    assert override.closed
+    assert factory.get_database_adapter() is singleton
+
+
+def test_adapter_modules_are_imported_independently():
+    code = (
+        "import sys\n"
+        "from core.database.adapters.tencent_adapter import TencentAdapter\n"
+        "others = [name for name in sys.modules if name.startswith('core.database.adapters.')\n"
+        "          and name != 'core.database.adapters.tencent_adapter']\n"
+        "print(others)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,906 @@
+"""
+LocalAdapter Tests
+
+Covers:
+- json/jsonb columns on the raw asyncpg pool are decoded to Python objects
+- Reads go to the asyncpg pool and return its Records unless as_dict
+- initialize() opens a sized asyncpg pool next to the SQLAlchemy engine
+- Statement cache sizes come from the environment, 0 disabling them
+- Engine pool sizing comes from the environment; stats report saturation
+- execute_many_queries() runs its queries concurrently, results in order
+- health_check() is one fetchval on the asyncpg pool
+- CRUD statements are cached templates in both bind styles
+- bulk_copy() streams rows through COPY and returns the copied row count
+- The server version is read once, at initialize()
+- Introspection queries pg_catalog, resolving names with to_regclass
+- Introspection results are cached for a TTL, loaded once under concurrent
+  misses, and dropped by DDL or invalidate_schema_cache()
+- select_after() pages with a bound seek on the cursor column
+- select() binds LIMIT/OFFSET, so paging reuses one statement; ORDER BY is
+  validated and quoted
+- subscribe() warns about missing realtime once per process
+- :name binds are rewritten to $N once per SQL string
+- List-like filter values compile to col = ANY(...), one shape for any length
+- insert_many() sends one executemany, or multi-row INSERTs with returning,
+  in one transaction
+- request_scope() runs reads, returning writes and insert_many on the
+  scope's session, commits once, and rolls back on error
+- A scope's session is refused to other tasks and to other adapters
+- get_table_schema() hands out copies, so callers cannot corrupt the cache
+
+Tests marked as needing a database run only when TEST_DATABASE_URL points at
+a PostgreSQL instance (asyncpg DSN, e.g. postgresql://user:pw@host/db).
+
+Run with: pytest tests/core/database/test_local_adapter.py -v
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from core.database.adapter import RealtimeEvent
+from core.database.adapters import local_adapter
+from core.database.adapters.local_adapter import (
+    LocalAdapter,
+    _compile_sql,
+    _delete_sql,
+    _init_asyncpg_connection,
+    _insert_sql,
+    _update_sql,
+)
+
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+needs_database = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+
+class _CodecRecorder:
+    """Stands in for an asyncpg connection during pool init."""
+
+    def __init__(self):
+        self.codecs: Dict[str, Dict[str, Any]] = {}
+
+    async def set_type_codec(self, type_name, *, encoder, decoder, schema):
+        self.codecs[type_name] = {"encoder": encoder, "decoder": decoder, "schema": schema}
+
+
+@pytest.mark.asyncio
+async def test_pool_init_registers_json_codecs():
+    conn = _CodecRecorder()
+
+    await _init_asyncpg_connection(conn)
+
+    assert set(conn.codecs) == {"json", "jsonb"}
+    value = {"tags": ["a", "b"], "count": 2, "nested": {"ok": True}}
+    for codec in conn.codecs.values():
+        assert codec["schema"] == "pg_catalog"
+        assert codec["decoder"](codec["encoder"](value)) == value
+
+
+@needs_database
+@pytest.mark.asyncio
+async def test_jsonb_round_trip():
+    asyncpg = pytest.importorskip("asyncpg")
+    pool = await asyncpg.create_pool(
+        TEST_DATABASE_URL, min_size=1, max_size=1, init=_init_asyncpg_connection
+    )
+    value: List[Any] = [{"id": 1, "tags": ["x"]}, None, 3.5]
+    try:
+        row = await pool.fetchrow(
+            "SELECT $1::jsonb AS doc, '{\"a\": 1}'::json AS raw", value
+        )
+    finally:
+        await pool.close()
+
+    assert row["doc"] == value
+    assert row["raw"] == {"a": 1}
+
+
+class _Result:
+    def __init__(self, rows: List[Dict[str, Any]], rowcount: int = 0):
+        self.rows = rows
+        self.rowcount = rowcount
+
+    def mappings(self) -> "_Result":
+        return self
+
+    def all(self) -> List[Dict[str, Any]]:
+        return list(self.rows)
+
+    def first(self) -> Optional[Dict[str, Any]]:
+        return self.rows[0] if self.rows else None
+
+    def scalar(self) -> Any:
+        return next(iter(self.rows[0].values())) if self.rows else None
+
+
+class _ScopedSession:
+    """Records what a request_scope() session is asked to do."""
+
+    def __init__(self):
+        self.statements: List[Any] = []
+        self.events: List[str] = []
+
+    async def connection(self) -> "_ScopedSession":
+        return self
+
+    async def exec_driver_sql(self, sql: str, args: Any) -> _Result:
+        self.statements.append((sql, args))
+        return _Result([{"id": 1}])
+
+    async def execute(self, statement: Any, params: Any) -> _Result:
+        self.statements.append((str(statement), params))
+        return _Result([], rowcount=1)
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        self.events.append("savepoint")
+        yield
+
+    async def commit(self) -> None:
+        self.events.append("commit")
+
+    async def rollback(self) -> None:
+        self.events.append("rollback")
+
+    async def __aenter__(self) -> "_ScopedSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.events.append("close")
+
+
+class _UnusablePool:
+    def __getattr__(self, name: str):
+        raise AssertionError(f"asyncpg pool used inside request_scope(): {name}")
+
+
+@pytest.fixture
+def scoped_adapter():
+    adapter = LocalAdapter()
+    adapter._session_factory = _ScopedSession
+    adapter._asyncpg_pool = _UnusablePool()
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_request_scope_runs_everything_on_its_session(scoped_adapter):
+    async with scoped_adapter.request_scope() as session:
+        await scoped_adapter.insert("items", {"id": 1}, returning=["id"])
+        await scoped_adapter.insert("items", {"id": 2})
+        await scoped_adapter.insert_many("items", [{"id": 3}, {"id": 4}])
+        rows = await scoped_adapter.select("items", where={"id": 1}, as_dict=True)
+        value = await scoped_adapter.fetch_value("SELECT count(*) FROM items")
+
+    assert rows == [{"id": 1}]
+    assert value == 1
+    assert len(session.statements) == 5
+    assert session.events == ["savepoint", "commit", "close"]
+
+
+@pytest.mark.asyncio
+async def test_request_scope_rolls_back_on_error(scoped_adapter):
+    with pytest.raises(RuntimeError, match="boom"):
+        async with scoped_adapter.request_scope() as session:
+            await scoped_adapter.insert("items", {"id": 1})
+            raise RuntimeError("boom")
+
+    assert session.events == ["rollback", "close"]
+
+
+@pytest.mark.asyncio
+async def test_request_scope_session_is_not_shared_with_other_tasks(scoped_adapter):
+    async with scoped_adapter.request_scope():
+        task = asyncio.create_task(scoped_adapter.fetch_value("SELECT 1"))
+        with pytest.raises(RuntimeError, match="another task"):
+            await task
+
+        results = await scoped_adapter.execute_many_queries(
+            [("SELECT 1", None), ("SELECT 2", None)]
+        )
+
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_scope_is_per_adapter(scoped_adapter):
+    other = LocalAdapter()
+    other._asyncpg_pool = _UnusablePool()
+
+    async with scoped_adapter.request_scope():
+        with pytest.raises(AssertionError, match="fetchval"):
+            await other.fetch_value("SELECT 1")
+
+
+@pytest.mark.asyncio
+async def test_get_table_schema_returns_a_copy_of_the_cache(monkeypatch):
+    adapter = LocalAdapter()
+    calls = []
+
+    async def execute_query(query: str, params: Optional[Dict[str, Any]] = None):
+        calls.append(params)
+        return [{"column_name": "id"}, {"column_name": "name"}]
+
+    monkeypatch.setattr(adapter, "execute_query", execute_query)
+
+    first = await adapter.get_table_schema("items")
+    first.clear()
+    second = await adapter.get_table_schema("items")
+
+    assert [column["column_name"] for column in second] == ["id", "name"]
+    assert len(calls) == 1
+
+
+class _Pool:
+    """Records what the raw asyncpg pool is asked to do."""
+
+    def __init__(self, rows: Optional[List[Dict[str, Any]]] = None):
+        self.rows = rows if rows is not None else [{"id": 1}]
+        self.calls: List[Any] = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.calls.append(("acquire",))
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.calls.append(("begin",))
+        yield
+        self.calls.append(("commit",))
+
+    async def executemany(self, sql: str, args: List[Any]) -> None:
+        self.calls.append(("executemany", sql, args))
+
+    async def copy_records_to_table(self, table: str, *, records: Any, columns: List[str]) -> str:
+        if hasattr(records, "__aiter__"):
+            rows = [row async for row in records]
+        else:
+            rows = list(records)
+        self.calls.append(("copy", table, columns, rows))
+        return f"COPY {len(rows)}"
+
+    async def fetch(self, sql: str, *args: Any) -> List[Dict[str, Any]]:
+        self.calls.append(("fetch", sql, args))
+        return self.rows
+
+    async def fetchrow(self, sql: str, *args: Any) -> Optional[Dict[str, Any]]:
+        self.calls.append(("fetchrow", sql, args))
+        return self.rows[0] if self.rows else None
+
+    async def fetchval(self, sql: str, *args: Any) -> Any:
+        self.calls.append(("fetchval", sql, args))
+        return next(iter(self.rows[0].values())) if self.rows else None
+
+    def get_size(self) -> int:
+        return 30
+
+    def get_idle_size(self) -> int:
+        return 3
+
+    def get_max_size(self) -> int:
+        return 30
+
+
+@pytest.fixture
+def pool():
+    return _Pool()
+
+
+@pytest.fixture
+def pool_adapter(pool):
+    adapter = LocalAdapter()
+    adapter._asyncpg_pool = pool
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_execute_query_returns_pool_records(pool_adapter, pool):
+    rows = await pool_adapter.execute_query(
+        "SELECT * FROM items WHERE id = :id", {"id": 7}
+    )
+
+    assert rows is pool.rows
+    assert pool.calls == [("fetch", "SELECT * FROM items WHERE id = $1", (7,))]
+
+
+@pytest.mark.asyncio
+async def test_as_dict_copies_rows(pool_adapter, pool):
+    rows = await pool_adapter.execute_query("SELECT * FROM items", as_dict=True)
+    row = await pool_adapter.fetch_one("SELECT * FROM items", as_dict=True)
+
+    assert rows == [{"id": 1}]
+    assert rows[0] is not pool.rows[0]
+    assert row == {"id": 1} and row is not pool.rows[0]
+
+
+@pytest.mark.asyncio
+async def test_reads_require_initialize():
+    with pytest.raises(RuntimeError, match="not initialized"):
+        await LocalAdapter().execute_query("SELECT 1")
+
+
+def test_compile_sql_numbers_binds_in_order():
+    sql, names = _compile_sql(
+        "SELECT * FROM t WHERE a = :a AND b = :b OR a > :a AND c = :c"
+    )
+
+    assert sql == "SELECT * FROM t WHERE a = $1 AND b = $2 OR a > $1 AND c = $3"
+    assert names == ("a", "b", "c")
+
+
+def test_compile_sql_leaves_casts_and_escapes_alone():
+    sql, names = _compile_sql("SELECT '{}'::jsonb, x\\:y, now()::date")
+
+    assert sql == "SELECT '{}'::jsonb, x\\:y, now()::date"
+    assert names == ()
+
+
+def test_compile_sql_is_cached():
+    query = "SELECT * FROM compile_cache_test WHERE id = :id"
+    first = _compile_sql(query)
+    hits = _compile_sql.cache_info().hits
+
+    assert _compile_sql(query) is first
+    assert _compile_sql.cache_info().hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_list_filters_use_any(pool_adapter, pool):
+    await pool_adapter.select("items", where={"id": [1, 2, 3], "owner": "u1"})
+    await pool_adapter.select("items", where={"id": (4,), "owner": "u2"})
+    await pool_adapter.delete("items", where={"id": {5, 6}}, returning=["id"])
+
+    (_, first_sql, first_args), (_, second_sql, second_args), (_, delete_sql, delete_args) = pool.calls
+    assert first_sql == "SELECT * FROM items WHERE id = ANY($1) AND owner = $2"
+    assert second_sql == first_sql
+    assert first_args == ([1, 2, 3], "u1")
+    assert second_args == ((4,), "u2")
+    assert delete_sql == "DELETE FROM items WHERE id = ANY($1) RETURNING id"
+    assert isinstance(delete_args[0], list) and sorted(delete_args[0]) == [5, 6]
+
+
+@pytest.mark.asyncio
+async def test_update_filters_use_any(pool_adapter, pool):
+    await pool_adapter.update(
+        "items", {"state": "done"}, where={"id": [1, 2]}, returning=["id"]
+    )
+
+    assert pool.calls == [(
+        "fetch",
+        "UPDATE items SET state = $1 WHERE id = ANY($2) RETURNING id",
+        ("done", [1, 2]),
+    )]
+
+
+@pytest.mark.asyncio
+async def test_insert_many_uses_one_executemany(pool_adapter, pool):
+    result = await pool_adapter.insert_many(
+        "items", [{"id": 1, "name": "a"}, {"id": 2}, {"name": "c", "id": 3}]
+    )
+
+    assert result == []
+    assert pool.calls == [
+        ("acquire",),
+        ("begin",),
+        (
+            "executemany",
+            "INSERT INTO items (id, name) VALUES ($1, $2)",
+            [(1, "a"), (2, None), (3, "c")],
+        ),
+        ("commit",),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_insert_many_returning_batches_rows(pool_adapter, pool):
+    rows = [{"id": i} for i in range(5)]
+
+    result = await pool_adapter.insert_many("items", rows, returning=["id"], batch_size=2)
+
+    fetches = [call for call in pool.calls if call[0] == "fetch"]
+    assert [call[1] for call in fetches] == [
+        "INSERT INTO items (id) VALUES ($1), ($2) RETURNING id",
+        "INSERT INTO items (id) VALUES ($1), ($2) RETURNING id",
+        "INSERT INTO items (id) VALUES ($1) RETURNING id",
+    ]
+    assert [call[2] for call in fetches] == [(0, 1), (2, 3), (4,)]
+    assert len(result) == 3
+    assert pool.calls.count(("begin",)) == 1
+
+
+@pytest.mark.asyncio
+async def test_insert_many_stays_under_the_bind_limit(pool_adapter, pool, monkeypatch):
+    monkeypatch.setattr(local_adapter, "_MAX_BIND_PARAMS", 4)
+    rows = [{"a": i, "b": i} for i in range(3)]
+
+    await pool_adapter.insert_many("items", rows, returning=["a"])
+
+    fetches = [call for call in pool.calls if call[0] == "fetch"]
+    assert [len(call[2]) for call in fetches] == [4, 2]
+
+
+@pytest.mark.asyncio
+async def test_insert_many_without_rows_is_a_no_op(pool_adapter, pool):
+    assert await pool_adapter.insert_many("items", []) == []
+    assert pool.calls == []
+
+
+class _EngineConnection:
+    def __init__(self, engine: "_Engine"):
+        self.engine = engine
+
+    async def scalar(self, statement: Any) -> str:
+        self.engine.version_queries += 1
+        return "PostgreSQL 16.4"
+
+
+class _Engine:
+    """Stands in for the SQLAlchemy engine built by initialize()."""
+
+    def __init__(self, url: str, **kwargs: Any):
+        self.url = url
+        self.kwargs = kwargs
+        self.version_queries = 0
+
+    @asynccontextmanager
+    async def connect(self):
+        yield _EngineConnection(self)
+
+    async def dispose(self) -> None:
+        pass
+
+
+@pytest.fixture
+def initialized(monkeypatch):
+    """initialize() against a recording engine and asyncpg pool."""
+    asyncpg = pytest.importorskip("asyncpg")
+    created: Dict[str, Any] = {}
+
+    def create_engine(url: str, **kwargs: Any) -> _Engine:
+        created["engine"] = _Engine(url, **kwargs)
+        return created["engine"]
+
+    async def create_pool(dsn: str, **kwargs: Any) -> _Pool:
+        created["pool_dsn"] = dsn
+        created["pool_kwargs"] = kwargs
+        return _Pool()
+
+    monkeypatch.setattr(local_adapter, "create_async_engine", create_engine)
+    monkeypatch.setattr(asyncpg, "create_pool", create_pool)
+    monkeypatch.setenv("DATABASE_URL", "postgresql://user:pw@db:5432/app")
+
+    async def initialize() -> Dict[str, Any]:
+        adapter = LocalAdapter()
+        await adapter.initialize()
+        created["adapter"] = adapter
+        return created
+
+    return initialize
+
+
+@pytest.mark.asyncio
+async def test_initialize_opens_sized_asyncpg_pool(initialized):
+    created = await initialized()
+
+    assert created["engine"].url == "postgresql+asyncpg://user:pw@db:5432/app"
+    assert created["pool_dsn"] == "postgresql://user:pw@db:5432/app"
+    assert created["pool_kwargs"]["min_size"] == local_adapter.ASYNCPG_POOL_MIN_SIZE
+    assert created["pool_kwargs"]["max_size"] == local_adapter.ASYNCPG_POOL_MAX_SIZE
+    assert created["pool_kwargs"]["init"] is _init_asyncpg_connection
+
+
+@pytest.mark.asyncio
+async def test_fetch_helpers_use_the_pool(pool_adapter, pool):
+    row = await pool_adapter.fetch_one("SELECT * FROM items WHERE id = :id", {"id": 1})
+    value = await pool_adapter.fetch_value("SELECT count(*) FROM items")
+
+    assert row is pool.rows[0]
+    assert value == 1
+    assert [call[0] for call in pool.calls] == ["fetchrow", "fetchval"]
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_defaults(initialized, monkeypatch):
+    monkeypatch.delenv("POSTGRES_STATEMENT_CACHE_SIZE", raising=False)
+    monkeypatch.delenv("POSTGRES_PREPARED_STATEMENT_CACHE_SIZE", raising=False)
+
+    created = await initialized()
+
+    assert created["engine"].kwargs["connect_args"] == {
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 256,
+    }
+    assert created["pool_kwargs"]["statement_cache_size"] == 1024
+
+
+@pytest.mark.asyncio
+async def test_statement_caches_can_be_disabled(initialized, monkeypatch):
+    monkeypatch.setenv("POSTGRES_STATEMENT_CACHE_SIZE", "0")
+    monkeypatch.setenv("POSTGRES_PREPARED_STATEMENT_CACHE_SIZE", "0")
+
+    created = await initialized()
+
+    assert created["engine"].kwargs["connect_args"] == {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+    }
+    assert created["pool_kwargs"]["statement_cache_size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_engine_pool_sizing(initialized, monkeypatch):
+    monkeypatch.delenv("POSTGRES_POOL_SIZE", raising=False)
+    monkeypatch.setenv("POSTGRES_MAX_OVERFLOW", "15")
+
+    created = await initialized()
+
+    kwargs = created["engine"].kwargs
+    assert kwargs["pool_size"] == 25
+    assert kwargs["max_overflow"] == 15
+    assert kwargs["pool_pre_ping"] is True
+    assert created["adapter"]._pool_capacity == 40
+
+
+class _QueuePool:
+    def size(self) -> int:
+        return 10
+
+    def checkedin(self) -> int:
+        return 2
+
+    def overflow(self) -> int:
+        return 5
+
+    def checkedout(self) -> int:
+        return 13
+
+
+def test_connection_stats_report_saturation(pool_adapter):
+    engine = _Engine("postgresql+asyncpg://db")
+    engine.pool = _QueuePool()
+    pool_adapter._engine = engine
+    pool_adapter._pool_capacity = 20
+
+    stats = pool_adapter.get_connection_stats()
+
+    assert stats["pool"]["checked_out"] == 13
+    assert stats["pool"]["saturation"] == 0.65
+    assert stats["pool"]["saturated"] is False
+    assert stats["asyncpg_pool"]["in_use"] == 27
+    assert stats["asyncpg_pool"]["saturation"] == 0.9
+    assert stats["asyncpg_pool"]["saturated"] is True
+
+
+class _SlowPool(_Pool):
+    """Holds every fetch until ``expected`` of them are in flight."""
+
+    def __init__(self, expected: int):
+        super().__init__()
+        self.expected = expected
+        self.in_flight = 0
+        self.all_started = asyncio.Event()
+
+    async def fetch(self, sql: str, *args: Any) -> List[Dict[str, Any]]:
+        self.in_flight += 1
+        if self.in_flight == self.expected:
+            self.all_started.set()
+        await self.all_started.wait()
+        return [{"sql": sql}]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_queries_runs_concurrently():
+    adapter = LocalAdapter()
+    adapter._asyncpg_pool = _SlowPool(expected=3)
+
+    results = await asyncio.wait_for(
+        adapter.execute_many_queries(
+            [("SELECT 1", None), ("SELECT :x", {"x": 2}), ("SELECT 3", None)]
+        ),
+        timeout=1,
+    )
+
+    assert [rows[0]["sql"] for rows in results] == ["SELECT 1", "SELECT $1", "SELECT 3"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_uses_pool_fetchval(pool_adapter, pool):
+    pool_adapter._initialized = True
+
+    health = await pool_adapter.health_check()
+
+    assert health["status"] == "healthy"
+    assert pool.calls == [("fetchval", "SELECT 1", ())]
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_pool_errors(pool_adapter, monkeypatch):
+    pool_adapter._initialized = True
+
+    async def fetchval(sql: str, *args: Any) -> Any:
+        raise ConnectionError("pool closed")
+
+    monkeypatch.setattr(pool_adapter._asyncpg_pool, "fetchval", fetchval)
+
+    health = await pool_adapter.health_check()
+
+    assert health == {"status": "unhealthy", "provider": "local", "error": "pool closed"}
+
+
+@pytest.mark.asyncio
+async def test_health_check_before_initialize():
+    health = await LocalAdapter().health_check()
+
+    assert health["status"] == "unhealthy"
+    assert health["error"] == "Not initialized"
+
+
+def test_crud_templates_carry_both_bind_styles():
+    insert = _insert_sql("items", ("id", "name"), ("id",))
+    update = _update_sql("items", ("name",), (("id", False),), ())
+    delete = _delete_sql("items", (("id", True),), ())
+
+    assert insert.named == "INSERT INTO items (id, name) VALUES (:id, :name) RETURNING id"
+    assert insert.positional == "INSERT INTO items (id, name) VALUES ($1, $2) RETURNING id"
+    assert insert.names == ("id", "name")
+    assert update.named == "UPDATE items SET name = :data_name WHERE id = :where_id"
+    assert update.names == ("data_name", "where_id")
+    assert delete.positional == "DELETE FROM items WHERE id = ANY($1)"
+    assert _insert_sql("items", ("id", "name"), ("id",)) is insert
+
+
+@pytest.mark.asyncio
+async def test_insert_picks_the_template_style(pool_adapter, pool, monkeypatch):
+    mutations = []
+
+    async def execute_mutation(query: str, params: Optional[Dict[str, Any]] = None) -> int:
+        mutations.append((query, params))
+        return 1
+
+    monkeypatch.setattr(pool_adapter, "execute_mutation", execute_mutation)
+
+    await pool_adapter.insert("items", {"name": "a", "id": 1})
+    row = await pool_adapter.insert("items", {"name": "a", "id": 1}, returning=["id"])
+
+    assert mutations == [
+        ("INSERT INTO items (id, name) VALUES (:id, :name)", {"name": "a", "id": 1})
+    ]
+    assert pool.calls == [(
+        "fetch", "INSERT INTO items (id, name) VALUES ($1, $2) RETURNING id", (1, "a")
+    )]
+    assert row == {"id": 1}
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_streams_rows_through_copy(pool_adapter, pool):
+    async def rows():
+        for i in range(3):
+            yield (i, f"name-{i}")
+
+    copied = await pool_adapter.bulk_copy("items", ["id", "name"], rows())
+
+    assert copied == 3
+    assert pool.calls == [
+        ("acquire",),
+        ("copy", "items", ["id", "name"], [(0, "name-0"), (1, "name-1"), (2, "name-2")]),
+    ]
+
+
+class _DriverConnection(_Pool):
+    def __init__(self):
+        super().__init__()
+        self.in_transaction = False
+
+    def is_in_transaction(self) -> bool:
+        return self.in_transaction
+
+
+class _CopySession(_ScopedSession):
+    """A scope session whose connection exposes the asyncpg driver connection."""
+
+    def __init__(self):
+        super().__init__()
+        self.driver_connection = _DriverConnection()
+
+    async def get_raw_connection(self) -> "_CopySession":
+        return self
+
+    async def exec_driver_sql(self, sql: str, args: Any = None) -> _Result:
+        self.driver_connection.in_transaction = True
+        return await super().exec_driver_sql(sql, args)
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_joins_the_request_scope(scoped_adapter):
+    scoped_adapter._session_factory = _CopySession
+
+    async with scoped_adapter.request_scope() as session:
+        copied = await scoped_adapter.bulk_copy("items", ["id"], [(1,), (2,)])
+        await scoped_adapter.bulk_copy("items", ["id"], [(3,)])
+
+    assert copied == 2
+    assert session.statements == [("SELECT 1", None)]
+    assert [call[3] for call in session.driver_connection.calls] == [[(1,), (2,)], [(3,)]]
+    assert session.events == ["commit", "close"]
+
+
+@pytest.mark.asyncio
+async def test_version_is_read_once(initialized):
+    created = await initialized()
+    adapter = created["adapter"]
+
+    first = await adapter.health_check()
+    second = await adapter.health_check()
+
+    assert first["version"] == second["version"] == "PostgreSQL 16.4"
+    assert created["engine"].version_queries == 1
+
+
+@pytest.mark.asyncio
+async def test_table_exists_queries_pg_catalog(pool_adapter, pool):
+    assert await pool_adapter.table_exists("public.items") is True
+
+    pool.rows = []
+    assert await pool_adapter.table_exists("missing") is False
+
+    (_, sql, args), (_, _, missing_args) = pool.calls
+    assert "pg_catalog.pg_class" in sql
+    assert "information_schema" not in sql
+    assert "to_regclass($1)" in sql
+    assert args == ("public.items",)
+    assert missing_args == ("missing",)
+
+
+@pytest.mark.asyncio
+async def test_get_table_schema_queries_pg_catalog(pool_adapter, pool):
+    pool.rows = [{"column_name": "id", "data_type": "bigint"}]
+
+    schema = await pool_adapter.get_table_schema("items")
+
+    (kind, sql, args), = pool.calls
+    assert kind == "fetch"
+    assert "pg_catalog.pg_attribute" in sql
+    assert "to_regclass($1)" in sql
+    assert "NOT a.attisdropped" in sql
+    assert args == ("items",)
+    assert schema == pool.rows
+
+
+@pytest.mark.asyncio
+async def test_table_exists_is_cached(pool_adapter, pool):
+    assert await pool_adapter.table_exists("items")
+    assert await pool_adapter.table_exists("items")
+    assert await pool_adapter.table_exists("other")
+
+    assert len(pool.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_schema_cache_expires(pool_adapter, pool, monkeypatch):
+    monkeypatch.setattr(local_adapter, "SCHEMA_CACHE_TTL_SECONDS", -1.0)
+
+    await pool_adapter.table_exists("items")
+    await pool_adapter.table_exists("items")
+
+    assert len(pool.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(pool_adapter, monkeypatch):
+    calls = []
+    release = asyncio.Event()
+
+    async def fetch_value(query: str, params: Optional[Dict[str, Any]] = None) -> int:
+        calls.append(params)
+        await release.wait()
+        return 1
+
+    monkeypatch.setattr(pool_adapter, "fetch_value", fetch_value)
+
+    lookups = asyncio.gather(*[pool_adapter.table_exists("items") for _ in range(5)])
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await lookups == [True] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_schema_cache_invalidation(pool_adapter, pool):
+    pool_adapter._session_factory = _ScopedSession
+    await pool_adapter.table_exists("items")
+    await pool_adapter.table_exists("other")
+
+    pool_adapter.invalidate_schema_cache("items")
+    await pool_adapter.table_exists("items")
+    await pool_adapter.table_exists("other")
+    assert len(pool.calls) == 3
+
+    await pool_adapter.execute_mutation("ALTER TABLE other ADD COLUMN note text")
+    await pool_adapter.table_exists("other")
+    assert len(pool.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_select_after_seeks_on_the_cursor(pool_adapter, pool):
+    await pool_adapter.select_after("items", "id", None, 50, columns=["id", "name"])
+    await pool_adapter.select_after("items", "id", 120, 50, columns=["id", "name"])
+
+    assert pool.calls == [
+        ("fetch", "SELECT id, name FROM items ORDER BY id LIMIT $1", (50,)),
+        ("fetch", "SELECT id, name FROM items WHERE id > $1 ORDER BY id LIMIT $2", (120, 50)),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("table, cursor_col", [
+    ("items; DROP TABLE items", "id"),
+    ("items", "id DESC"),
+])
+async def test_select_after_rejects_non_identifiers(pool_adapter, pool, table, cursor_col):
+    with pytest.raises(ValueError):
+        await pool_adapter.select_after(table, cursor_col, None, 10)
+
+    assert pool.calls == []
+
+
+@pytest.mark.asyncio
+async def test_select_binds_limit_and_offset(pool_adapter, pool):
+    for page in range(1, 4):
+        await pool_adapter.select(
+            "items", where={"owner": "u1"}, order_by="created_at desc", limit=20, offset=page * 20
+        )
+
+    assert {call[1] for call in pool.calls} == {
+        'SELECT * FROM items WHERE owner = $1 ORDER BY "created_at" DESC LIMIT $2 OFFSET $3'
+    }
+    assert [call[2] for call in pool.calls] == [("u1", 20, 20), ("u1", 20, 40), ("u1", 20, 60)]
+
+
+@pytest.mark.asyncio
+async def test_select_omits_unset_limit_and_offset(pool_adapter, pool):
+    await pool_adapter.select("items", columns=["id"], limit=5)
+    await pool_adapter.select("items", columns=["id"])
+
+    assert pool.calls == [
+        ("fetch", "SELECT id FROM items LIMIT $1", (5,)),
+        ("fetch", "SELECT id FROM items", ()),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", [
+    "id; DROP TABLE items",
+    "id DESC, (SELECT 1)",
+    "id SIDEWAYS",
+])
+async def test_select_rejects_invalid_order_by(pool_adapter, pool, order_by):
+    with pytest.raises(ValueError):
+        await pool_adapter.select("items", order_by=order_by)
+
+    assert pool.calls == []
+
+
+@pytest.mark.asyncio
+async def test_subscribe_warns_once(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(LocalAdapter, "_warned_no_realtime", False)
+    monkeypatch.setattr(local_adapter.logger, "warning", warnings.append)
+    first, second = LocalAdapter(), LocalAdapter()
+
+    subscription_id = await first.subscribe("items", RealtimeEvent.INSERT, lambda change: None)
+    await first.subscribe("items", RealtimeEvent.UPDATE, lambda change: None)
+    await second.subscribe("items", RealtimeEvent.DELETE, lambda change: None)
+
+    assert len(warnings) == 1
+    assert first._subscriptions[subscription_id]["table"] == "items"
+
+    await first.unsubscribe(subscription_id)
+    assert subscription_id not in first._subscriptions
@@ -0,0 +1,168 @@
+"""
+SupabaseAdapter Tests
+
+Covers:
+- execute_many_queries() runs its queries concurrently, results in order
+- Queries and mutations given a session run on it without committing;
+  other mutations check out a session and commit it
+- Reads return the session's mapping rows, not dict copies
+- Health checks and table_exists() run precompiled text() statements
+
+Run with: pytest tests/core/database/test_supabase_adapter.py -v
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from core.database.adapters import supabase_adapter
+from core.database.adapters.supabase_adapter import SupabaseAdapter
+
+
+@pytest.mark.asyncio
+async def test_execute_many_queries_runs_concurrently(monkeypatch):
+    started = []
+    all_started = asyncio.Event()
+
+    async def execute_query(
+        query: str, params: Optional[Dict[str, Any]] = None, use_read_replica: bool = False
+    ):
+        started.append(query)
+        if len(started) == 2:
+            all_started.set()
+        await all_started.wait()
+        return [{"query": query, "replica": use_read_replica}]
+
+    monkeypatch.setattr(supabase_adapter, "execute_query", execute_query)
+
+    results = await asyncio.wait_for(
+        SupabaseAdapter().execute_many_queries(
+            [("SELECT 1", None), ("SELECT 2", None)], use_read_replica=True
+        ),
+        timeout=1,
+    )
+
+    assert results == [
+        [{"query": "SELECT 1", "replica": True}],
+        [{"query": "SELECT 2", "replica": True}],
+    ]
+
+
+class _Result:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.rowcount = len(rows)
+
+    def mappings(self) -> "_Result":
+        return self
+
+    def all(self) -> List[Dict[str, Any]]:
+        return list(self.rows)
+
+    def scalar(self) -> Any:
+        return next(iter(self.rows[0].values())) if self.rows else None
+
+
+class _Session:
+    def __init__(self):
+        self.statements: List[Any] = []
+        self.commits = 0
+
+    async def execute(self, statement: Any, params: Any = None) -> _Result:
+        self.statements.append((statement, params))
+        return _Result([{"id": 1}])
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.fixture
+def checkouts(monkeypatch):
+    """Sessions handed out by core.services.db.get_session."""
+    sessions: List[_Session] = []
+
+    @asynccontextmanager
+    async def get_session():
+        sessions.append(_Session())
+        yield sessions[-1]
+
+    monkeypatch.setattr(supabase_adapter, "get_session", get_session)
+    return sessions
+
+
+@pytest.mark.asyncio
+async def test_caller_session_is_reused(checkouts):
+    adapter = SupabaseAdapter()
+    session = _Session()
+
+    rows = await adapter.execute_query("SELECT id FROM items", session=session)
+    count = await adapter.execute_mutation(
+        "UPDATE items SET name = :name", {"name": "a"}, session=session
+    )
+
+    assert rows == [{"id": 1}]
+    assert count == 1
+    assert [str(statement) for statement, _ in session.statements] == [
+        "SELECT id FROM items",
+        "UPDATE items SET name = :name",
+    ]
+    assert session.commits == 0
+    assert checkouts == []
+
+
+@pytest.mark.asyncio
+async def test_mutation_without_session_commits(checkouts):
+    count = await SupabaseAdapter().execute_mutation("DELETE FROM items")
+
+    assert count == 1
+    assert len(checkouts) == 1
+    assert checkouts[0].commits == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_return_mapping_rows(monkeypatch):
+    session = _Session()
+    row = {"column_name": "id"}
+
+    async def execute(statement: Any, params: Any = None) -> _Result:
+        return _Result([row])
+
+    @asynccontextmanager
+    async def get_read_session():
+        yield session
+
+    monkeypatch.setattr(session, "execute", execute)
+    monkeypatch.setattr(supabase_adapter, "get_read_session", get_read_session)
+    adapter = SupabaseAdapter()
+
+    schema = await adapter.get_table_schema("items")
+    rows = await adapter.execute_query("SELECT 1", session=session)
+
+    assert schema[0] is row
+    assert rows[0] is row
+
+
+@pytest.mark.asyncio
+async def test_health_check_runs_precompiled_statement(checkouts):
+    health = await SupabaseAdapter().health_check()
+    await SupabaseAdapter().health_check()
+
+    assert health["status"] == "healthy"
+    statements = [session.statements[0][0] for session in checkouts]
+    assert statements == [supabase_adapter._SELECT_1, supabase_adapter._SELECT_1]
+
+
+@pytest.mark.asyncio
+async def test_table_exists_runs_precompiled_statement(monkeypatch):
+    session = _Session()
+
+    @asynccontextmanager
+    async def get_read_session():
+        yield session
+
+    monkeypatch.setattr(supabase_adapter, "get_read_session", get_read_session)
+
+    assert await SupabaseAdapter().table_exists("items") is True
+    assert session.statements == [(supabase_adapter._TABLE_EXISTS, {"table_name": "items"})]
@@ -0,0 +1,3 @@
+"""
+Notification adapter tests
+"""
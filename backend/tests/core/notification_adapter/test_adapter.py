@@ -0,0 +1,254 @@
+"""
+NotificationAdapter Base Class Tests
+
+Drives the shared helpers through a recording adapter:
+- Bulk sends run concurrently, at most BULK_SEND_CONCURRENCY at a time, with
+  results in input order; a failed or cancelled send becomes a failed result,
+  and cancelling the batch cancels the sends still in flight
+- validate_email()/validate_phone() accept the documented shapes
+- Messages and results are slotted; EmailRecipient is a frozen value object
+- Failed results in one batch share a single timezone-aware UTC timestamp
+- send_template_sms_bulk() defaults to one send_template_sms per phone
+- EmailRecipient.get() hands out one shared instance per (email, name)
+  while it is referenced
+- normalize_phone() strips non-digits and a leading 86 from 13-digit numbers
+
+Run with: pytest tests/core/notification_adapter/test_adapter.py -v
+"""
+
+import asyncio
+import dataclasses
+import gc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import pytest
+
+from core.notification_adapter import adapter as notification_adapter
+from core.notification_adapter.adapter import (
+    EmailMessage,
+    EmailRecipient,
+    EmailResult,
+    EmailStatus,
+    NotificationAdapter,
+    NotificationProvider,
+    SMSMessage,
+    SMSResult,
+    SMSStatus,
+)
+
+
+class _RecordingAdapter(NotificationAdapter):
+    """Sends nothing; records calls and fails on request."""
+
+    def __init__(self):
+        super().__init__(NotificationProvider.LOCAL_SMTP)
+        self.in_flight = 0
+        self.peak = 0
+        self.sent: List[str] = []
+        self.failures: Dict[str, BaseException] = {}
+
+    async def _deliver(self, target: str) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if target in self.failures:
+                raise self.failures[target]
+            self.sent.append(target)
+        finally:
+            self.in_flight -= 1
+
+    async def send_email(self, message: EmailMessage) -> EmailResult:
+        await self._deliver(message.to[0].email)
+        return EmailResult(message.to[0].email, EmailStatus.SENT, datetime.now(timezone.utc))
+
+    async def send_template_email(self, to_email, to_name, template_id, template_vars) -> EmailResult:
+        raise NotImplementedError
+
+    async def get_email_status(self, message_id: str) -> EmailStatus:
+        return EmailStatus.SENT
+
+    async def send_sms(self, message: SMSMessage) -> SMSResult:
+        await self._deliver(message.phone)
+        return SMSResult(message.phone, SMSStatus.SENT, datetime.now(timezone.utc))
+
+    async def send_template_sms(
+        self,
+        phone: str,
+        template_code: str,
+        template_params: Dict[str, str],
+        sign_name: Optional[str] = None
+    ) -> SMSResult:
+        await self._deliver(phone)
+        return SMSResult(f"{template_code}:{phone}", SMSStatus.SENT, datetime.now(timezone.utc))
+
+    async def get_sms_status(self, message_id: str) -> SMSStatus:
+        return SMSStatus.SENT
+
+
+@pytest.fixture
+def adapter() -> _RecordingAdapter:
+    return _RecordingAdapter()
+
+
+def _email(to: str) -> EmailMessage:
+    return EmailMessage(to=[EmailRecipient(to)], subject="Hello", text_content="hi")
+
+
+class TestBulkSend:
+    @pytest.mark.asyncio
+    async def test_sends_concurrently_up_to_the_limit(self, adapter, monkeypatch):
+        monkeypatch.setattr(notification_adapter, "BULK_SEND_CONCURRENCY", 3)
+        messages = [_email(f"user{i}@example.com") for i in range(10)]
+
+        results = await adapter.send_bulk_emails(messages)
+
+        assert adapter.peak == 3
+        assert [r.message_id for r in results] == [m.to[0].email for m in messages]
+
+    @pytest.mark.asyncio
+    async def test_failures_become_failed_results(self, adapter):
+        adapter.failures["13800000002"] = ConnectionError("gateway down")
+        adapter.failures["13800000003"] = asyncio.CancelledError()
+        messages = [SMSMessage(phone=f"1380000000{i}", content="hi") for i in range(1, 5)]
+
+        results = await adapter.send_bulk_sms(messages)
+
+        assert [r.status for r in results] == [
+            SMSStatus.SENT, SMSStatus.FAILED, SMSStatus.FAILED, SMSStatus.SENT
+        ]
+        assert results[1].error == "gateway down"
+        assert results[2].error == "CancelledError"
+        assert adapter.sent == ["13800000001", "13800000004"]
+
+    @pytest.mark.asyncio
+    async def test_failed_results_share_one_utc_timestamp(self, adapter):
+        messages = [_email(f"user{i}@example.com") for i in range(3)]
+        for message in messages:
+            adapter.failures[message.to[0].email] = ConnectionError("smtp down")
+
+        before = datetime.now(timezone.utc)
+        results = await adapter.send_bulk_emails(messages)
+
+        assert {r.sent_at for r in results} == {results[0].sent_at}
+        assert results[0].sent_at.tzinfo is timezone.utc
+        assert results[0].sent_at >= before
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_batch_stops_pending_sends(self, adapter, monkeypatch):
+        monkeypatch.setattr(notification_adapter, "BULK_SEND_CONCURRENCY", 2)
+        batch = asyncio.create_task(
+            adapter.send_bulk_emails([_email(f"user{i}@example.com") for i in range(6)])
+        )
+        while adapter.in_flight < 2:
+            await asyncio.sleep(0)
+
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+        await asyncio.sleep(0.05)
+
+        assert adapter.sent == []
+        assert adapter.in_flight == 0
+
+
+    @pytest.mark.asyncio
+    async def test_template_sms_bulk_sends_per_phone(self, adapter):
+        adapter.failures["13800000002"] = ConnectionError("quota exceeded")
+        phones = ["13800000001", "13800000002", "13800000003"]
+
+        results = await adapter.send_template_sms_bulk(phones, "SMS_001", {"code": "1234"})
+
+        assert [r.message_id for r in results] == ["SMS_001:13800000001", "", "SMS_001:13800000003"]
+        assert results[1].status == SMSStatus.FAILED
+        assert results[1].error == "quota exceeded"
+
+
+@pytest.mark.parametrize("email, valid", [
+    ("user@example.com", True),
+    ("first.last+tag@mail.example.cn", True),
+    ("user@example", False),
+    ("user example@example.com", False),
+    ("@example.com", False),
+])
+def test_validate_email(adapter, email, valid):
+    assert adapter.validate_email(email) is valid
+
+
+@pytest.mark.parametrize("phone, valid", [
+    ("13800138000", True),
+    ("8613800138000", True),
+    ("+8613800138000", True),
+    ("12800138000", False),
+    ("1380013800", False),
+    ("+8513800138000", False),
+    ("138-0013-8000", False),
+])
+def test_validate_phone(adapter, phone, valid):
+    assert adapter.validate_phone(phone) is valid
+
+
+@pytest.mark.parametrize("record", [
+    EmailRecipient("a@example.com"),
+    EmailMessage(to=[], subject="Hello"),
+    EmailResult("id", EmailStatus.SENT, datetime.now(timezone.utc)),
+    SMSMessage(phone="13800138000", content="hi"),
+    SMSResult("id", SMSStatus.SENT, datetime.now(timezone.utc)),
+], ids=lambda record: type(record).__name__)
+def test_records_are_slotted(record):
+    assert not hasattr(record, "__dict__")
+    with pytest.raises((AttributeError, TypeError)):
+        record.unexpected = 1
+
+
+def test_recipient_is_frozen_and_hashable():
+    recipient = EmailRecipient("a@example.com", "A")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        recipient.email = "b@example.com"
+    assert {recipient, EmailRecipient("a@example.com", "A")} == {recipient}
+
+
+def test_recipient_get_shares_instances():
+    first = EmailRecipient.get("shared@example.com", "Shared")
+
+    assert EmailRecipient.get("shared@example.com", "Shared") is first
+    assert EmailRecipient.get("shared@example.com") is not first
+    assert EmailRecipient.get("shared@example.com", "Shared") == EmailRecipient(
+        "shared@example.com", "Shared"
+    )
+
+
+def test_recipient_cache_drops_unused_instances():
+    EmailRecipient.get("transient@example.com")
+    gc.collect()
+
+    assert ("transient@example.com", None) not in notification_adapter._RECIPIENT_CACHE
+
+
+@pytest.mark.asyncio
+async def test_simple_email_uses_shared_recipient(adapter, monkeypatch):
+    sent = []
+
+    async def send_email(message: EmailMessage) -> EmailResult:
+        sent.append(message)
+        return EmailResult("id", EmailStatus.SENT, datetime.now(timezone.utc))
+
+    monkeypatch.setattr(adapter, "send_email", send_email)
+    recipient = EmailRecipient.get("a@example.com", "A")
+
+    await adapter.send_simple_email("a@example.com", "A", "Hi", text_content="hi")
+
+    assert sent[0].to[0] is recipient
+
+
+@pytest.mark.parametrize("raw, normalized", [
+    ("13800138000", "13800138000"),
+    ("8613800138000", "13800138000"),
+    ("+86 138-0013-8000", "13800138000"),
+    ("(+86) 138 0013 8000", "13800138000"),
+    ("861380013800", "861380013800"),
+])
+def test_normalize_phone(adapter, raw, normalized):
+    assert adapter.normalize_phone(raw) == normalized
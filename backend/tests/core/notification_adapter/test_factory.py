@@ -0,0 +1,75 @@
+"""
+Notification Adapter Factory Tests
+
+- NOTIFICATION_PROVIDER and CLOUD_PROVIDER values resolve through the alias
+  tables, case-insensitively, before falling back to API keys and local SMTP
+- The provider is detected once per process; reset_adapter() detects again
+- get_notification_adapter() returns one shared instance
+
+Run with: pytest tests/core/notification_adapter/test_factory.py -v
+"""
+
+import pytest
+
+from core.notification_adapter import factory
+from core.notification_adapter.adapter import NotificationProvider
+
+_PROVIDER_ENV = [
+    "NOTIFICATION_PROVIDER", "CLOUD_PROVIDER", "ALIYUN_ACCESS_KEY_ID",
+    "ALIYUN_ACCESS_KEY_SECRET", "TENCENT_SECRET_ID", "TENCENT_SECRET_KEY",
+    "MAILTRAP_API_TOKEN",
+]
+
+
+@pytest.fixture
+def provider_env(monkeypatch):
+    """No provider settings, and no cached adapter or detection."""
+    for name in _PROVIDER_ENV:
+        monkeypatch.delenv(name, raising=False)
+    factory.reset_adapter()
+    yield monkeypatch
+    factory.reset_adapter()
+
+
+@pytest.mark.parametrize("env, provider", [
+    ({}, NotificationProvider.LOCAL_SMTP),
+    ({"NOTIFICATION_PROVIDER": "QCloud"}, NotificationProvider.TENCENT),
+    ({"NOTIFICATION_PROVIDER": "smtp", "CLOUD_PROVIDER": "aliyun"}, NotificationProvider.LOCAL_SMTP),
+    ({"NOTIFICATION_PROVIDER": "mailtrap"}, NotificationProvider.MAILTRAP),
+    ({"NOTIFICATION_PROVIDER": "unknown", "CLOUD_PROVIDER": "ali"}, NotificationProvider.ALIYUN),
+    ({"CLOUD_PROVIDER": "mailtrap"}, NotificationProvider.LOCAL_SMTP),
+    ({"ALIYUN_ACCESS_KEY_ID": "id", "ALIYUN_ACCESS_KEY_SECRET": "secret"}, NotificationProvider.ALIYUN),
+    ({"TENCENT_SECRET_ID": "id", "TENCENT_SECRET_KEY": "key"}, NotificationProvider.TENCENT),
+    ({"ALIYUN_ACCESS_KEY_ID": "id", "MAILTRAP_API_TOKEN": "token"}, NotificationProvider.MAILTRAP),
+])
+def test_provider_detection(provider_env, env, provider):
+    for name, value in env.items():
+        provider_env.setenv(name, value)
+
+    assert factory._detect_provider() is provider
+
+
+def test_provider_is_detected_once(provider_env):
+    provider_env.setenv("NOTIFICATION_PROVIDER", "tencent")
+    assert factory._detect_provider() is NotificationProvider.TENCENT
+
+    provider_env.setenv("NOTIFICATION_PROVIDER", "aliyun")
+    assert factory._detect_provider() is NotificationProvider.TENCENT
+
+    factory.reset_adapter()
+    assert factory._detect_provider() is NotificationProvider.ALIYUN
+
+
+def test_adapter_is_a_singleton(provider_env):
+    created = []
+
+    def create_adapter(provider):
+        created.append(provider)
+        return object()
+
+    provider_env.setattr(factory, "_create_adapter", create_adapter)
+
+    first = factory.get_notification_adapter()
+
+    assert factory.get_notification_adapter() is first
+    assert created == [NotificationProvider.LOCAL_SMTP]
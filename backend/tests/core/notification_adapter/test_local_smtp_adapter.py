@@ -0,0 +1,361 @@
+"""
+LocalSMTPAdapter Tests
+
+Drives send_email end to end against an in-process SMTP stub server:
+- Messages reach the server with the right envelope
+- Connections are pooled and reused across sends
+- Sequential sends share one connection until SMTP_MAX_PER_CONN, then reconnect
+- Blocking smtplib calls run in a worker thread, not on the event loop
+- At most SMTP_POOL_SIZE connections are open; idle ones serve later bursts
+- Address headers and template skeletons are built once and reused
+- Single-body messages are sent as plain MIMEText; text plus html as
+  multipart/alternative
+- The mock SMS store keeps at most SMS_STORAGE_MAX results, dropping the oldest
+- get_last_sms() returns the latest send until clear_sms_storage()
+- A rejected recipient fails only its own message
+- The background send worker survives a failing iteration
+- The adapter keeps working across separate event loops
+
+Run with: pytest tests/core/notification_adapter/test_local_smtp_adapter.py -v
+"""
+
+import asyncio
+import email
+import socketserver
+import threading
+import time
+from typing import List, Tuple
+
+import pytest
+
+from core.notification_adapter.adapter import (
+    EmailMessage,
+    EmailRecipient,
+    EmailStatus,
+    SMSMessage,
+    SMSStatus,
+)
+from core.notification_adapter.adapters import local_smtp_adapter
+from core.notification_adapter.adapters.local_smtp_adapter import LocalSMTPAdapter
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue: enough for smtplib.sendmail / noop / quit."""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        stub = self.server
+        with stub.lock:
+            stub.connections += 1
+
+        mail_from, rcpts, data, in_data = "", [], [], False
+        self._reply("220 stub ESMTP")
+        for raw in self.rfile:
+            line = raw.decode().rstrip("\r\n")
+            if in_data:
+                if line == ".":
+                    with stub.lock:
+                        stub.messages.append((mail_from, rcpts, "\n".join(data)))
+                    mail_from, rcpts, data, in_data = "", [], [], False
+                    self._reply("250 queued")
+                else:
+                    data.append(line[1:] if line.startswith("..") else line)
+                continue
+
+            command = line[:4].upper()
+            if command in ("EHLO", "HELO"):
+                self._reply("250 stub")
+            elif command == "MAIL":
+                mail_from = line.split(":", 1)[1].strip().strip("<>")
+                self._reply("250 ok")
+            elif command == "RCPT":
+                address = line.split(":", 1)[1].strip().strip("<>")
+                if address in stub.rejected:
+                    self._reply("550 no such user")
+                else:
+                    rcpts.append(address)
+                    self._reply("250 ok")
+            elif command == "DATA":
+                in_data = True
+                self._reply("354 end with .")
+            elif command in ("RSET", "NOOP"):
+                self._reply("250 ok")
+            elif command == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("502 not implemented")
+
+
+class _SMTPStub(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages: List[Tuple[str, List[str], str]] = []
+        self.rejected: set = set()
+
+
+@pytest.fixture
+def smtp_stub(monkeypatch):
+    stub = _SMTPStub()
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("SMTP_HOST", "127.0.0.1")
+    monkeypatch.setenv("SMTP_PORT", str(stub.server_address[1]))
+    monkeypatch.setenv("SMTP_FROM_EMAIL", "noreply@example.com")
+    yield stub
+
+    stub.shutdown()
+    stub.server_close()
+
+
+def _message(to: str, **kwargs) -> EmailMessage:
+    return EmailMessage(to=[EmailRecipient(to)], subject="Hello", text_content="hi", **kwargs)
+
+
+class TestLocalSMTPAdapter:
+    @pytest.mark.asyncio
+    async def test_send_email_reaches_server(self, smtp_stub):
+        async with LocalSMTPAdapter() as adapter:
+            result = await adapter.send_email(_message("a@example.com", bcc=[EmailRecipient("b@example.com")]))
+
+        assert result.status == EmailStatus.SENT
+        assert len(smtp_stub.messages) == 1
+        mail_from, rcpts, body = smtp_stub.messages[0]
+        assert mail_from == "noreply@example.com"
+        assert rcpts == ["a@example.com", "b@example.com"]
+        assert "Subject: Hello" in body
+        assert "b@example.com" not in body
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_share_pooled_connections(self, smtp_stub):
+        async with LocalSMTPAdapter() as adapter:
+            results = await asyncio.gather(*[
+                adapter.send_email(_message(f"user{i}@example.com")) for i in range(40)
+            ])
+            results += [await adapter.send_email(_message("late@example.com"))]
+
+        assert all(r.status == EmailStatus.SENT for r in results)
+        assert len(smtp_stub.messages) == 41
+        assert smtp_stub.connections <= local_smtp_adapter.SMTP_POOL_SIZE
+
+    @pytest.mark.asyncio
+    async def test_pool_size_caps_open_connections(self, smtp_stub, monkeypatch):
+        monkeypatch.setattr(local_smtp_adapter, "SMTP_POOL_SIZE", 2)
+
+        async with LocalSMTPAdapter() as adapter:
+            first = await asyncio.gather(*[
+                adapter.send_email(_message(f"first{i}@example.com")) for i in range(10)
+            ])
+            opened = smtp_stub.connections
+            second = await asyncio.gather(*[
+                adapter.send_email(_message(f"second{i}@example.com")) for i in range(10)
+            ])
+
+        assert all(r.status == EmailStatus.SENT for r in first + second)
+        assert 1 <= opened <= 2
+        assert smtp_stub.connections == opened
+
+    @pytest.mark.asyncio
+    async def test_sequential_sends_reuse_one_connection(self, smtp_stub):
+        async with LocalSMTPAdapter() as adapter:
+            for i in range(5):
+                await adapter.send_email(_message(f"user{i}@example.com"))
+
+        assert len(smtp_stub.messages) == 5
+        assert smtp_stub.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_is_replaced_after_max_sends(self, smtp_stub, monkeypatch):
+        monkeypatch.setattr(local_smtp_adapter, "SMTP_MAX_PER_CONN", 2)
+
+        async with LocalSMTPAdapter() as adapter:
+            results = [await adapter.send_email(_message(f"user{i}@example.com")) for i in range(5)]
+
+        assert all(r.status == EmailStatus.SENT for r in results)
+        assert smtp_stub.connections == 3
+
+    @pytest.mark.asyncio
+    async def test_smtp_io_does_not_block_the_event_loop(self, smtp_stub, monkeypatch):
+        adapter = LocalSMTPAdapter()
+        connect = adapter._connect
+        event_loop_thread = threading.get_ident()
+        connect_threads = []
+
+        def slow_connect():
+            connect_threads.append(threading.get_ident())
+            time.sleep(0.3)
+            return connect()
+
+        monkeypatch.setattr(adapter, "_connect", slow_connect)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        try:
+            result = await adapter.send_email(_message("a@example.com"))
+        finally:
+            ticking.cancel()
+            await adapter.close()
+
+        assert result.status == EmailStatus.SENT
+        assert connect_threads and connect_threads[0] != event_loop_thread
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_rejected_recipient_fails_only_its_message(self, smtp_stub):
+        smtp_stub.rejected.add("bad@example.com")
+
+        async with LocalSMTPAdapter() as adapter:
+            bad, good = await asyncio.gather(
+                adapter.send_email(_message("bad@example.com")),
+                adapter.send_email(_message("good@example.com")),
+            )
+
+        assert bad.status == EmailStatus.FAILED
+        assert "bad@example.com" in bad.error
+        assert good.status == EmailStatus.SENT
+        assert [rcpts for _, rcpts, _ in smtp_stub.messages] == [["good@example.com"]]
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_failing_iteration(self, smtp_stub, monkeypatch):
+        adapter = LocalSMTPAdapter()
+        acquire = adapter._acquire
+        calls = 0
+
+        async def flaky_acquire():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("pool exploded")
+            return await acquire()
+
+        monkeypatch.setattr(adapter, "_acquire", flaky_acquire)
+        try:
+            first = await adapter.send_email(_message("a@example.com"))
+            second = await adapter.send_email(_message("b@example.com"))
+        finally:
+            await adapter.close()
+
+        assert first.status == EmailStatus.FAILED
+        assert "pool exploded" in first.error
+        assert second.status == EmailStatus.SENT
+        assert len(smtp_stub.messages) == 1
+
+    def test_adapter_reused_across_event_loops(self, smtp_stub):
+        adapter = LocalSMTPAdapter()
+
+        async def send_bulk():
+            return await asyncio.wait_for(
+                adapter.send_bulk_emails([_message(f"user{i}@example.com") for i in range(3)]),
+                timeout=10,
+            )
+
+        first = asyncio.run(send_bulk())
+        second = asyncio.run(send_bulk())
+        asyncio.run(adapter.close())
+
+        assert all(r.status == EmailStatus.SENT for r in first + second)
+        assert len(smtp_stub.messages) == 6
+
+
+class TestCachedHeaders:
+    def test_format_addr(self):
+        assert local_smtp_adapter._format_addr("Ann", "ann@example.com") == "Ann <ann@example.com>"
+        assert local_smtp_adapter._format_addr(None, "ann@example.com") == "ann@example.com"
+        assert local_smtp_adapter._format_addr("Ann", "ann@example.com") is (
+            local_smtp_adapter._format_addr("Ann", "ann@example.com")
+        )
+
+    def test_template_skeleton_is_cached_and_escaped(self):
+        skeleton = local_smtp_adapter._template_skeleton("price_$amount")
+        subject, html, text = skeleton
+
+        assert local_smtp_adapter._template_skeleton("price_$amount") is skeleton
+        assert subject == "Template: price_$amount"
+        assert html.substitute(vars={"a": 1}) == "<h1>Template: price_$amount</h1><pre>{'a': 1}</pre>"
+        assert text.substitute(vars={"a": 1}) == "Template: price_$amount\n{'a': 1}"
+
+    @pytest.mark.asyncio
+    async def test_template_email_uses_default_sender(self, smtp_stub, monkeypatch):
+        monkeypatch.setenv("SMTP_FROM_NAME", "Kortix Test")
+
+        async with LocalSMTPAdapter() as adapter:
+            result = await adapter.send_template_email("a@example.com", "Ann", "welcome", {"name": "Ann"})
+
+        assert result.status == EmailStatus.SENT
+        _, _, body = smtp_stub.messages[0]
+        assert "From: Kortix Test <noreply@example.com>" in body
+        assert "To: Ann <a@example.com>" in body
+        assert "Subject: Template: welcome" in body
+
+
+class TestMessageBody:
+    @pytest.mark.parametrize("content, content_type", [
+        ({"text_content": "hi"}, "text/plain"),
+        ({"text_content": None, "html_content": "<p>hi</p>"}, "text/html"),
+        ({"text_content": None}, "text/plain"),
+    ])
+    @pytest.mark.asyncio
+    async def test_single_body_is_not_multipart(self, smtp_stub, content, content_type):
+        message = EmailMessage(to=[EmailRecipient("a@example.com")], subject="Hello", **content)
+
+        async with LocalSMTPAdapter() as adapter:
+            await adapter.send_email(message)
+
+        sent = email.message_from_string(smtp_stub.messages[0][2])
+        assert not sent.is_multipart()
+        assert sent.get_content_type() == content_type
+
+    @pytest.mark.asyncio
+    async def test_text_and_html_are_alternatives(self, smtp_stub):
+        async with LocalSMTPAdapter() as adapter:
+            await adapter.send_email(_message("a@example.com", html_content="<p>hi</p>"))
+
+        sent = email.message_from_string(smtp_stub.messages[0][2])
+        assert sent.get_content_type() == "multipart/alternative"
+        assert [part.get_content_type() for part in sent.get_payload()] == ["text/plain", "text/html"]
+
+
+class TestMockSMSStorage:
+    @pytest.mark.asyncio
+    async def test_storage_drops_oldest_results(self, monkeypatch):
+        monkeypatch.setattr(local_smtp_adapter, "SMS_STORAGE_MAX", 3)
+        adapter = LocalSMTPAdapter()
+
+        results = [
+            await adapter.send_sms(SMSMessage(phone=f"1380000000{i}", content="hi")) for i in range(5)
+        ]
+
+        assert adapter.get_sent_sms_count() == 3
+        assert [await adapter.get_sms_status(r.message_id) for r in results] == [
+            SMSStatus.FAILED, SMSStatus.FAILED, SMSStatus.SENT, SMSStatus.SENT, SMSStatus.SENT
+        ]
+
+    @pytest.mark.asyncio
+    async def test_last_sms_tracks_latest_send(self, monkeypatch):
+        monkeypatch.setattr(local_smtp_adapter, "SMS_STORAGE_MAX", 1)
+        adapter = LocalSMTPAdapter()
+        assert adapter.get_last_sms() is None
+
+        await adapter.send_sms(SMSMessage(phone="13800000001", content="hi"))
+        last = await adapter.send_template_sms("13800000002", "SMS_001", {"code": "1234"})
+
+        assert adapter.get_last_sms() is last
+
+        adapter.clear_sms_storage()
+
+        assert adapter.get_last_sms() is None
+        assert adapter.get_sent_sms_count() == 0
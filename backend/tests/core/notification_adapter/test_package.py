@@ -0,0 +1,45 @@
+"""
+core.notification_adapter Package Tests
+
+- Importing the package loads neither the interface nor the factory module
+- Exported names resolve on first access and are then cached on the package
+
+Run with: pytest tests/core/notification_adapter/test_package.py -v
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import core.notification_adapter as package
+from core.notification_adapter import adapter, factory
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+def test_import_loads_no_submodules():
+    code = (
+        "import sys\n"
+        "import core.notification_adapter\n"
+        "print(sorted(name for name in sys.modules if name.startswith('core.notification_adapter.')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_exports_resolve_lazily():
+    assert package.NotificationAdapter is adapter.NotificationAdapter
+    assert package.get_notification_adapter is factory.get_notification_adapter
+    assert "NotificationAdapter" in vars(package)
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        package.no_such_name
@@ -0,0 +1,3 @@
+"""
+Payment adapter tests
+"""
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+PaymentAdapter Helper Tests
+
+- format_amount() renders integer cents with the currency symbol, exactly
+  and without float rounding, and falls back to "<value> <code>"
+- Refund records take the status before the optional fields
+
+Run with: pytest tests/core/payment_adapter/test_adapter.py -v
+"""
+
+import pytest
+
+from core.payment_adapter import adapter as payment_adapter
+from core.payment_adapter.adapter import Currency, PaymentStatus, Refund
+from core.payment_adapter.adapters.local_mock_adapter import LocalMockPaymentAdapter
+
+
+@pytest.fixture
+def adapter() -> LocalMockPaymentAdapter:
+    return LocalMockPaymentAdapter()
+
+
+@pytest.mark.parametrize("amount, currency, formatted", [
+    (9900, Currency.CNY, "¥99.00"),
+    (999, Currency.USD, "$9.99"),
+    (5, Currency.EUR, "€0.05"),
+    (0, Currency.CNY, "¥0.00"),
+    (-1250, Currency.USD, "$-12.50"),
+    (-7, Currency.CNY, "¥-0.07"),
+    (2**60 + 1, Currency.CNY, "¥11529215046068469.77"),
+])
+def test_format_amount(adapter, amount, currency, formatted):
+    assert adapter.format_amount(amount, currency) == formatted
+
+
+def test_format_amount_without_symbol(adapter, monkeypatch):
+    monkeypatch.delitem(payment_adapter._CURRENCY_SYMBOLS, Currency.EUR)
+
+    assert adapter.format_amount(1999, Currency.EUR) == "19.99 EUR"
+
+
+def test_refund_defaults():
+    refund = Refund("re_1", "pi_1", 100, PaymentStatus.SUCCEEDED)
+
+    assert refund.status is PaymentStatus.SUCCEEDED
+    assert refund.reason is None
+    assert refund.created_at is None